@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Benchmark concurrent push_message over RequestsHttpClient and HttpxHttpClient.
+
+Both clients talk to local TLS stub servers that answer every push
+after a fixed delay: an HTTP/1.1 server for requests, and an HTTP/2
+server for httpx. Requires Python 3.7+, httpx, h2 and the openssl command.
+
+    $ python benchmarks/http_client.py --requests 1000 --concurrency 50 --delay 0.02
+"""
+
+from __future__ import print_function
+
+import argparse
+import heapq
+import os
+import select
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+
+from linebot import LineBotApi, RequestsHttpClient
+from linebot.httpx_http_client import HttpxHttpClient
+from linebot.models import TextSendMessage
+
+
+def make_certificate(directory):
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.check_call([
+        'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+        '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1',
+        '-keyout', key, '-out', cert
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return cert, key
+
+
+def server_context(cert, key, alpn):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    context.set_alpn_protocols(alpn)
+    return context
+
+
+class Http1Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, context, delay):
+        self.delay = delay
+        self.connections = 0
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', 0), Http1Handler)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        ThreadingHTTPServer.process_request(self, request, client_address)
+
+
+class Http1Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(self.server.delay)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+class Http2Server(object):
+    def __init__(self, context, delay):
+        self.context = context
+        self.delay = delay
+        self.connections = 0
+        self.socket = socket.socket()
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(128)
+        self.server_address = self.socket.getsockname()
+
+    def serve_forever(self):
+        while True:
+            sock, _ = self.socket.accept()
+            self.connections += 1
+            thread = threading.Thread(target=self.serve_connection, args=(sock,))
+            thread.daemon = True
+            thread.start()
+
+    def serve_connection(self, raw_sock):
+        sock = self.context.wrap_socket(raw_sock, server_side=True)
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        due = []
+
+        while True:
+            if sock.pending():
+                timeout = 0
+            elif due:
+                timeout = max(due[0][0] - time.time(), 0)
+            else:
+                timeout = None
+
+            readable, _, _ = select.select([sock], [], [], timeout)
+            if readable or sock.pending():
+                data = sock.recv(65535)
+                if not data:
+                    return
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.DataReceived):
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        heapq.heappush(due, (time.time() + self.delay, event.stream_id))
+
+            while due and due[0][0] <= time.time():
+                _, stream_id = heapq.heappop(due)
+                conn.send_headers(stream_id, [
+                    (':status', '200'), ('content-type', 'application/json'),
+                    ('content-length', '2')])
+                conn.send_data(stream_id, b'{}', end_stream=True)
+
+            data = conn.data_to_send()
+            if data:
+                sock.sendall(data)
+
+
+def start(server):
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return 'https://localhost:{0}'.format(server.server_address[1])
+
+
+def run(line_bot_api, requests, concurrency):
+    message = TextSendMessage(text='Hello, world')
+    with ThreadPoolExecutor(concurrency) as executor:
+        started = time.time()
+        list(executor.map(
+            lambda i: line_bot_api.push_message('U{0}'.format(i), message), range(requests)))
+        return time.time() - started
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--requests', type=int, default=1000)
+    arg_parser.add_argument('--concurrency', type=int, default=50)
+    arg_parser.add_argument('--delay', type=float, default=0.02,
+                            help='server-side latency per request, in seconds')
+    arg_parser.add_argument('--max-connections', type=int,
+                            default=HttpxHttpClient.DEFAULT_MAX_CONNECTIONS)
+    args = arg_parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        cert, key = make_certificate(tmp_dir)
+
+        http1_server = Http1Server(server_context(cert, key, ['http/1.1']), args.delay)
+        requests_client = RequestsHttpClient(pool_maxsize=args.concurrency)
+        requests_client.session.trust_env = False
+        requests_client.session.verify = cert
+        requests_api = LineBotApi('token', endpoint=start(http1_server),
+                                  http_client=requests_client)
+
+        http2_server = Http2Server(server_context(cert, key, ['h2']), args.delay)
+        httpx_client = HttpxHttpClient(client=httpx.Client(
+            http2=True, verify=ssl.create_default_context(cafile=cert),
+            limits=httpx.Limits(max_connections=args.max_connections)))
+        httpx_api = LineBotApi('token', endpoint=start(http2_server),
+                               http_client=httpx_client)
+
+        print('{0} push_message calls, concurrency {1}, server delay {2}s'.format(
+            args.requests, args.concurrency, args.delay))
+        for name, line_bot_api, server in (
+                ('requests (HTTP/1.1)', requests_api, http1_server),
+                ('httpx (HTTP/2)', httpx_api, http2_server)):
+            run(line_bot_api, args.concurrency, args.concurrency)
+            elapsed = run(line_bot_api, args.requests, args.concurrency)
+            print('{0:<20} {1:8.1f} req/s  {2:6.2f} ms/req  {3:4d} connections'.format(
+                name, args.requests / elapsed, elapsed * 1000 / args.requests,
+                server.connections))
+            line_bot_api.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Benchmark the JSON backends of linebot.json_codec.
+
+Measures, for each installed backend, the decoding of a webhook body
+(the events of tests/text/webhook.json repeated up to --events events)
+and the encoding of a push message request with a text, a buttons template
+and a carousel template message.
+
+    $ python benchmarks/json_codec.py --events 100 --repeat 2000
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import time
+
+from linebot import json_codec
+from linebot.models import (
+    ButtonsTemplate, CarouselColumn, CarouselTemplate, MessageTemplateAction,
+    PostbackTemplateAction, TemplateSendMessage, TextSendMessage, URITemplateAction
+)
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'tests', 'text', 'webhook.json')
+
+
+def make_body(events):
+    with open(SAMPLE_PATH) as fp:
+        sample = json.load(fp)['events']
+    return json.dumps({'events': [sample[i % len(sample)] for i in range(events)]}).encode('utf-8')
+
+
+def make_messages():
+    actions = [
+        PostbackTemplateAction(label='postback', text='postback text', data='action=buy&itemid=1'),
+        MessageTemplateAction(label='message', text='message text'),
+        URITemplateAction(label='uri', uri='http://example.com/'),
+    ]
+    return [
+        TextSendMessage(text='Hello, world'),
+        TemplateSendMessage(alt_text='Buttons template', template=ButtonsTemplate(
+            thumbnail_image_url='https://example.com/image.jpg',
+            title='Menu', text='Please select', actions=actions)),
+        TemplateSendMessage(alt_text='Carousel template', template=CarouselTemplate(columns=[
+            CarouselColumn(thumbnail_image_url='https://example.com/item.jpg',
+                           title='this is menu', text='description', actions=actions)
+            for _ in range(5)])),
+    ]
+
+
+def measure(func, repeat):
+    for _ in range(repeat // 10):
+        func()
+    started = time.time()
+    for _ in range(repeat):
+        func()
+    return (time.time() - started) * 1e6 / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=100,
+                            help='events per webhook body')
+    arg_parser.add_argument('--repeat', type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    body = make_body(args.events)
+    data = {'to': 'U206d25c2ea6bd87c17655609a1c37cb8',
+            'messages': [message.as_json_dict() for message in make_messages()]}
+
+    default_backend = json_codec.BACKEND
+    for name in ('json', 'ujson', 'orjson'):
+        try:
+            json_codec.set_backend(name)
+        except ValueError:
+            print('{0:>6}: not installed'.format(name))
+            continue
+        print('{0:>6}: loads {1:,.1f} us/body ({2} events)  dumps {3:,.2f} us/push'.format(
+            name,
+            measure(lambda: json_codec.loads(body), args.repeat), args.events,
+            measure(lambda: json_codec.dumps(data), args.repeat * 10)))
+    json_codec.set_backend(default_backend)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Benchmark serialization of outgoing template messages.
+
+Measures Base.as_json_dict, and the JSON encoding of the request body,
+of a TemplateSendMessage with a CarouselTemplate of --columns columns
+(3 actions each), and of one with a ButtonsTemplate of 4 actions.
+
+It also compares, for a ConfirmTemplate carrying a user ID in its postback
+data, building and serializing the message for each reply with binding
+the user ID into a message frozen once, and serializing the messages
+with and without validation of the Messaging API limits
+(the carousel needs at most 5 columns to pass it).
+
+    $ python benchmarks/serialize.py --columns 5 --repeat 20000
+"""
+
+from __future__ import print_function
+
+import argparse
+import time
+
+from linebot import json_codec
+from linebot.api import _dump_messages
+from linebot.models import (
+    ButtonsTemplate, CarouselColumn, CarouselTemplate, ConfirmTemplate, MessageTemplateAction,
+    PostbackTemplateAction, TemplateSendMessage, URITemplateAction
+)
+
+USER_ID = 'U206d25c2ea6bd87c17655609a1c37cb8'
+
+
+def make_actions(i):
+    return [
+        PostbackTemplateAction(label='Buy', text='buy', data='action=buy&itemid={0}'.format(i)),
+        MessageTemplateAction(label='Add to cart', text='add {0}'.format(i)),
+        URITemplateAction(label='View detail', uri='https://example.com/item/{0}'.format(i)),
+    ]
+
+
+def make_carousel(columns):
+    return TemplateSendMessage(alt_text='Carousel template', template=CarouselTemplate(columns=[
+        CarouselColumn(thumbnail_image_url='https://example.com/item/{0}.jpg'.format(i),
+                       title='Item {0}'.format(i), text='Description of item {0}'.format(i),
+                       actions=make_actions(i))
+        for i in range(columns)
+    ]))
+
+
+def make_buttons():
+    return TemplateSendMessage(alt_text='Buttons template', template=ButtonsTemplate(
+        thumbnail_image_url='https://example.com/menu.jpg', title='Menu', text='Please select',
+        actions=make_actions(0) + [MessageTemplateAction(label='Cancel', text='cancel')]))
+
+
+def make_confirm(user_id):
+    actions = [
+        PostbackTemplateAction(label='Yes', text='Yes!', data='action=tryme&user_id=' + user_id),
+        MessageTemplateAction(label='About me', text='I am a bot'),
+    ]
+    return TemplateSendMessage(
+        alt_text='Please check message on your smartphone',
+        template=ConfirmTemplate(text='Do you want to try?', actions=actions))
+
+
+def measure(func, repeat):
+    for _ in range(repeat // 10):
+        func()
+    started = time.time()
+    for _ in range(repeat):
+        func()
+    return (time.time() - started) * 1e6 / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--columns', type=int, default=5,
+                            help='columns of the carousel')
+    arg_parser.add_argument('--repeat', type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    for name, message in (('carousel', make_carousel(args.columns)),
+                          ('buttons', make_buttons())):
+        as_json_dict = measure(message.as_json_dict, args.repeat)
+        body = measure(lambda: json_codec.dumps(
+            {'to': USER_ID, 'messages': [message.as_json_dict()]}),
+            args.repeat)
+        print('{0:>8}: as_json_dict {1:.2f} us  push body {2:.2f} us ({3})'.format(
+            name, as_json_dict, body, json_codec.BACKEND))
+        plain = measure(lambda: _dump_messages([message]), args.repeat)
+        validated = measure(lambda: _dump_messages([message], 'strict'), args.repeat)
+        print('{0:>8}: messages {1:.2f} us  validated {2:.2f} us'.format(
+            name, plain, validated))
+
+    frozen = make_confirm('{user_id}').freeze('user_id')
+    rebuild = measure(lambda: _dump_messages([make_confirm(USER_ID)]), args.repeat)
+    bind = measure(lambda: _dump_messages([frozen.bind(user_id=USER_ID)]), args.repeat)
+    print(' confirm: rebuild per reply {0:.2f} us  frozen bind {1:.2f} us'.format(rebuild, bind))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Benchmark per-event dispatch cost of WebhookHandler.
+
+The events of tests/text/webhook.json are parsed once, and handle()
+dispatches them over and over with parsing stubbed out, so only
+handler lookup and invocation are measured.
+
+    $ python benchmarks/webhook_dispatch.py --repeat 50000
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import time
+
+from linebot import WebhookHandler
+from linebot.models import (
+    MessageEvent, FollowEvent, JoinEvent, PostbackEvent, BeaconEvent,
+    TextMessage, ImageMessage, VideoMessage, AudioMessage, StickerMessage,
+)
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'tests', 'text', 'webhook.json')
+
+
+def make_handler():
+    handler = WebhookHandler('channel_secret')
+
+    @handler.add(MessageEvent, message=TextMessage)
+    def message_text(event):
+        pass
+
+    @handler.add(MessageEvent, message=(ImageMessage, VideoMessage, AudioMessage))
+    def message_content(event):
+        pass
+
+    @handler.add(MessageEvent, message=StickerMessage)
+    def message_sticker():
+        pass
+
+    @handler.add(MessageEvent)
+    def message(event):
+        pass
+
+    @handler.add(FollowEvent)
+    @handler.add(JoinEvent)
+    @handler.add(PostbackEvent)
+    @handler.add(BeaconEvent)
+    def other(event):
+        pass
+
+    @handler.default()
+    def default(event):
+        pass
+
+    return handler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--repeat', type=int, default=50000,
+                            help='number of handle() calls')
+    args = arg_parser.parse_args()
+
+    handler = make_handler()
+    with open(SAMPLE_PATH) as fp:
+        body = fp.read()
+    handler.parser.signature_validator.validate = lambda body, signature: True
+    events = handler.parser.parse(body, 'signature')
+    handler.parser.parse = lambda body, signature: events
+
+    for _ in range(args.repeat // 10):
+        handler.handle(body, 'signature')
+
+    started = time.time()
+    for _ in range(args.repeat):
+        handler.handle(body, 'signature')
+    elapsed = time.time() - started
+
+    dispatched = len(events) * args.repeat
+    print('{0} events: {1:.3f} us/event'.format(dispatched, elapsed * 1e6 / dispatched))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""Benchmark WebhookParser.parse throughput.
+
+The request body repeats the events of tests/text/webhook.json
+(every event type, every message type) up to --events events.
+
+    $ python benchmarks/webhook_parse.py --events 100 --repeat 2000 [--bytes] [--lazy]
+        [--type message|postback]
+
+With --bytes, the body is passed to parse_bytes as the raw bytes
+a web framework hands over, instead of being decoded for parse.
+With --lazy, the parser is created with lazy=True, and each event's
+type and source.sender_id are read, as a typical handler does.
+With --type, only the sample events of that type are repeated.
+"""
+
+from __future__ import print_function
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+
+from linebot import WebhookParser
+
+CHANNEL_SECRET = 'channel_secret'
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'tests', 'text', 'webhook.json')
+
+
+def make_body(events, event_type=None):
+    with open(SAMPLE_PATH) as fp:
+        sample = [event for event in json.load(fp)['events']
+                  if event_type is None or event['type'] == event_type]
+    return json.dumps({'events': [sample[i % len(sample)] for i in range(events)]})
+
+
+def sign(body):
+    return base64.b64encode(hmac.new(
+        CHANNEL_SECRET.encode('utf-8'), body.encode('utf-8'), hashlib.sha256
+    ).digest()).decode('utf-8')
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--events', type=int, default=100,
+                            help='events per request body')
+    arg_parser.add_argument('--repeat', type=int, default=2000)
+    arg_parser.add_argument('--bytes', action='store_true',
+                            help='use parse_bytes on the raw body')
+    arg_parser.add_argument('--lazy', action='store_true',
+                            help='parse lazily, reading type and source of each event')
+    arg_parser.add_argument('--type', help='repeat only the events of this type')
+    args = arg_parser.parse_args()
+
+    parser = WebhookParser(CHANNEL_SECRET, lazy=args.lazy)
+    body = make_body(args.events, args.type)
+    signature = sign(body)
+    raw_body = body.encode('utf-8')
+
+    if args.bytes:
+        def parse_body():
+            return parser.parse_bytes(raw_body, signature)
+    else:
+        def parse_body():
+            return parser.parse(raw_body.decode('utf-8'), signature)
+
+    def parse():
+        for event in parse_body():
+            event.type, event.source.sender_id
+
+    for _ in range(args.repeat // 10):
+        parse()
+
+    started = time.time()
+    for _ in range(args.repeat):
+        parse()
+    elapsed = time.time() - started
+
+    events = args.events * args.repeat
+    print('{0} events/body, {1} bodies: {2:,.0f} events/s  {3:.2f} us/event'.format(
+        args.events, args.repeat, events / elapsed, elapsed * 1e6 / events))
+
+
+if __name__ == '__main__':
+    main()
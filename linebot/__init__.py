@@ -16,6 +16,8 @@
 
 from __future__ import unicode_literals
 
+import sys
+
 from .__about__ import (  # noqa
     __version__
 )
@@ -32,3 +34,12 @@ from .webhook import (  # noqa
     WebhookParser,
     WebhookHandler,
 )
+
+if sys.version_info >= (3, 5):
+    from .async_api import (  # noqa
+        AsyncLineBotApi,
+    )
+    from .async_http_client import (  # noqa
+        AsyncHttpClient,
+        AsyncHttpResponse,
+    )
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.aiohttp_async_http_client module.
+
+Requires Python 3.5+ and aiohttp.
+"""
+
+import aiohttp
+
+from . import json_codec
+from .async_http_client import AsyncHttpClient, AsyncHttpResponse
+
+
+class AiohttpAsyncHttpClient(AsyncHttpClient):
+    """AsyncHttpClient implemented by aiohttp.
+
+    All requests share one :py:class:`aiohttp.ClientSession`,
+    so connections to the API server are pooled and kept alive between calls.
+    The session is created on first use, inside the running event loop.
+    """
+
+    DEFAULT_LIMIT = 100
+
+    DEFAULT_LIMIT_PER_HOST = 0
+
+    def __init__(self, timeout=AsyncHttpClient.DEFAULT_TIMEOUT,
+                 limit=DEFAULT_LIMIT, limit_per_host=DEFAULT_LIMIT_PER_HOST,
+                 session=None):
+        """__init__ method.
+
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is :py:attr:`DEFAULT_TIMEOUT`
+        :type timeout: float | tuple(float, float)
+        :param int limit: (optional) Maximum number of simultaneous connections.
+            0 means no limit. Default is :py:attr:`DEFAULT_LIMIT`
+        :param int limit_per_host: (optional) Maximum number of simultaneous
+            connections to one host. 0 means no limit.
+            Default is :py:attr:`DEFAULT_LIMIT_PER_HOST`
+        :param session: (optional) Externally managed session.
+            If given, limit and limit_per_host are ignored.
+        :type session: :py:class:`aiohttp.ClientSession`
+        """
+        super(AiohttpAsyncHttpClient, self).__init__(timeout)
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session = session
+
+    @property
+    def session(self):
+        """Get the shared aiohttp session, creating it if needed.
+
+        :rtype: :py:class:`aiohttp.ClientSession`
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        """GET request.
+
+        :param str url: Request url
+        :param dict headers: (optional) Request headers
+        :param dict params: (optional) Request query parameter
+        :param bool stream: (optional) get content as stream
+        :param timeout: (optional), How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is :py:attr:`self.timeout`
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`AiohttpAsyncHttpResponse`
+        :return: AiohttpAsyncHttpResponse instance
+        """
+        response = await self.session.get(
+            url, headers=headers, params=params,
+            timeout=self.__get_client_timeout(timeout)
+        )
+        if not stream:
+            await response.read()
+            response.release()
+
+        return AiohttpAsyncHttpResponse(response)
+
+    async def post(self, url, headers=None, data=None, timeout=None):
+        """POST request.
+
+        :param str url: Request url
+        :param dict headers: (optional) Request headers
+        :param data: (optional) Dictionary, bytes, or file-like object to send in the body
+        :param timeout: (optional), How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is :py:attr:`self.timeout`
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`AiohttpAsyncHttpResponse`
+        :return: AiohttpAsyncHttpResponse instance
+        """
+        response = await self.session.post(
+            url, headers=headers, data=data,
+            timeout=self.__get_client_timeout(timeout)
+        )
+        await response.read()
+        response.release()
+
+        return AiohttpAsyncHttpResponse(response)
+
+    async def close(self):
+        """Close the session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+
+    def __get_client_timeout(self, timeout):
+        if timeout is None:
+            timeout = self.timeout
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+
+class AiohttpAsyncHttpResponse(AsyncHttpResponse):
+    """AsyncHttpResponse implemented by aiohttp lib's response."""
+
+    def __init__(self, response):
+        """__init__ method.
+
+        :param response: aiohttp lib's response
+        """
+        self.response = response
+
+    @property
+    def status_code(self):
+        """Get status code."""
+        return self.response.status
+
+    @property
+    def headers(self):
+        """Get headers."""
+        return self.response.headers
+
+    async def text(self):
+        """Get request body as text-decoded."""
+        return await self.response.text()
+
+    async def content(self):
+        """Get request body as binary."""
+        return await self.response.read()
+
+    async def json(self):
+        """Get request body as json-decoded."""
+        return json_codec.loads(await self.response.read())
+
+    def iter_content(self, chunk_size=1024):
+        """Get request body as async iterator content (stream).
+
+        :param int chunk_size:
+        """
+        return self.response.content.iter_chunked(chunk_size)
+
+    def close(self):
+        """Release the connection of this response back to the pool."""
+        self.response.release()
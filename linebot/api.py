@@ -16,13 +16,17 @@
 
 from __future__ import unicode_literals
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
+from . import json_codec
 from .__about__ import __version__
 from .exceptions import LineBotApiError
 from .http_client import HttpClient, RequestsHttpClient
 from .models.error import Error
-from .models.responses import Profile, MessageContent
+from .models.responses import Profile, MessageContent, PushResult, MulticastResult
+from .models.send_messages import FrozenSendMessage
+from .utils import imap_unordered
+from .validation import check_mode, validate_message, validate_message_count
 
 
 class LineBotApi(object):
@@ -30,8 +34,14 @@ class LineBotApi(object):
 
     DEFAULT_API_ENDPOINT = 'https://api.line.me'
 
+    DEFAULT_BULK_CONCURRENCY = 10
+
+    MULTICAST_MAX_RECIPIENTS = 150
+
     def __init__(self, channel_access_token, endpoint=DEFAULT_API_ENDPOINT,
-                 timeout=HttpClient.DEFAULT_TIMEOUT, http_client=RequestsHttpClient):
+                 timeout=HttpClient.DEFAULT_TIMEOUT, http_client=RequestsHttpClient,
+                 retry_policy=None, rate_limiter=None,
+                 circuit_breaker=None, validation=None):
         """__init__ method.
 
         :param str channel_access_token: Your channel access token
@@ -41,21 +51,61 @@ class LineBotApi(object):
             or a (connect timeout, readtimeout) float tuple.
             Default is linebot.http_client.HttpClient.DEFAULT_TIMEOUT
         :type timeout: float | tuple(float, float)
-        :param http_client: (optional) Default is
-            :py:class:`linebot.http_client.RequestsHttpClient`
+        :param http_client: (optional) HttpClient class, or an instance of it
+            to share a configured client (e.g. its connection pool).
+            Default is :py:class:`linebot.http_client.RequestsHttpClient`
         :type http_client: T <= :py:class:`linebot.http_client.HttpClient`
+        :param retry_policy: (optional) Retry policy of failed calls.
+            Default is None (no retry)
+        :type retry_policy: :py:class:`linebot.retry.RetryPolicy`
+        :param rate_limiter: (optional) Rate limiter of outgoing calls.
+            Default is None (no limit)
+        :type rate_limiter: :py:class:`linebot.rate_limiter.RateLimiter`
+        :param circuit_breaker: (optional) Circuit breaker that fails calls fast
+            while an endpoint is degraded. Default is None
+        :type circuit_breaker: :py:class:`linebot.circuit_breaker.CircuitBreaker`
+        :param str validation: (optional) Check of messages against the limits
+            of the Messaging API before they are sent: 'strict' raises
+            :py:class:`linebot.exceptions.ValidationError`, 'truncate' cuts
+            over-limit text fields and raises on other limits.
+            Default is None (no check)
         """
         self.endpoint = endpoint
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.validation = check_mode(validation)
         self.headers = {
             'Authorization': 'Bearer ' + channel_access_token,
             'User-Agent': 'line-bot-sdk-python/' + __version__
         }
 
-        if http_client:
+        if isinstance(http_client, HttpClient):
+            self.http_client = http_client
+        elif http_client:
             self.http_client = http_client(timeout=timeout)
         else:
             self.http_client = RequestsHttpClient(timeout=timeout)
 
+    def __enter__(self):
+        """__enter__ method.
+
+        :rtype: :py:class:`LineBotApi`
+        :return: self
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method.
+
+        Close this instance.
+        """
+        self.close()
+
+    def close(self):
+        """Close the underlying http client and its pooled connections."""
+        self.http_client.close()
+
     def reply_message(self, reply_token, messages, timeout=None):
         """Call reply message API.
 
@@ -72,7 +122,8 @@ class LineBotApi(object):
         Reply tokens can only be used once.
 
         :param str reply_token: replyToken received via webhook
-        :param messages: Messages.
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
             Max: 5
         :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
             list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
@@ -85,16 +136,15 @@ class LineBotApi(object):
         if not isinstance(messages, (list, tuple)):
             messages = [messages]
 
-        data = {
-            'replyToken': reply_token,
-            'messages': [message.as_json_dict() for message in messages]
-        }
+        data = (b'{"replyToken":' + json_codec.dumps(reply_token) +
+                b',"messages":' + _dump_messages(messages, self.validation) + b'}')
 
         self._post(
-            '/v2/bot/message/reply', data=json.dumps(data), timeout=timeout
+            '/v2/bot/message/reply', data=data, timeout=timeout,
+            endpoint_class='reply'
         )
 
-    def push_message(self, to, messages, timeout=None):
+    def push_message(self, to, messages, timeout=None, retry_key=None):
         """Call push message API.
 
         https://devdocs.line.me/en/#push-message
@@ -102,7 +152,8 @@ class LineBotApi(object):
         Send messages to users, groups, and rooms at any time.
 
         :param str to: ID of the receiver
-        :param messages: Messages.
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
             Max: 5
         :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
             list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
@@ -111,19 +162,100 @@ class LineBotApi(object):
             or a (connect timeout, readtimeout) float tuple.
             Default is self.http_client.timeout
         :type timeout: float | tuple(float, float)
+        :param str retry_key: (optional) UUID sent as X-Line-Retry-Key.
+            Only calls with a retry key are retried by the retry policy,
+            because the API server ignores a retried request with the same key.
         """
         if not isinstance(messages, (list, tuple)):
             messages = [messages]
 
-        data = {
-            'to': to,
-            'messages': [message.as_json_dict() for message in messages]
-        }
+        data = (b'{"to":' + json_codec.dumps(to) +
+                b',"messages":' + _dump_messages(messages, self.validation) + b'}')
 
         self._post(
-            '/v2/bot/message/push', data=json.dumps(data), timeout=timeout
+            '/v2/bot/message/push', data=data, timeout=timeout,
+            endpoint_class='push', retry_key=retry_key
         )
 
+    def push_messages_bulk(self, recipients, messages,
+                           concurrency=DEFAULT_BULK_CONCURRENCY, timeout=None):
+        """Call push message API for each recipient, concurrently.
+
+        https://devdocs.line.me/en/#push-message
+
+        The messages are serialized once and sent to every recipient
+        from a pool of worker threads. A failed push does not stop the others.
+
+        :param recipients: IDs of the receivers. May be a lazy iterable
+        :type recipients: iterable[str]
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :param int concurrency: (optional) Number of pushes in flight.
+            Default is :py:attr:`DEFAULT_BULK_CONCURRENCY`
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.http_client.timeout
+        :type timeout: float | tuple(float, float)
+        :rtype: iterator[:py:class:`linebot.models.responses.PushResult`]
+        :return: Result per recipient, in completion order
+        """
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+
+        messages_json = _dump_messages(messages, self.validation)
+
+        return self.__post_concurrently(
+            '/v2/bot/message/push', recipients,
+            lambda to: b'{"to":' + json_codec.dumps(to) + b',"messages":' + messages_json + b'}',
+            concurrency=concurrency, timeout=timeout, endpoint_class='push'
+        )
+
+    def multicast(self, to, messages, concurrency=DEFAULT_BULK_CONCURRENCY, timeout=None):
+        """Call multicast API.
+
+        https://devdocs.line.me/en/#multicast
+
+        Send messages to multiple users at any time.
+
+        The recipients are split into chunks of :py:attr:`MULTICAST_MAX_RECIPIENTS`,
+        which are sent concurrently. The messages are serialized once for all chunks.
+
+        :param to: IDs of the receivers
+        :type to: list[str]
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :param int concurrency: (optional) Number of chunks in flight.
+            Default is :py:attr:`DEFAULT_BULK_CONCURRENCY`
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.http_client.timeout
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`linebot.models.responses.MulticastResult`
+        :return: MulticastResult instance
+        """
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+
+        messages_json = _dump_messages(messages, self.validation)
+        chunks = [to[i:i + self.MULTICAST_MAX_RECIPIENTS]
+                  for i in range(0, len(to), self.MULTICAST_MAX_RECIPIENTS)]
+
+        return MulticastResult(list(self.__post_concurrently(
+            '/v2/bot/message/multicast', chunks,
+            lambda chunk: (b'{"to":' + json_codec.dumps(chunk) +
+                           b',"messages":' + messages_json + b'}'),
+            concurrency=min(concurrency, len(chunks)) or 1, timeout=timeout,
+            endpoint_class='multicast'
+        )))
+
     def get_profile(self, user_id, timeout=None):
         """Call get profile API.
 
@@ -142,7 +274,7 @@ class LineBotApi(object):
         """
         response = self._get(
             '/v2/bot/profile/{user_id}'.format(user_id=user_id),
-            timeout=timeout
+            timeout=timeout, endpoint_class='profile'
         )
 
         return Profile.new_from_json_dict(response.json)
@@ -165,7 +297,7 @@ class LineBotApi(object):
         """
         response = self._get(
             '/v2/bot/message/{message_id}/content'.format(message_id=message_id),
-            stream=True, timeout=timeout
+            stream=True, timeout=timeout, endpoint_class='content'
         )
 
         return MessageContent(response)
@@ -186,7 +318,7 @@ class LineBotApi(object):
         """
         self._post(
             '/v2/bot/group/{group_id}/leave'.format(group_id=group_id),
-            timeout=timeout
+            timeout=timeout, endpoint_class='leave', idempotent=True
         )
 
     def leave_room(self, room_id, timeout=None):
@@ -205,28 +337,99 @@ class LineBotApi(object):
         """
         self._post(
             '/v2/bot/room/{room_id}/leave'.format(room_id=room_id),
-            timeout=timeout
+            timeout=timeout, endpoint_class='leave', idempotent=True
         )
 
-    def _get(self, path, stream=False, timeout=None):
+    def __post_concurrently(self, path, recipients, get_data, concurrency=1,
+                            timeout=None, endpoint_class=None):
+        def post(to):
+            try:
+                self._post(path, data=get_data(to), timeout=timeout,
+                           endpoint_class=endpoint_class)
+            except Exception as e:
+                return to, e
+            return to, None
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for future in imap_unordered(executor, post, recipients, concurrency * 2):
+                to, error = future.result()
+                if error is None:
+                    yield PushResult(to, PushResult.SUCCESS)
+                elif isinstance(error, self.http_client.TIMEOUT_EXCEPTIONS):
+                    yield PushResult(to, PushResult.TIMEOUT, error=error)
+                else:
+                    yield PushResult(to, PushResult.ERROR, error=error)
+        finally:
+            executor.shutdown(wait=True)
+
+    def _get(self, path, stream=False, timeout=None, endpoint_class=None):
         url = self.endpoint + path
 
-        response = self.http_client.get(
-            url, headers=self.headers, stream=stream, timeout=timeout
+        return self.__send(
+            path, lambda: self.http_client.get(
+                url, headers=self.headers, stream=stream, timeout=timeout
+            ),
+            endpoint_class=endpoint_class, idempotent=True
         )
 
-        self.__check_error(response)
-        return response
-
-    def _post(self, path, data=None, timeout=None):
+    def _post(self, path, data=None, timeout=None, endpoint_class=None,
+              idempotent=False, retry_key=None):
         url = self.endpoint + path
         headers = {'Content-Type': 'application/json'}
         headers.update(self.headers)
-
-        response = self.http_client.post(
-            url, headers=headers, data=data, timeout=timeout
+        if retry_key is not None:
+            headers['X-Line-Retry-Key'] = retry_key
+
+        return self.__send(
+            path, lambda: self.http_client.post(
+                url, headers=headers, data=data, timeout=timeout
+            ),
+            endpoint_class=endpoint_class, idempotent=idempotent or retry_key is not None
         )
 
+    def __send(self, path, request, endpoint_class=None, idempotent=False):
+        retry_policy = self.retry_policy
+        rate_limiter = self.rate_limiter
+        circuit_breaker = self.circuit_breaker
+        circuit_key = endpoint_class or path
+        attempts = 0
+        waited = 0
+
+        while True:
+            if circuit_breaker:
+                circuit_breaker.before_call(circuit_key)
+            try:
+                if rate_limiter:
+                    rate_limiter.acquire(endpoint_class)
+                response = request()
+            except Exception as e:
+                if circuit_breaker:
+                    circuit_breaker.record(
+                        circuit_key,
+                        timeout=isinstance(e, self.http_client.TIMEOUT_EXCEPTIONS))
+                raise
+            except BaseException:
+                # e.g. KeyboardInterrupt: a trial call of a half-open circuit
+                # must not keep its slot
+                if circuit_breaker:
+                    circuit_breaker.record(circuit_key)
+                raise
+            if circuit_breaker:
+                circuit_breaker.record(circuit_key, response.status_code)
+            attempts += 1
+            if not (idempotent and retry_policy and
+                    retry_policy.is_retryable(attempts, response.status_code)):
+                break
+
+            backoff = retry_policy.get_backoff(attempts, response)
+            response.close()
+            retry_policy.sleep(backoff)
+            waited += backoff
+
+        if retry_policy:
+            retry_policy.complete(path, attempts, waited)
+
         self.__check_error(response)
         return response
 
@@ -237,3 +440,24 @@ class LineBotApi(object):
         else:
             error = Error.new_from_json_dict(response.json)
             raise LineBotApiError(response.status_code, error)
+
+
+def _dump_messages(messages, validation=None):
+    """Serialize messages as a JSON array.
+
+    Frozen messages were checked when frozen and bound, and are spliced
+    in as they are. With a validation mode, the other messages are checked
+    while they are serialized.
+    """
+    if validation is not None:
+        validate_message_count(len(messages))
+        return b'[' + b','.join(
+            message.as_json_bytes() if isinstance(message, FrozenSendMessage)
+            else json_codec.dumps(
+                validate_message(message.as_json_dict(), i, validation))
+            for i, message in enumerate(messages)) + b']'
+
+    return b'[' + b','.join(
+        message.as_json_bytes() if isinstance(message, FrozenSendMessage)
+        else json_codec.dumps(message.as_json_dict())
+        for message in messages) + b']'
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.async_api module.
+
+Requires Python 3.5+.
+"""
+
+import asyncio
+
+from . import json_codec
+from .__about__ import __version__
+from .api import _dump_messages
+from .exceptions import LineBotApiError
+from .models.error import Error
+from .models.responses import Profile, AsyncMessageContent, PushResult, MulticastResult
+from .validation import check_mode
+
+
+class AsyncLineBotApi(object):
+    """AsyncLineBotApi provides asyncio interface for LINE messaging API.
+
+    Every API method is a coroutine. Concurrent calls share
+    the connection pool of the given async_http_client.
+    """
+
+    DEFAULT_API_ENDPOINT = 'https://api.line.me'
+
+    MULTICAST_MAX_RECIPIENTS = 150
+
+    def __init__(self, channel_access_token, async_http_client,
+                 endpoint=DEFAULT_API_ENDPOINT, retry_policy=None, rate_limiter=None,
+                 circuit_breaker=None, validation=None):
+        """__init__ method.
+
+        :param str channel_access_token: Your channel access token
+        :param async_http_client: AsyncHttpClient instance,
+            e.g. :py:class:`linebot.aiohttp_async_http_client.AiohttpAsyncHttpClient`
+        :type async_http_client: T <= :py:class:`linebot.async_http_client.AsyncHttpClient`
+        :param str endpoint: (optional) Default is https://api.line.me
+        :param retry_policy: (optional) Retry policy of failed calls.
+            Default is None (no retry)
+        :type retry_policy: :py:class:`linebot.retry.RetryPolicy`
+        :param rate_limiter: (optional) Rate limiter of outgoing calls.
+            Default is None (no limit)
+        :type rate_limiter: :py:class:`linebot.rate_limiter.RateLimiter`
+        :param circuit_breaker: (optional) Circuit breaker that fails calls fast
+            while an endpoint is degraded. Default is None
+        :type circuit_breaker: :py:class:`linebot.circuit_breaker.CircuitBreaker`
+        :param str validation: (optional) Check of messages against the limits
+            of the Messaging API before they are sent: 'strict' raises
+            :py:class:`linebot.exceptions.ValidationError`, 'truncate' cuts
+            over-limit text fields and raises on other limits.
+            Default is None (no check)
+        """
+        self.endpoint = endpoint
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.validation = check_mode(validation)
+        self.headers = {
+            'Authorization': 'Bearer ' + channel_access_token,
+            'User-Agent': 'line-bot-sdk-python/' + __version__
+        }
+        self.async_http_client = async_http_client
+
+    async def __aenter__(self):
+        """__aenter__ method.
+
+        :rtype: :py:class:`AsyncLineBotApi`
+        :return: self
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method.
+
+        Close this instance.
+        """
+        await self.close()
+
+    async def close(self):
+        """Close the underlying async http client and its pooled connections."""
+        await self.async_http_client.close()
+
+    async def reply_message(self, reply_token, messages, timeout=None):
+        """Call reply message API.
+
+        https://devdocs.line.me/en/#reply-message
+
+        Respond to events from users, groups, and rooms.
+
+        :param str reply_token: replyToken received via webhook
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        """
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+
+        data = (b'{"replyToken":' + json_codec.dumps(reply_token) +
+                b',"messages":' + _dump_messages(messages, self.validation) + b'}')
+
+        await self._post(
+            '/v2/bot/message/reply', data=data, timeout=timeout,
+            endpoint_class='reply'
+        )
+
+    async def push_message(self, to, messages, timeout=None, retry_key=None):
+        """Call push message API.
+
+        https://devdocs.line.me/en/#push-message
+
+        Send messages to users, groups, and rooms at any time.
+
+        :param str to: ID of the receiver
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        :param str retry_key: (optional) UUID sent as X-Line-Retry-Key.
+            Only calls with a retry key are retried by the retry policy.
+        """
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+
+        data = (b'{"to":' + json_codec.dumps(to) +
+                b',"messages":' + _dump_messages(messages, self.validation) + b'}')
+
+        await self._post(
+            '/v2/bot/message/push', data=data, timeout=timeout,
+            endpoint_class='push', retry_key=retry_key
+        )
+
+    async def multicast(self, to, messages, timeout=None):
+        """Call multicast API.
+
+        https://devdocs.line.me/en/#multicast
+
+        Send messages to multiple users at any time.
+
+        The recipients are split into chunks of :py:attr:`MULTICAST_MAX_RECIPIENTS`,
+        which are sent concurrently. The messages are serialized once for all chunks.
+
+        :param to: IDs of the receivers
+        :type to: list[str]
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`linebot.models.responses.MulticastResult`
+        :return: MulticastResult instance
+        """
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+
+        messages_json = _dump_messages(messages, self.validation)
+
+        async def post(chunk):
+            try:
+                await self._post(
+                    '/v2/bot/message/multicast',
+                    data=(b'{"to":' + json_codec.dumps(chunk) +
+                          b',"messages":' + messages_json + b'}'),
+                    timeout=timeout, endpoint_class='multicast'
+                )
+            except asyncio.TimeoutError as e:
+                return PushResult(chunk, PushResult.TIMEOUT, error=e)
+            except Exception as e:
+                return PushResult(chunk, PushResult.ERROR, error=e)
+            return PushResult(chunk, PushResult.SUCCESS)
+
+        return MulticastResult(list(await asyncio.gather(*[
+            post(to[i:i + self.MULTICAST_MAX_RECIPIENTS])
+            for i in range(0, len(to), self.MULTICAST_MAX_RECIPIENTS)
+        ])))
+
+    async def get_profile(self, user_id, timeout=None):
+        """Call get profile API.
+
+        https://devdocs.line.me/en/#bot-api-get-profile
+
+        Get user profile information.
+
+        :param str user_id: User ID
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`linebot.models.responses.Profile`
+        :return: Profile instance
+        """
+        response = await self._get(
+            '/v2/bot/profile/{user_id}'.format(user_id=user_id),
+            timeout=timeout, endpoint_class='profile'
+        )
+
+        return Profile.new_from_json_dict(await response.json())
+
+    async def get_message_content(self, message_id, timeout=None):
+        """Call get content API.
+
+        https://devdocs.line.me/en/#get-content
+
+        Retrieve image, video, and audio data sent by users.
+
+        :param str message_id: Message ID
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`linebot.models.responses.AsyncMessageContent`
+        :return: AsyncMessageContent instance
+        """
+        response = await self._get(
+            '/v2/bot/message/{message_id}/content'.format(message_id=message_id),
+            stream=True, timeout=timeout, endpoint_class='content'
+        )
+
+        return AsyncMessageContent(response)
+
+    async def leave_group(self, group_id, timeout=None):
+        """Call leave group API.
+
+        https://devdocs.line.me/en/#leave
+
+        Leave a group.
+
+        :param str group_id: Group ID
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        """
+        await self._post(
+            '/v2/bot/group/{group_id}/leave'.format(group_id=group_id),
+            timeout=timeout, endpoint_class='leave', idempotent=True
+        )
+
+    async def leave_room(self, room_id, timeout=None):
+        """Call leave room API.
+
+        https://devdocs.line.me/en/#leave
+
+        Leave a room.
+
+        :param str room_id: Room ID
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is self.async_http_client.timeout
+        :type timeout: float | tuple(float, float)
+        """
+        await self._post(
+            '/v2/bot/room/{room_id}/leave'.format(room_id=room_id),
+            timeout=timeout, endpoint_class='leave', idempotent=True
+        )
+
+    async def _get(self, path, stream=False, timeout=None, endpoint_class=None):
+        url = self.endpoint + path
+
+        return await self.__send(
+            path, lambda: self.async_http_client.get(
+                url, headers=self.headers, stream=stream, timeout=timeout
+            ),
+            endpoint_class=endpoint_class, idempotent=True
+        )
+
+    async def _post(self, path, data=None, timeout=None, endpoint_class=None,
+                    idempotent=False, retry_key=None):
+        url = self.endpoint + path
+        headers = {'Content-Type': 'application/json'}
+        headers.update(self.headers)
+        if retry_key is not None:
+            headers['X-Line-Retry-Key'] = retry_key
+
+        return await self.__send(
+            path, lambda: self.async_http_client.post(
+                url, headers=headers, data=data, timeout=timeout
+            ),
+            endpoint_class=endpoint_class, idempotent=idempotent or retry_key is not None
+        )
+
+    async def __send(self, path, request, endpoint_class=None, idempotent=False):
+        retry_policy = self.retry_policy
+        rate_limiter = self.rate_limiter
+        circuit_breaker = self.circuit_breaker
+        circuit_key = endpoint_class or path
+        attempts = 0
+        waited = 0
+
+        while True:
+            if circuit_breaker:
+                circuit_breaker.before_call(circuit_key)
+            try:
+                if rate_limiter:
+                    wait = rate_limiter.reserve(endpoint_class)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                response = await request()
+            except Exception as e:
+                if circuit_breaker:
+                    circuit_breaker.record(
+                        circuit_key, timeout=isinstance(e, asyncio.TimeoutError))
+                raise
+            except BaseException:
+                # e.g. cancellation by asyncio.wait_for: a trial call of
+                # a half-open circuit must not keep its slot
+                if circuit_breaker:
+                    circuit_breaker.record(circuit_key)
+                raise
+            if circuit_breaker:
+                circuit_breaker.record(circuit_key, response.status_code)
+            attempts += 1
+            if not (idempotent and retry_policy and
+                    retry_policy.is_retryable(attempts, response.status_code)):
+                break
+
+            backoff = retry_policy.get_backoff(attempts, response)
+            response.close()
+            await asyncio.sleep(backoff)
+            waited += backoff
+
+        if retry_policy:
+            retry_policy.complete(path, attempts, waited)
+
+        await self.__check_error(response)
+        return response
+
+    @staticmethod
+    async def __check_error(response):
+        if 200 <= response.status_code < 300:
+            pass
+        else:
+            error = Error.new_from_json_dict(await response.json())
+            raise LineBotApiError(response.status_code, error)
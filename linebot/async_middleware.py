@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.async_middleware module.
+
+asyncio implementation of :py:mod:`linebot.middleware` for coroutine handlers.
+Requires Python 3.5+.
+"""
+
+import functools
+import inspect
+import time
+
+
+async def run_async(chain, stage, func, *args):
+    """Run a stage returning an awaitable through the chain, and await it.
+
+    Middleware with ``process_stage_async`` awaits the rest of the chain.
+    Other middleware wraps only the call returning the awaitable.
+
+    :param chain: Middleware chain
+    :type chain: :py:class:`linebot.middleware.MiddlewareChain`
+    :param str stage: Stage name
+    :param func: Stage itself, returning an awaitable
+    :param args: Arguments of the stage
+    :return: Result of the stage
+    """
+    call = func
+    for middleware in reversed(chain.middlewares):
+        call = functools.partial(_process_stage, middleware, stage, call)
+    return await call(*args)
+
+
+async def _process_stage(middleware, stage, call_next, *args):
+    if middleware.process_stage_async is not None:
+        return await middleware.process_stage_async(stage, call_next, *args)
+
+    result = middleware.process_stage(stage, call_next, *args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def timing_process_stage_async(self, stage, call_next, *args):
+    """Await the stage and record its duration, whether it succeeds or raises.
+
+    :param str stage: Stage name
+    :param call_next: Rest of the chain
+    :param args: Arguments of the stage
+    :return: Result of the stage
+    """
+    started = time.perf_counter()
+    try:
+        return await call_next(*args)
+    finally:
+        self._observe_stage(stage, time.perf_counter() - started, args)
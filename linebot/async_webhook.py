@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.async_webhook module.
+
+asyncio implementation of :py:meth:`linebot.webhook.WebhookHandler.handle_async`.
+Requires Python 3.5+.
+"""
+
+import asyncio
+
+from .async_middleware import run_async
+from .exceptions import WebhookHandlerError
+from .webhook import _SenderBatch, _call, _call_without_event
+
+
+async def handle_async(handler, body, signature):
+    """Handle webhook in asyncio.
+
+    :param handler: WebhookHandler whose handlers are called
+    :type handler: :py:class:`linebot.webhook.WebhookHandler`
+    :param body: Webhook request body (as text, or as raw bytes)
+    :type body: str | bytes | memoryview
+    :param str signature: X-Line-Signature value (as text)
+    """
+    events = handler._get_events(body, signature)
+
+    results = await asyncio.gather(*[
+        _handle_batch(handler, batch.events) for batch in _SenderBatch.group(events)
+    ])
+
+    errors = [error for batch_errors in results for error in batch_errors]
+    if errors:
+        order = {id(event): i for i, event in enumerate(events)}
+        errors.sort(key=lambda error: order[id(error[0])])
+        handler._discard_seen([event for event, _ in errors])
+        raise WebhookHandlerError(errors)
+
+
+async def _handle_batch(handler, events):
+    errors = []
+    for i, event in enumerate(events):
+        found = handler._get_handler(event)
+        if found is None:
+            continue
+
+        func, args_count = found
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        if is_coroutine:
+            call = _call_without_event if args_count == 0 else _call
+            if handler.middleware.middlewares:
+                call = run_async(handler.middleware, 'handler', call, func, event)
+            else:
+                call = call(func, event)
+        else:
+            call = asyncio.get_event_loop().run_in_executor(
+                handler._executor, handler._call_handler, found, event)
+
+        try:
+            if handler.handler_timeout is None:
+                await call
+            else:
+                await asyncio.wait_for(call, handler.handler_timeout)
+        except asyncio.TimeoutError as e:
+            if is_coroutine:
+                errors.append((event, e))
+            else:
+                # the thread keeps running, so the later events would overtake it
+                errors.extend((skipped, e) for skipped in events[i:])
+                break
+        except Exception as e:
+            errors.append((event, e))
+
+    return errors
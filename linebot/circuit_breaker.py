@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.circuit_breaker module."""
+
+from __future__ import unicode_literals
+
+import threading
+import time
+from collections import deque
+
+from .exceptions import CircuitOpenError
+
+_SUCCESS = 0
+_ERROR = 1
+_TIMEOUT = 2
+
+
+class CircuitBreaker(object):
+    """Circuit breaker of LineBotApi.
+
+    Keeps one circuit per endpoint class, which records the outcome of
+    the last ``window_size`` calls. A call is an error if it raised or
+    the response status is 5xx, and a timeout if it raised a timeout exception.
+
+    When the error rate or the timeout rate of a circuit reaches its threshold,
+    the circuit opens and calls fail fast with
+    :py:class:`linebot.exceptions.CircuitOpenError`. After ``recovery_timeout``
+    seconds the circuit is half-open: up to ``half_open_max_calls`` trial calls
+    are let through, and the circuit closes if they succeed, or opens again if one fails.
+    """
+
+    CLOSED = 'closed'
+
+    OPEN = 'open'
+
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, error_rate_threshold=0.5, timeout_rate_threshold=0.2,
+                 window_size=20, minimum_calls=10, recovery_timeout=30,
+                 half_open_max_calls=1):
+        """__init__ method.
+
+        :param float error_rate_threshold: (optional) Rate of errors,
+            timeouts included, that opens the circuit
+        :param float timeout_rate_threshold: (optional) Rate of timeouts
+            that opens the circuit
+        :param int window_size: (optional) Number of recent calls the rates are computed on
+        :param int minimum_calls: (optional) Number of recorded calls needed
+            before the circuit can open
+        :param float recovery_timeout: (optional) Seconds the circuit stays open
+            before trial calls are let through
+        :param int half_open_max_calls: (optional) Number of trial calls
+            in the half-open state
+        """
+        self.error_rate_threshold = error_rate_threshold
+        self.timeout_rate_threshold = timeout_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def before_call(self, key):
+        """Check that a call may be sent.
+
+        :param str key: Endpoint class
+        :raises: :py:class:`linebot.exceptions.CircuitOpenError`
+            if the circuit is open
+        """
+        with self._lock:
+            circuit = self.__get_circuit(key)
+            if circuit.state == self.OPEN:
+                retry_after = circuit.opened_at + self.recovery_timeout - time.time()
+                if retry_after > 0:
+                    raise CircuitOpenError(key, retry_after)
+                circuit.state = self.HALF_OPEN
+                circuit.trials = 0
+                circuit.successes = 0
+
+            if circuit.state == self.HALF_OPEN:
+                if circuit.trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(key, 0)
+                circuit.trials += 1
+
+    def record(self, key, status_code=None, timeout=False):
+        """Record the outcome of a call.
+
+        :param str key: Endpoint class
+        :param int status_code: (optional) Status code of the response.
+            None if the call raised
+        :param bool timeout: (optional) True if the call timed out
+        """
+        if timeout:
+            outcome = _TIMEOUT
+        elif status_code is None or status_code >= 500:
+            outcome = _ERROR
+        else:
+            outcome = _SUCCESS
+
+        with self._lock:
+            circuit = self.__get_circuit(key)
+            if circuit.state == self.HALF_OPEN:
+                if outcome == _SUCCESS:
+                    circuit.successes += 1
+                    if circuit.successes >= self.half_open_max_calls:
+                        circuit.close()
+                else:
+                    circuit.open()
+                return
+
+            circuit.outcomes.append(outcome)
+            if len(circuit.outcomes) < self.minimum_calls:
+                return
+
+            errors = sum(1 for o in circuit.outcomes if o != _SUCCESS)
+            timeouts = sum(1 for o in circuit.outcomes if o == _TIMEOUT)
+            calls = float(len(circuit.outcomes))
+            if (errors / calls >= self.error_rate_threshold or
+                    timeouts / calls >= self.timeout_rate_threshold):
+                circuit.open()
+
+    def get_state(self, key):
+        """Get the state of a circuit.
+
+        :param str key: Endpoint class
+        :rtype: str
+        :return: :py:attr:`CLOSED`, :py:attr:`OPEN` or :py:attr:`HALF_OPEN`
+        """
+        with self._lock:
+            return self.__get_circuit(key).state
+
+    def __get_circuit(self, key):
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(self.window_size)
+        return circuit
+
+
+class _Circuit(object):
+    def __init__(self, window_size):
+        self.outcomes = deque(maxlen=window_size)
+        self.close()
+
+    def open(self):
+        self.state = CircuitBreaker.OPEN
+        self.opened_at = time.time()
+        self.outcomes.clear()
+
+    def close(self):
+        self.state = CircuitBreaker.CLOSED
+        self.opened_at = None
+        self.trials = 0
+        self.successes = 0
+        self.outcomes.clear()
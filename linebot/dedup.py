@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.dedup module."""
+
+from __future__ import unicode_literals
+
+import sqlite3
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+
+from future.utils import with_metaclass
+
+
+def get_fingerprint(event):
+    """Get the fingerprint of a webhook event.
+
+    Redeliveries of an event have the same fingerprint.
+    It is the reply token if the event has one, or else the event type,
+    timestamp, source and message ID.
+
+    :param event: Webhook event
+    :type event: T <= :py:class:`linebot.models.events.Event`
+    :rtype: str
+    :return: fingerprint
+    """
+    reply_token = getattr(event, 'reply_token', None)
+    if reply_token is not None:
+        return 'reply:' + reply_token
+
+    source = getattr(event, 'source', None)
+    message = getattr(event, 'message', None)
+    return 'event:{0}:{1}:{2}:{3}:{4}'.format(
+        event.type,
+        event.timestamp,
+        getattr(source, 'sender_id', '') or '',
+        getattr(source, 'user_id', '') or '',
+        getattr(message, 'id', '') or '')
+
+
+class DedupBackend(with_metaclass(ABCMeta)):
+    """Abstract Base Class of store of seen event fingerprints."""
+
+    @abstractmethod
+    def add(self, fingerprint):
+        """Record a fingerprint.
+
+        :param str fingerprint: Event fingerprint
+        :rtype: bool
+        :return: True if the fingerprint was not seen within the TTL
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, fingerprint):
+        """Forget a fingerprint, e.g. of an event whose handler failed.
+
+        The next delivery of the event is then handled again.
+
+        :param str fingerprint: Event fingerprint
+        """
+        raise NotImplementedError
+
+
+class MemoryDedupBackend(DedupBackend):
+    """DedupBackend in process memory.
+
+    Fingerprints are kept for ttl seconds, and at most max_size of them;
+    the oldest ones are dropped first.
+    """
+
+    def __init__(self, ttl=3600, max_size=100000):
+        """__init__ method.
+
+        :param float ttl: (optional) Seconds a fingerprint is remembered
+        :param int max_size: (optional) Maximum number of fingerprints
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, fingerprint):
+        """Record a fingerprint.
+
+        :param str fingerprint: Event fingerprint
+        :rtype: bool
+        :return: True if the fingerprint was not seen within the TTL
+        """
+        now = time.time()
+        with self._lock:
+            expires_at = self._seen.get(fingerprint)
+            if expires_at is not None:
+                if expires_at > now:
+                    return False
+                del self._seen[fingerprint]
+
+            # entries are in insertion order, so the expired ones come first
+            while self._seen:
+                oldest, expires_at = next(iter(self._seen.items()))
+                if expires_at > now and len(self._seen) < self.max_size:
+                    break
+                del self._seen[oldest]
+
+            self._seen[fingerprint] = now + self.ttl
+            return True
+
+    def discard(self, fingerprint):
+        """Forget a fingerprint.
+
+        :param str fingerprint: Event fingerprint
+        """
+        with self._lock:
+            self._seen.pop(fingerprint, None)
+
+
+class SqliteDedupBackend(DedupBackend):
+    """DedupBackend in a local SQLite database.
+
+    Every process opening the same path shares the fingerprints,
+    e.g. the workers of a gunicorn server.
+    """
+
+    def __init__(self, path, ttl=3600):
+        """__init__ method.
+
+        :param str path: Path of the SQLite database. Created if it does not exist
+        :param float ttl: (optional) Seconds a fingerprint is remembered
+        """
+        self.path = path
+        self.ttl = ttl
+        self._local = threading.local()
+
+        self._connection().executescript(
+            'CREATE TABLE IF NOT EXISTS dedup '
+            '(fingerprint TEXT PRIMARY KEY, expires_at REAL NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS dedup_expires_at ON dedup (expires_at);')
+
+    def add(self, fingerprint):
+        """Record a fingerprint.
+
+        :param str fingerprint: Event fingerprint
+        :rtype: bool
+        :return: True if the fingerprint was not seen within the TTL
+        """
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM dedup WHERE expires_at <= ?', (now,))
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO dedup (fingerprint, expires_at) VALUES (?, ?)',
+                (fingerprint, now + self.ttl))
+            return cursor.rowcount == 1
+
+    def discard(self, fingerprint):
+        """Forget a fingerprint.
+
+        :param str fingerprint: Event fingerprint
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute('DELETE FROM dedup WHERE fingerprint = ?', (fingerprint,))
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
@@ -73,3 +73,61 @@ class LineBotApiError(BaseError):
 
         self.status_code = status_code
         self.error = error
+
+
+class CircuitOpenError(BaseError):
+    """When the circuit of an endpoint is open, this error will be raised.
+
+    The call was not sent.
+    """
+
+    def __init__(self, endpoint_class, retry_after):
+        """__init__ method.
+
+        :param str endpoint_class: Endpoint class of the open circuit
+        :param float retry_after: Seconds until trial calls are let through
+        """
+        super(CircuitOpenError, self).__init__(
+            'circuit of {0} is open'.format(endpoint_class))
+
+        self.endpoint_class = endpoint_class
+        self.retry_after = retry_after
+
+
+class WebhookHandlerError(BaseError):
+    """When handlers run concurrently by WebhookHandler fail, this error will be raised.
+
+    It is raised after every event was handled, with the errors of all failed handlers.
+    """
+
+    def __init__(self, errors):
+        """__init__ method.
+
+        :param errors: Failed events and their exceptions, in the order of the events
+        :type errors: list[(T <= :py:class:`linebot.models.events.Event`, Exception)]
+        """
+        super(WebhookHandlerError, self).__init__(
+            '{0} handler(s) failed'.format(len(errors)))
+
+        self.errors = errors
+
+
+class ValidationError(BaseError):
+    """When a message exceeds a limit of the Messaging API, this error will be raised.
+
+    The call was not sent.
+    """
+
+    def __init__(self, path, limit, actual):
+        """__init__ method.
+
+        :param str path: Path of the over-limit value, e.g. 'messages[0].template.title'
+        :param int limit: Max length of the value, or max number of its items
+        :param int actual: Actual length of the value, or number of its items
+        """
+        super(ValidationError, self).__init__(
+            '{0} exceeds the limit of {1} (got {2})'.format(path, limit, actual))
+
+        self.path = path
+        self.limit = limit
+        self.actual = actual
@@ -20,6 +20,10 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 
 import requests
 from future.utils import with_metaclass
+from requests.adapters import HTTPAdapter
+from requests.compat import cookielib
+
+from . import json_codec
 
 
 class HttpClient(with_metaclass(ABCMeta)):
@@ -27,6 +31,9 @@ class HttpClient(with_metaclass(ABCMeta)):
 
     DEFAULT_TIMEOUT = 5
 
+    #: Exception classes raised by get and post when a request times out
+    TIMEOUT_EXCEPTIONS = ()
+
     def __init__(self, timeout=DEFAULT_TIMEOUT):
         """__init__ method.
 
@@ -75,11 +82,32 @@ class HttpClient(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError
 
+    def close(self):
+        """Release resources held by this client.
+
+        Default implementation does nothing.
+        """
+        pass
+
 
 class RequestsHttpClient(HttpClient):
-    """HttpClient implemented by requests."""
+    """HttpClient implemented by requests.
+
+    Requests are sent through one long-lived :py:class:`requests.Session`,
+    so connections to the API server are pooled and kept alive between calls.
+    The session stores no cookies, and can be shared between threads.
+    """
+
+    TIMEOUT_EXCEPTIONS = (requests.exceptions.Timeout,)
+
+    DEFAULT_POOL_CONNECTIONS = 10
+
+    DEFAULT_POOL_MAXSIZE = 10
 
-    def __init__(self, timeout=HttpClient.DEFAULT_TIMEOUT):
+    def __init__(self, timeout=HttpClient.DEFAULT_TIMEOUT,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=False, keep_alive=True):
         """__init__ method.
 
         :param timeout: (optional) How long to wait for the server
@@ -87,9 +115,29 @@ class RequestsHttpClient(HttpClient):
             or a (connect timeout, readtimeout) float tuple.
             Default is :py:attr:`DEFAULT_TIMEOUT`
         :type timeout: float | tuple(float, float)
+        :param int pool_connections: (optional) Number of per-host connection pools to cache.
+            Default is :py:attr:`DEFAULT_POOL_CONNECTIONS`
+        :param int pool_maxsize: (optional) Maximum number of connections kept per host.
+            Default is :py:attr:`DEFAULT_POOL_MAXSIZE`
+        :param bool pool_block: (optional) If True, wait for a free connection
+            instead of opening a connection beyond pool_maxsize.
+        :param bool keep_alive: (optional) If False, close the connection after each request.
         """
         super(RequestsHttpClient, self).__init__(timeout)
 
+        self.session = requests.Session()
+        self.session.cookies.set_policy(
+            cookielib.DefaultCookiePolicy(allowed_domains=[]))
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def get(self, url, headers=None, params=None, stream=False, timeout=None):
         """GET request.
 
@@ -108,7 +156,7 @@ class RequestsHttpClient(HttpClient):
         if timeout is None:
             timeout = self.timeout
 
-        response = requests.get(
+        response = self.session.get(
             url, headers=headers, params=params, stream=stream, timeout=timeout
         )
 
@@ -131,12 +179,16 @@ class RequestsHttpClient(HttpClient):
         if timeout is None:
             timeout = self.timeout
 
-        response = requests.post(
+        response = self.session.post(
             url, headers=headers, data=data, timeout=timeout
         )
 
         return RequestsHttpResponse(response)
 
+    def close(self):
+        """Close the session and its pooled connections."""
+        self.session.close()
+
 
 class HttpResponse(with_metaclass(ABCMeta)):
     """HttpResponse."""
@@ -175,6 +227,12 @@ class HttpResponse(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError
 
+    def close(self):
+        """Release the connection of this response back to the pool.
+
+        The body can no longer be read afterwards.
+        """
+
 
 class RequestsHttpResponse(HttpResponse):
     """HttpResponse implemented by requests lib's response."""
@@ -209,7 +267,7 @@ class RequestsHttpResponse(HttpResponse):
     @property
     def json(self):
         """Get request body as json-decoded."""
-        return self.response.json()
+        return json_codec.loads(self.response.content)
 
     def iter_content(self, chunk_size=1024, decode_unicode=False):
         """Get request body as iterator content (stream).
@@ -218,3 +276,7 @@ class RequestsHttpResponse(HttpResponse):
         :param bool decode_unicode:
         """
         return self.response.iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode)
+
+    def close(self):
+        """Release the connection of this response back to the pool."""
+        self.response.close()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.httpx_http_client module.
+
+Requires httpx, and h2 for HTTP/2 (``pip install httpx[http2]``).
+"""
+
+from __future__ import unicode_literals
+
+import httpx
+
+from . import json_codec
+from .http_client import HttpClient, HttpResponse
+
+
+class HttpxHttpClient(HttpClient):
+    """HttpClient implemented by httpx, using HTTP/2 by default.
+
+    Concurrent requests from any number of threads are multiplexed as
+    streams over at most ``max_connections`` connections, instead of
+    needing one HTTP/1.1 connection per in-flight request.
+    """
+
+    TIMEOUT_EXCEPTIONS = (httpx.TimeoutException,)
+
+    DEFAULT_MAX_CONNECTIONS = 4
+
+    def __init__(self, timeout=HttpClient.DEFAULT_TIMEOUT, http2=True,
+                 max_connections=DEFAULT_MAX_CONNECTIONS, client=None):
+        """__init__ method.
+
+        :param timeout: (optional) How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is :py:attr:`DEFAULT_TIMEOUT`
+        :type timeout: float | tuple(float, float)
+        :param bool http2: (optional) If False, use HTTP/1.1 only
+        :param int max_connections: (optional) Maximum number of connections.
+            Default is :py:attr:`DEFAULT_MAX_CONNECTIONS`
+        :param client: (optional) Externally configured client.
+            If given, http2 and max_connections are ignored.
+        :type client: :py:class:`httpx.Client`
+        """
+        super(HttpxHttpClient, self).__init__(timeout)
+
+        if client is None:
+            client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections)
+            )
+        self.client = client
+
+    def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        """GET request.
+
+        :param str url: Request url
+        :param dict headers: (optional) Request headers
+        :param dict params: (optional) Request query parameter
+        :param bool stream: (optional) get content as stream
+        :param timeout: (optional), How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is :py:attr:`self.timeout`
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`HttpxHttpResponse`
+        :return: HttpxHttpResponse instance
+        """
+        request = self.client.build_request(
+            'GET', url, headers=headers, params=params,
+            timeout=self.__get_timeout(timeout)
+        )
+        response = self.client.send(request, stream=stream)
+
+        return HttpxHttpResponse(response)
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        """POST request.
+
+        :param str url: Request url
+        :param dict headers: (optional) Request headers
+        :param data: (optional) Dictionary, bytes, or file-like object to send in the body
+        :param timeout: (optional), How long to wait for the server
+            to send data before giving up, as a float,
+            or a (connect timeout, readtimeout) float tuple.
+            Default is :py:attr:`self.timeout`
+        :type timeout: float | tuple(float, float)
+        :rtype: :py:class:`HttpxHttpResponse`
+        :return: HttpxHttpResponse instance
+        """
+        if isinstance(data, dict):
+            kwargs = {'data': data}
+        else:
+            kwargs = {'content': data}
+
+        response = self.client.post(
+            url, headers=headers, timeout=self.__get_timeout(timeout), **kwargs
+        )
+
+        return HttpxHttpResponse(response)
+
+    def close(self):
+        """Close the client and its connections."""
+        self.client.close()
+
+    def __get_timeout(self, timeout):
+        if timeout is None:
+            timeout = self.timeout
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+
+class HttpxHttpResponse(HttpResponse):
+    """HttpResponse implemented by httpx lib's response."""
+
+    def __init__(self, response):
+        """__init__ method.
+
+        :param response: httpx lib's response
+        """
+        self.response = response
+
+    @property
+    def status_code(self):
+        """Get status code."""
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        """Get headers."""
+        return self.response.headers
+
+    @property
+    def text(self):
+        """Get request body as text-decoded."""
+        self.response.read()
+        return self.response.text
+
+    @property
+    def content(self):
+        """Get request body as binary."""
+        return self.response.read()
+
+    @property
+    def json(self):
+        """Get request body as json-decoded."""
+        return json_codec.loads(self.response.read())
+
+    def iter_content(self, chunk_size=1024, decode_unicode=False):
+        """Get request body as iterator content (stream).
+
+        :param int chunk_size:
+        :param bool decode_unicode:
+        """
+        if decode_unicode:
+            return self.response.iter_text(chunk_size=chunk_size)
+        return self.response.iter_bytes(chunk_size=chunk_size)
+
+    def close(self):
+        """Release the connection of this response back to the pool."""
+        self.response.close()
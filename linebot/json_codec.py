@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.json_codec module.
+
+JSON encoding and decoding of request and response bodies.
+
+The fastest installed backend is used: orjson, then ujson,
+then the standard json module. Bodies are encoded to UTF-8 bytes,
+and bytes are decoded directly, without a round trip through text.
+"""
+
+from __future__ import unicode_literals
+
+import json
+import sys
+
+from future.utils import PY3
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj)
+
+
+def _orjson_loads(s):
+    if isinstance(s, memoryview):
+        s = s.tobytes()
+    return orjson.loads(s)
+
+
+def _ujson_dumps(obj):
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+
+def _ujson_loads(s):
+    if isinstance(s, memoryview):
+        s = s.tobytes()
+    return ujson.loads(s)
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(s):
+    if isinstance(s, memoryview):
+        s = s.tobytes()
+    # the json module does not take bytes before Python 3.6
+    if isinstance(s, bytes) and not (PY3 and sys.version_info >= (3, 6)):
+        s = s.decode('utf-8')
+    return json.loads(s)
+
+
+_BACKENDS = {
+    'orjson': (_orjson_dumps, _orjson_loads) if orjson is not None else None,
+    'ujson': (_ujson_dumps, _ujson_loads) if ujson is not None else None,
+    'json': (_json_dumps, _json_loads),
+}
+
+#: Name of the backend in use: 'orjson', 'ujson' or 'json'
+BACKEND = None
+
+_dumps = None
+
+_loads = None
+
+
+def set_backend(name):
+    """Set the JSON backend.
+
+    :param str name: 'orjson', 'ujson' or 'json'
+    :raises: ValueError if the backend is unknown or not installed
+    """
+    global BACKEND, _dumps, _loads
+
+    if _BACKENDS.get(name) is None:
+        raise ValueError('JSON backend is not available. name=' + name)
+    BACKEND = name
+    _dumps, _loads = _BACKENDS[name]
+
+
+def dumps(obj):
+    """Encode an object as JSON.
+
+    :param obj: JSON-compatible object (dict, list, str, number, bool or None)
+    :rtype: bytes
+    :return: UTF-8 encoded JSON
+    """
+    return _dumps(obj)
+
+
+def loads(s):
+    """Decode JSON.
+
+    :param s: JSON document (as text, or as UTF-8 encoded bytes)
+    :type s: str | bytes | memoryview
+    :return: decoded object
+    """
+    return _loads(s)
+
+
+set_backend(next(name for name in ('orjson', 'ujson', 'json') if _BACKENDS[name] is not None))
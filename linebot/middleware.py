@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.middleware module.
+
+Middleware wraps the stages of webhook processing:
+
+* ``validate``: signature check. ``call_next(body, signature)`` returns a bool
+* ``decode``: JSON decoding of the body. ``call_next(body)`` returns the
+  decoded JSON
+* ``decode_event``: with iter_parse, JSON decoding of the next event.
+  ``call_next(body)`` returns the decoded event, or a private end marker
+* ``build``: creation of an event object. ``call_next(event_json)`` returns
+  the event, or None if its type is unknown
+* ``handler``: call of a handler. ``call_next(func, event)`` calls func.
+  Under handle_async, coroutine handlers run through ``process_stage_async``
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import functools
+import sys
+import threading
+import time
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class Middleware(object):
+    """Base class of webhook middleware.
+
+    Set ``process_stage_async`` to a coroutine function with the arguments of
+    process_stage, whose ``call_next(*args)`` returns an awaitable, to wrap
+    coroutine handlers under handle_async until they finish. Without it,
+    process_stage wraps only the call returning the coroutine.
+    """
+
+    process_stage_async = None
+
+    def process_stage(self, stage, call_next, *args):
+        """Process a stage.
+
+        Override to run code around the stage. Call ``call_next(*args)`` to
+        run the rest of the chain and the stage itself, and return its result;
+        or return without calling it to skip the stage.
+
+        :param str stage: 'validate', 'decode', 'decode_event', 'build' or 'handler'
+        :param call_next: Rest of the chain
+        :param args: Arguments of the stage
+        :return: Result of the stage
+        """
+        return call_next(*args)
+
+
+class MiddlewareChain(object):
+    """Ordered middleware, shared by a WebhookHandler and its WebhookParser.
+
+    The first middleware added is the outermost one.
+    """
+
+    def __init__(self, middlewares=None):
+        """__init__ method.
+
+        :param middlewares: (optional) Initial middleware
+        :type middlewares: list[T <= :py:class:`Middleware`]
+        """
+        self.middlewares = list(middlewares or [])
+
+    def use(self, middleware):
+        """Add middleware at the end of the chain.
+
+        :param middleware: Middleware
+        :type middleware: T <= :py:class:`Middleware`
+        :rtype: T <= :py:class:`Middleware`
+        :return: middleware
+        """
+        self.middlewares.append(middleware)
+        return middleware
+
+    def run(self, stage, func, *args):
+        """Run a stage through the chain.
+
+        :param str stage: Stage name
+        :param func: Stage itself
+        :param args: Arguments of the stage
+        :return: Result of the stage
+        """
+        if not self.middlewares:
+            return func(*args)
+
+        call = func
+        for middleware in reversed(self.middlewares):
+            call = functools.partial(middleware.process_stage, stage, call)
+        return call(*args)
+
+
+class TimingMiddleware(Middleware):
+    """Middleware recording a latency histogram of each stage.
+
+    Handler calls are recorded per handler function.
+    """
+
+    DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """__init__ method.
+
+        :param buckets: (optional) Upper bounds of the histogram buckets, in seconds
+        :type buckets: list[float]
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def process_stage(self, stage, call_next, *args):
+        """Run the stage and record its duration, whether it succeeds or raises.
+
+        :param str stage: Stage name
+        :param call_next: Rest of the chain
+        :param args: Arguments of the stage
+        :return: Result of the stage
+        """
+        started = _clock()
+        try:
+            return call_next(*args)
+        finally:
+            self._observe_stage(stage, _clock() - started, args)
+
+    if sys.version_info >= (3, 5):
+        from .async_middleware import timing_process_stage_async as process_stage_async
+
+    def observe(self, stage, seconds, handler=None):
+        """Record a duration.
+
+        :param str stage: Stage name
+        :param float seconds: Duration
+        :param str handler: (optional) Name of the handler function
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get((stage, handler))
+            if histogram is None:
+                histogram = self._histograms[(stage, handler)] = [
+                    [0] * (len(self.buckets) + 1), 0, 0.0]
+            histogram[0][index] += 1
+            histogram[1] += 1
+            histogram[2] += seconds
+
+    def _observe_stage(self, stage, seconds, args):
+        handler = _get_func_name(args[0]) if stage == 'handler' else None
+        self.observe(stage, seconds, handler=handler)
+
+    def snapshot(self):
+        """Get the recorded histograms.
+
+        :rtype: dict
+        :return: Dict of (stage, handler name or None) to a dict of
+            ``count``, ``sum`` (seconds) and ``buckets``, the list of
+            (upper bound, cumulative count) ending with (inf, count)
+        """
+        with self._lock:
+            histograms = [(key, list(counts), count, total)
+                          for key, (counts, count, total) in self._histograms.items()]
+
+        snapshot = {}
+        for key, counts, count, total in histograms:
+            cumulative = 0
+            buckets = []
+            for upper, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                buckets.append((upper, cumulative))
+            snapshot[key] = {'count': count, 'sum': total, 'buckets': buckets}
+        return snapshot
+
+    def render_prometheus(self, name='linebot_webhook_stage_seconds'):
+        """Render the histograms in the Prometheus text exposition format.
+
+        :param str name: (optional) Metric name
+        :rtype: str
+        :return: Metrics text
+        """
+        lines = [
+            '# HELP {0} Latency of webhook processing stages.'.format(name),
+            '# TYPE {0} histogram'.format(name),
+        ]
+        for (stage, handler), histogram in sorted(
+                self.snapshot().items(), key=lambda item: (item[0][0], item[0][1] or '')):
+            labels = 'stage="{0}"'.format(_escape_label(stage))
+            if handler is not None:
+                labels += ',handler="{0}"'.format(_escape_label(handler))
+            for upper, count in histogram['buckets']:
+                lines.append('{0}_bucket{{{1},le="{2}"}} {3}'.format(
+                    name, labels, '+Inf' if upper == float('inf') else repr(float(upper)), count))
+            lines.append('{0}_sum{{{1}}} {2!r}'.format(name, labels, histogram['sum']))
+            lines.append('{0}_count{{{1}}} {2}'.format(name, labels, histogram['count']))
+        return '\n'.join(lines) + '\n'
+
+
+def _get_func_name(func):
+    return getattr(func, '__qualname__', None) or getattr(func, '__name__', repr(func))
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
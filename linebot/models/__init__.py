@@ -55,6 +55,7 @@ from .responses import (  # noqa
 )
 from .send_messages import (  # noqa
     SendMessage,
+    FrozenSendMessage,
     TextSendMessage,
     ImageSendMessage,
     VideoSendMessage,
@@ -16,8 +16,11 @@
 
 from __future__ import unicode_literals
 
+import inspect
 import json
 
+from future.utils import text_type
+
 from .. import utils
 
 
@@ -25,8 +28,14 @@ class Base(object):
     """Base class of model.
 
     Suitable for JSON base data.
+
+    Models keep their attributes in ``__slots__``. Other attributes, set
+    ad hoc or by subclasses without ``__slots__``, are kept in ``__dict__``,
+    which is created on first use and serialized as well.
     """
 
+    __slots__ = ('__dict__',)
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -75,24 +84,47 @@ class Base(object):
     def as_json_dict(self):
         """Return dictionary from this object.
 
+        The camelCase keys are computed once per class, and the conversion
+        of each value is looked up by the value's type.
+
         :return: dict
         """
-        data = {}
-        for key in self.__dict__.keys():
-            camel_key = utils.to_camel_case(key)
-            if isinstance(getattr(self, key, None), (list, tuple, set)):
-                data[camel_key] = list()
-                for sub_obj in getattr(self, key, None):
-                    if getattr(sub_obj, 'as_json_dict', None):
-                        data[camel_key].append(sub_obj.as_json_dict())
-                    else:
-                        data[camel_key].append(sub_obj)
-
-            elif getattr(getattr(self, key, None), 'as_json_dict', None):
-                data[camel_key] = getattr(self, key).as_json_dict()
+        fields = _json_fields.get(self.__class__)
+        if fields is None:
+            fields = _get_json_fields(self.__class__)
 
-            else:
-                data[camel_key] = getattr(self, key, None)
+        data = {}
+        for name, camel_key in fields:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+
+            try:
+                convert = _json_converters[value.__class__]
+            except KeyError:
+                convert = _get_json_converter(value.__class__)
+            data[camel_key] = value if convert is None else convert(value)
+
+        attributes = getattr(self, '__dict__', None)
+        if attributes:
+            keys = _json_keys.get(self.__class__)
+            if keys is None:
+                keys = _json_keys[self.__class__] = {}
+
+            for key, value in attributes.items():
+                try:
+                    camel_key = keys[key]
+                except KeyError:
+                    camel_key = _get_json_key(keys, key)
+                if camel_key is None:
+                    continue
+
+                try:
+                    convert = _json_converters[value.__class__]
+                except KeyError:
+                    convert = _get_json_converter(value.__class__)
+                data[camel_key] = value if convert is None else convert(value)
 
         return data
 
@@ -100,15 +132,82 @@ class Base(object):
     def new_from_json_dict(cls, data):
         """Create a new instance from a dict.
 
+        The snake_case names of the keys are looked up in a table of the class,
+        made from the arguments of its __init__ and the keys seen so far.
+
         :param data: JSON dict
         :rtype:
         :return:
         """
-        new_data = {utils.to_snake_case(key): value
-                    for key, value in data.items()}
+        keys = _snake_case_keys.get(cls)
+        if keys is None:
+            keys = _get_snake_case_keys(cls)
+
+        new_data = {}
+        for key, value in data.items():
+            try:
+                new_data[keys[key]] = value
+            except KeyError:
+                new_data[_get_snake_case_key(keys, key)] = value
 
         return cls(**new_data)
 
+    @classmethod
+    def new_lazy_from_json_dict(cls, data):
+        """Create a new instance from a dict, building nested objects on first access.
+
+        Scalar values are set at once. Nested dicts and lists are kept as they are,
+        and converted the first time their attribute is read.
+        The instance is of a subclass of cls, so isinstance checks still work.
+
+        :param data: JSON dict
+        :rtype:
+        :return:
+        """
+        lazy_cls = _get_lazy_class(cls)
+        if lazy_cls is None:
+            return cls.new_from_json_dict(data)
+
+        keys = _snake_case_keys.get(cls)
+        if keys is None:
+            keys = _get_snake_case_keys(cls)
+
+        defaults = lazy_cls._lazy_defaults
+        raw = {}
+        values = {}
+        for key, value in data.items():
+            name = keys.get(key)
+            if name is None:
+                name = _get_snake_case_key(keys, key)
+            if name not in defaults:
+                continue
+            if isinstance(value, (dict, list)):
+                raw[name] = value
+            else:
+                values[name] = value
+
+        obj = lazy_cls.__new__(lazy_cls)
+        obj._lazy_raw = raw
+        for name, default in defaults.items():
+            if name not in raw:
+                setattr(obj, name, values.get(name, default))
+
+        return obj
+
+    @classmethod
+    def _new_nested_from_json(cls, name, value):
+        """Build the value of one attribute from its JSON value.
+
+        Used by lazy instances to build only the attribute being read.
+        Models with nested objects override this for those attributes;
+        by default the value is converted by __init__ of a new instance.
+
+        :param str name: Attribute name
+        :param value: JSON value
+        :return:
+        """
+        return getattr(cls(**{name: value}), name)
+
     @staticmethod
     def get_or_new_from_json_dict(data, cls):
         """Helper function.
@@ -153,3 +252,183 @@ class Base(object):
                 return cls_map[type_val].new_from_json_dict(data)
 
         return None
+
+
+# JSON keys, to snake_case attribute names of each class
+_snake_case_keys = {}
+
+_SNAKE_CASE_KEYS_MAX_SIZE = 256
+
+# slots of each class, with their camelCase keys
+_json_fields = {}
+
+# __dict__ attribute names of each class, to camelCase keys (None for private attributes)
+_json_keys = {}
+
+_JSON_KEYS_MAX_SIZE = 256
+
+# value types, to functions converting them (None to keep values as they are)
+_json_converters = {}
+
+_JSON_CONVERTERS_MAX_SIZE = 1024
+
+_JSON_PLAIN_TYPES = (type(None), bool, int, float, text_type, bytes, dict)
+
+_lazy_classes = {}
+
+
+def _get_snake_case_keys(cls):
+    keys = {}
+    try:
+        if utils.PY3:
+            names = inspect.getfullargspec(cls.__init__).args[1:]
+        else:
+            names = inspect.getargspec(cls.__init__).args[1:]
+    except TypeError:
+        names = []
+
+    for name in names:
+        keys[name] = name
+        camel_key = utils.to_camel_case(name)
+        if utils.to_snake_case(camel_key) == name:
+            keys[camel_key] = name
+
+    _snake_case_keys[cls] = keys
+    return keys
+
+
+def _get_snake_case_key(keys, key):
+    name = utils.to_snake_case(key)
+    # keys of a payload must not grow the table without limit
+    if len(keys) < _SNAKE_CASE_KEYS_MAX_SIZE:
+        keys[key] = name
+    return name
+
+
+def _get_slot_names(cls):
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, (text_type, str)):
+            slots = (slots,)
+        for name in slots:
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return names
+
+
+def _get_attributes(obj):
+    attributes = {}
+    for name in _get_slot_names(obj.__class__):
+        try:
+            attributes[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    attributes.update(getattr(obj, '__dict__', {}))
+    return attributes
+
+
+def _get_json_fields(cls):
+    fields = tuple((name, utils.to_camel_case(name))
+                   for name in _get_slot_names(cls) if not name.startswith('_'))
+    _json_fields[cls] = fields
+    return fields
+
+
+def _get_json_key(keys, key):
+    camel_key = None if key.startswith('_') else utils.to_camel_case(key)
+    # attributes set on single instances must not grow the table without limit
+    if len(keys) < _JSON_KEYS_MAX_SIZE:
+        keys[key] = camel_key
+    return camel_key
+
+
+def _get_json_converter(value_class):
+    if issubclass(value_class, (list, tuple, set)):
+        convert = _sequence_as_json
+    elif issubclass(value_class, Base):
+        convert = _model_as_json
+    elif value_class in _JSON_PLAIN_TYPES:
+        convert = None
+    else:
+        convert = _value_as_json
+
+    if len(_json_converters) < _JSON_CONVERTERS_MAX_SIZE:
+        _json_converters[value_class] = convert
+    return convert
+
+
+def _model_as_json(value):
+    return value.as_json_dict()
+
+
+def _value_as_json(value):
+    as_json_dict = getattr(value, 'as_json_dict', None)
+    return as_json_dict() if as_json_dict else value
+
+
+def _sequence_as_json(values):
+    return [_value_as_json(value) for value in values]
+
+
+def _get_lazy_class(cls):
+    try:
+        return _lazy_classes[cls]
+    except KeyError:
+        pass
+
+    try:
+        defaults = _get_attributes(cls())
+    except TypeError:
+        # __init__ has required arguments
+        lazy_cls = None
+    else:
+        lazy_cls = type(cls)(str('Lazy' + cls.__name__), (cls,), {
+            '__doc__': cls.__doc__,
+            '__module__': cls.__module__,
+            '__slots__': ('_lazy_raw',),
+            '_lazy_defaults': defaults,
+            '__getattr__': _lazy_getattr,
+            '__reduce_ex__': _lazy_reduce_ex,
+            'as_json_dict': _lazy_as_json_dict,
+        })
+
+    _lazy_classes[cls] = lazy_cls
+    return lazy_cls
+
+
+def _lazy_getattr(self, name):
+    # also reached while _lazy_raw itself is not set yet, e.g. by copy
+    if name == '_lazy_raw' or name.startswith('__'):
+        raise AttributeError(name)
+    raw = self._lazy_raw
+    if name not in raw:
+        raise AttributeError(name)
+
+    # let the model build the nested object, as new_from_json_dict would
+    value = self.__class__.__bases__[0]._new_nested_from_json(name, raw[name])
+    setattr(self, name, value)
+    raw.pop(name, None)
+    return value
+
+
+def _lazy_materialize(self):
+    for name in list(self._lazy_raw):
+        getattr(self, name)
+
+
+def _lazy_as_json_dict(self):
+    _lazy_materialize(self)
+    return Base.as_json_dict(self)
+
+
+def _lazy_reduce_ex(self, protocol):
+    # lazy classes are not importable, so pickle and copy as the eager class
+    _lazy_materialize(self)
+    state = _get_attributes(self)
+    del state['_lazy_raw']
+    return _new_model, (self.__class__.__bases__[0],), (None, state)
+
+
+def _new_model(cls):
+    return cls.__new__(cls)
@@ -25,6 +25,8 @@ class Error(Base):
     https://devdocs.line.me/en/#error-response
     """
 
+    __slots__ = ('message', 'details')
+
     def __init__(self, message=None, details=None, **kwargs):
         """__init__ method.
 
@@ -53,6 +55,8 @@ class ErrorDetail(Base):
     https://devdocs.line.me/en/#error-response
     """
 
+    __slots__ = ('message', 'property')
+
     def __init__(self, message=None, property=None, **kwargs):
         """__init__ method.
 
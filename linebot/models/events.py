@@ -31,6 +31,21 @@ from .messages import (
 )
 from .sources import SourceUser, SourceGroup, SourceRoom
 
+SOURCE_TYPES = {
+    'user': SourceUser,
+    'group': SourceGroup,
+    'room': SourceRoom,
+}
+
+MESSAGE_TYPES = {
+    'text': TextMessage,
+    'image': ImageMessage,
+    'video': VideoMessage,
+    'audio': AudioMessage,
+    'location': LocationMessage,
+    'sticker': StickerMessage,
+}
+
 
 class Event(with_metaclass(ABCMeta, Base)):
     """Abstract Base Class of Webhook Event.
@@ -38,6 +53,8 @@ class Event(with_metaclass(ABCMeta, Base)):
     https://devdocs.line.me/en/#webhook-event-object
     """
 
+    __slots__ = ('type', 'timestamp', 'source', '_reply_token_expired')
+
     def __init__(self, timestamp=None, source=None, **kwargs):
         """__init__ method.
 
@@ -51,13 +68,26 @@ class Event(with_metaclass(ABCMeta, Base)):
         self.type = None
         self.timestamp = timestamp
         self.source = self.get_or_new_from_json_dict_with_types(
-            source, {
-                'user': SourceUser,
-                'group': SourceGroup,
-                'room': SourceRoom,
-            }
+            source, SOURCE_TYPES
         )
 
+    @classmethod
+    def _new_nested_from_json(cls, name, value):
+        if name == 'source':
+            return cls.get_or_new_from_json_dict_with_types(value, SOURCE_TYPES)
+        return super(Event, cls)._new_nested_from_json(name, value)
+
+    @property
+    def reply_token_expired(self):
+        """Get whether the reply token of this event can no longer be used.
+
+        Set by WebhookHandler when the event waited in its background queue
+        longer than the reply token is valid. Reply with push_message instead.
+
+        :rtype: bool
+        """
+        return getattr(self, '_reply_token_expired', False)
+
 
 class MessageEvent(Event):
     """Webhook MessageEvent.
@@ -69,6 +99,8 @@ class MessageEvent(Event):
     You can reply to message events.
     """
 
+    __slots__ = ('reply_token', 'message')
+
     def __init__(self, timestamp=None, source=None, reply_token=None, message=None, **kwargs):
         """__init__ method.
 
@@ -87,16 +119,15 @@ class MessageEvent(Event):
         self.type = 'message'
         self.reply_token = reply_token
         self.message = self.get_or_new_from_json_dict_with_types(
-            message, {
-                'text': TextMessage,
-                'image': ImageMessage,
-                'video': VideoMessage,
-                'audio': AudioMessage,
-                'location': LocationMessage,
-                'sticker': StickerMessage
-            }
+            message, MESSAGE_TYPES
         )
 
+    @classmethod
+    def _new_nested_from_json(cls, name, value):
+        if name == 'message':
+            return cls.get_or_new_from_json_dict_with_types(value, MESSAGE_TYPES)
+        return super(MessageEvent, cls)._new_nested_from_json(name, value)
+
 
 class FollowEvent(Event):
     """Webhook FollowEvent.
@@ -107,6 +138,8 @@ class FollowEvent(Event):
     You can reply to follow events.
     """
 
+    __slots__ = ('reply_token',)
+
     def __init__(self, timestamp=None, source=None, reply_token=None, **kwargs):
         """__init__ method.
 
@@ -132,6 +165,8 @@ class UnfollowEvent(Event):
     Event object for when your account is blocked.
     """
 
+    __slots__ = ()
+
     def __init__(self, timestamp=None, source=None, **kwargs):
         """__init__ method.
 
@@ -156,6 +191,8 @@ class JoinEvent(Event):
     You can reply to join events.
     """
 
+    __slots__ = ('reply_token',)
+
     def __init__(self, timestamp=None, source=None, reply_token=None, **kwargs):
         """__init__ method.
 
@@ -181,6 +218,8 @@ class LeaveEvent(Event):
     Event object for when your account leaves a group.
     """
 
+    __slots__ = ()
+
     def __init__(self, timestamp=None, source=None, **kwargs):
         """__init__ method.
 
@@ -206,6 +245,8 @@ class PostbackEvent(Event):
     You can reply to postback events.
     """
 
+    __slots__ = ('reply_token', 'postback')
+
     def __init__(self, timestamp=None, source=None, reply_token=None, postback=None, **kwargs):
         """__init__ method.
 
@@ -227,6 +268,12 @@ class PostbackEvent(Event):
             postback, Postback
         )
 
+    @classmethod
+    def _new_nested_from_json(cls, name, value):
+        if name == 'postback':
+            return cls.get_or_new_from_json_dict(value, Postback)
+        return super(PostbackEvent, cls)._new_nested_from_json(name, value)
+
 
 class BeaconEvent(Event):
     """Webhook BeaconEvent.
@@ -236,6 +283,8 @@ class BeaconEvent(Event):
     Event object for when a user detects a LINE Beacon. You can reply to beacon events.
     """
 
+    __slots__ = ('reply_token', 'beacon')
+
     def __init__(self, timestamp=None, source=None, reply_token=None,
                  beacon=None, **kwargs):
         """__init__ method.
@@ -258,6 +307,12 @@ class BeaconEvent(Event):
             beacon, Beacon
         )
 
+    @classmethod
+    def _new_nested_from_json(cls, name, value):
+        if name == 'beacon':
+            return cls.get_or_new_from_json_dict(value, Beacon)
+        return super(BeaconEvent, cls)._new_nested_from_json(name, value)
+
 
 class Postback(Base):
     """Postback.
@@ -265,6 +320,8 @@ class Postback(Base):
     https://devdocs.line.me/en/#postback-event
     """
 
+    __slots__ = ('data',)
+
     def __init__(self, data=None, **kwargs):
         """__init__ method.
 
@@ -282,6 +339,8 @@ class Beacon(Base):
     https://devdocs.line.me/en/#beacon-event
     """
 
+    __slots__ = ('type', 'hwid')
+
     def __init__(self, type=None, hwid=None, **kwargs):
         """__init__ method.
 
@@ -293,3 +352,27 @@ class Beacon(Base):
 
         self.type = type
         self.hwid = hwid
+
+
+EVENT_TYPES = {
+    'message': MessageEvent,
+    'follow': FollowEvent,
+    'unfollow': UnfollowEvent,
+    'join': JoinEvent,
+    'leave': LeaveEvent,
+    'postback': PostbackEvent,
+    'beacon': BeaconEvent,
+}
+
+
+def register_event_type(event_type, cls):
+    """Register an Event class for a webhook event type.
+
+    WebhookParser creates events of this type with the class.
+    Registering an existing type replaces its class.
+
+    :param str event_type: Value of the type field of the webhook event
+    :param cls: Event class
+    :type cls: T <= :py:class:`linebot.models.events.Event` class
+    """
+    EVENT_TYPES[event_type] = cls
@@ -33,6 +33,8 @@ class ImagemapSendMessage(SendMessage):
     or multiple links which correspond to different regions of the image.
     """
 
+    __slots__ = ('base_url', 'alt_text', 'base_size', 'actions')
+
     def __init__(self, base_url=None, alt_text=None, base_size=None, actions=None, **kwargs):
         """__init__ method.
 
@@ -74,6 +76,8 @@ class BaseSize(Base):
     https://devdocs.line.me/en/#imagemap-message
     """
 
+    __slots__ = ('width', 'height')
+
     def __init__(self, width=None, height=None, **kwargs):
         """__init__ method.
 
@@ -96,6 +100,8 @@ class ImagemapAction(with_metaclass(ABCMeta, Base)):
     https://devdocs.line.me/en/#imagemap-message
     """
 
+    __slots__ = ('type',)
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -112,6 +118,8 @@ class URIImagemapAction(ImagemapAction):
     https://devdocs.line.me/en/#imagemap-message
     """
 
+    __slots__ = ('link_uri', 'area')
+
     def __init__(self, link_uri=None, area=None, **kwargs):
         """__init__ method.
 
@@ -133,6 +141,8 @@ class MessageImagemapAction(ImagemapAction):
     https://devdocs.line.me/en/#imagemap-message
     """
 
+    __slots__ = ('text', 'area')
+
     def __init__(self, text=None, area=None, **kwargs):
         """__init__ method.
 
@@ -157,6 +167,8 @@ class ImagemapArea(Base):
     The top left is used as the origin of the area.
     """
 
+    __slots__ = ('x', 'y', 'width', 'height')
+
     def __init__(self, x=None, y=None, width=None, height=None, **kwargs):
         """__init__ method.
 
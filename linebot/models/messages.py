@@ -26,6 +26,8 @@ from .base import Base
 class Message(with_metaclass(ABCMeta, Base)):
     """Abstract Base Class of Message."""
 
+    __slots__ = ('type', 'id')
+
     def __init__(self, id=None, **kwargs):
         """__init__ method.
 
@@ -46,6 +48,8 @@ class TextMessage(Message):
     Message object which contains the text sent from the source.
     """
 
+    __slots__ = ('text',)
+
     def __init__(self, id=None, text=None, **kwargs):
         """__init__ method.
 
@@ -68,6 +72,8 @@ class ImageMessage(Message):
     The binary image data can be retrieved with the Content API.
     """
 
+    __slots__ = ()
+
     def __init__(self, id=None, **kwargs):
         """__init__ method.
 
@@ -88,6 +94,8 @@ class VideoMessage(Message):
     The binary video data can be retrieved with the Content API.
     """
 
+    __slots__ = ()
+
     def __init__(self, id=None, **kwargs):
         """__init__ method.
 
@@ -108,6 +116,8 @@ class AudioMessage(Message):
     The binary audio data can be retrieved with the Content API.
     """
 
+    __slots__ = ()
+
     def __init__(self, id=None, **kwargs):
         """__init__ method.
 
@@ -125,6 +135,8 @@ class LocationMessage(Message):
     https://devdocs.line.me/en/#location-message
     """
 
+    __slots__ = ('title', 'address', 'latitude', 'longitude')
+
     def __init__(self, id=None, title=None, address=None, latitude=None, longitude=None,
                  **kwargs):
         """__init__ method.
@@ -154,6 +166,8 @@ class StickerMessage(Message):
     For a list of basic LINE stickers and sticker IDs, see sticker list.
     """
 
+    __slots__ = ('package_id', 'sticker_id')
+
     def __init__(self, id=None, package_id=None, sticker_id=None, **kwargs):
         """__init__ method.
 
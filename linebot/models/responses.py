@@ -25,6 +25,8 @@ class Profile(Base):
     https://devdocs.line.me/en/#bot-api-get-profile
     """
 
+    __slots__ = ('display_name', 'user_id', 'picture_url', 'status_message')
+
     def __init__(self, display_name=None, user_id=None, picture_url=None,
                  status_message=None, **kwargs):
         """__init__ method.
@@ -49,6 +51,8 @@ class MessageContent(object):
     https://devdocs.line.me/ja/#get-content
     """
 
+    __slots__ = ('response',)
+
     def __init__(self, response):
         """__init__ method.
 
@@ -87,3 +91,145 @@ class MessageContent(object):
         :return:
         """
         return self.response.iter_content(chunk_size=chunk_size)
+
+
+class AsyncMessageContent(object):
+    """AsyncMessageContent.
+
+    MessageContent returned by :py:class:`linebot.async_api.AsyncLineBotApi`.
+
+    https://devdocs.line.me/ja/#get-content
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(self, response):
+        """__init__ method.
+
+        :param response: AsyncHttpResponse object
+        :type response: T <= :py:class:`linebot.async_http_client.AsyncHttpResponse`
+        """
+        self.response = response
+
+    @property
+    def content_type(self):
+        """Get Content-type header value.
+
+        :rtype: str
+        :return: content-type header value
+        """
+        return self.response.headers.get('content-type')
+
+    def content(self):
+        """Read the whole content.
+
+        If content size is large, should use iter_content.
+
+        :return: awaitable of binary
+        """
+        return self.response.content()
+
+    def iter_content(self, chunk_size=1024):
+        """Get content as async iterator (stream).
+
+        If content size is large, should use this.
+
+        :param chunk_size: Chunk size
+        :rtype: async iterator
+        :return:
+        """
+        return self.response.iter_content(chunk_size=chunk_size)
+
+
+class PushResult(object):
+    """Result of a push to one recipient, or of one multicast chunk.
+
+    Yielded by :py:meth:`linebot.api.LineBotApi.push_messages_bulk`.
+    """
+
+    __slots__ = ('to', 'status', 'error')
+
+    SUCCESS = 'success'
+
+    ERROR = 'error'
+
+    TIMEOUT = 'timeout'
+
+    def __init__(self, to, status, error=None):
+        """__init__ method.
+
+        :param to: ID of the receiver, or IDs of a multicast chunk
+        :type to: str | list[str]
+        :param str status: :py:attr:`SUCCESS`, :py:attr:`ERROR` or :py:attr:`TIMEOUT`
+        :param error: (optional) Raised exception, e.g.
+            :py:class:`linebot.exceptions.LineBotApiError`
+        :type error: Exception
+        """
+        self.to = to
+        self.status = status
+        self.error = error
+
+    @property
+    def succeeded(self):
+        """Check whether the push succeeded.
+
+        :rtype: bool
+        """
+        return self.status == self.SUCCESS
+
+    def __repr__(self):
+        """__repr__ method.
+
+        :return:
+        """
+        return '<PushResult to={0} status={1} error={2!r}>'.format(
+            self.to, self.status, self.error)
+
+
+class MulticastResult(object):
+    """Aggregated result of a multicast split into chunks.
+
+    Returned by :py:meth:`linebot.api.LineBotApi.multicast`.
+    """
+
+    __slots__ = ('results',)
+
+    def __init__(self, results):
+        """__init__ method.
+
+        :param results: Result per chunk
+        :type results: list[:py:class:`PushResult`]
+        """
+        self.results = results
+
+    @property
+    def succeeded(self):
+        """Check whether every chunk succeeded.
+
+        :rtype: bool
+        """
+        return all(result.succeeded for result in self.results)
+
+    @property
+    def failed(self):
+        """Get results of the failed chunks.
+
+        :rtype: list[:py:class:`PushResult`]
+        """
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def failed_to(self):
+        """Get IDs of the receivers in the failed chunks.
+
+        :rtype: list[str]
+        """
+        return [to for result in self.failed for to in result.to]
+
+    def __repr__(self):
+        """__repr__ method.
+
+        :return:
+        """
+        return '<MulticastResult chunks={0} failed={1}>'.format(
+            len(self.results), len(self.failed))
@@ -16,16 +16,22 @@
 
 from __future__ import unicode_literals
 
+import re
 from abc import ABCMeta
 
-from future.utils import with_metaclass
+from future.utils import text_type, with_metaclass
 
+from .. import json_codec
+from ..exceptions import ValidationError
+from ..validation import validate_frozen_message
 from .base import Base
 
 
 class SendMessage(with_metaclass(ABCMeta, Base)):
     """Abstract Base Class of SendMessage."""
 
+    __slots__ = ('type',)
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -35,6 +41,146 @@ class SendMessage(with_metaclass(ABCMeta, Base)):
 
         self.type = None
 
+    def freeze(self, *placeholders):
+        """Serialize this message once, for sending it many times.
+
+        Each ``{name}`` in the string values of the message, for the names
+        given as placeholders, is filled in later by
+        :py:meth:`FrozenSendMessage.bind`.
+
+        The message is checked against the limits of the Messaging API
+        here, once, and the strings holding placeholders again as they
+        are bound.
+
+        :param placeholders: Names of the placeholders
+        :rtype: :py:class:`FrozenSendMessage`
+        :return: FrozenSendMessage instance
+        :raises: ValueError if a placeholder does not appear in the message
+        :raises: :py:class:`linebot.exceptions.ValidationError`
+            if the message, without its placeholders, exceeds a limit
+        """
+        placeholders = [text_type(name) for name in placeholders]
+        for name in placeholders:
+            if not _PLACEHOLDER_NAME.match(name):
+                raise ValueError('Invalid placeholder name. name=' + name)
+
+        message_json = self.as_json_dict()
+        body = json_codec.dumps(message_json)
+        if not placeholders:
+            validate_frozen_message(message_json, None)
+            return FrozenSendMessage((body,), ())
+
+        pattern = re.compile('\\{(' + '|'.join(placeholders) + ')\\}')
+        parts = re.compile(pattern.pattern.encode('utf-8')).split(body)
+        names = tuple(name.decode('utf-8') for name in parts[1::2])
+        missing = set(placeholders) - set(names)
+        if missing:
+            raise ValueError('Placeholder not found. names=' + ', '.join(sorted(missing)))
+
+        limits = validate_frozen_message(message_json, pattern)
+        return FrozenSendMessage(tuple(parts[0::2]), names, tuple(limits))
+
+
+class FrozenSendMessage(object):
+    """Message serialized by :py:meth:`SendMessage.freeze`.
+
+    It can be given to reply_message, push_message and multicast
+    in place of a SendMessage, once every placeholder is bound.
+    """
+
+    __slots__ = ('_segments', '_names', '_limits')
+
+    def __init__(self, segments, names, limits=()):
+        """__init__ method.
+
+        :param segments: JSON bytes before, between and after the placeholders
+        :type segments: tuple(bytes)
+        :param names: Placeholder names, one per gap between segments
+        :type names: tuple(str)
+        :param limits: (optional) Path, max length, length without placeholders
+            and placeholder names of each limited string holding placeholders
+        :type limits: tuple((str, int, int, tuple(str)))
+        """
+        self._segments = segments
+        self._names = names
+        self._limits = limits
+
+    @property
+    def placeholders(self):
+        """Get the names of the placeholders still to be bound.
+
+        :rtype: set(str)
+        """
+        return set(self._names)
+
+    def bind(self, **values):
+        """Fill in placeholders.
+
+        Values are JSON-escaped and spliced into the serialized message,
+        without rebuilding it. Placeholders not given stay unbound.
+
+        :param values: Value of each placeholder
+        :rtype: :py:class:`FrozenSendMessage`
+        :return: New FrozenSendMessage instance
+        :raises: ValueError if a value is given for an unknown placeholder
+        :raises: :py:class:`linebot.exceptions.ValidationError`
+            if a string with the values exceeds its limit
+        """
+        unknown = set(values) - set(self._names)
+        if unknown:
+            raise ValueError('Unknown placeholder. names=' + ', '.join(sorted(unknown)))
+
+        escaped = {}
+        for name, value in values.items():
+            value = values[name] = text_type(value)
+            escaped[name] = json_codec.dumps(value)[1:-1]
+
+        limits = []
+        for path, max_length, length, names in self._limits:
+            unbound = []
+            for name in names:
+                if name in values:
+                    length += len(values[name])
+                else:
+                    unbound.append(name)
+            if length > max_length:
+                raise ValidationError(path, max_length, length)
+            if unbound:
+                limits.append((path, max_length, length, tuple(unbound)))
+        segments = [self._segments[0]]
+        names = []
+        for name, segment in zip(self._names, self._segments[1:]):
+            if name in escaped:
+                segments[-1] += escaped[name] + segment
+            else:
+                names.append(name)
+                segments.append(segment)
+
+        return FrozenSendMessage(tuple(segments), tuple(names), tuple(limits))
+
+    def as_json_bytes(self):
+        """Return the serialized message.
+
+        :rtype: bytes
+        :return: UTF-8 encoded JSON
+        :raises: ValueError if a placeholder is not bound
+        """
+        if self._names:
+            raise ValueError(
+                'Placeholder not bound. names=' + ', '.join(sorted(self.placeholders)))
+        return self._segments[0]
+
+    def as_json_dict(self):
+        """Return dictionary from this message.
+
+        :return: dict
+        :raises: ValueError if a placeholder is not bound
+        """
+        return json_codec.loads(self.as_json_bytes())
+
+
+_PLACEHOLDER_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
 
 class TextSendMessage(SendMessage):
     """TextSendMessage.
@@ -42,6 +188,8 @@ class TextSendMessage(SendMessage):
     https://devdocs.line.me/en/#text
     """
 
+    __slots__ = ('text',)
+
     def __init__(self, text=None, **kwargs):
         """__init__ method.
 
@@ -60,6 +208,8 @@ class ImageSendMessage(SendMessage):
     https://devdocs.line.me/en/#image
     """
 
+    __slots__ = ('original_content_url', 'preview_image_url')
+
     def __init__(self, original_content_url=None, preview_image_url=None, **kwargs):
         """__init__ method.
 
@@ -88,6 +238,8 @@ class VideoSendMessage(SendMessage):
     https://devdocs.line.me/en/#video
     """
 
+    __slots__ = ('original_content_url', 'preview_image_url')
+
     def __init__(self, original_content_url=None, preview_image_url=None, **kwargs):
         """__init__ method.
 
@@ -116,6 +268,8 @@ class AudioSendMessage(SendMessage):
     https://devdocs.line.me/en/#audio
     """
 
+    __slots__ = ('original_content_url', 'duration')
+
     def __init__(self, original_content_url=None, duration=None, **kwargs):
         """__init__ method.
 
@@ -140,6 +294,8 @@ class LocationSendMessage(SendMessage):
     https://devdocs.line.me/en/#location
     """
 
+    __slots__ = ('title', 'address', 'latitude', 'longitude')
+
     def __init__(self, title=None, address=None, latitude=None, longitude=None, **kwargs):
         """__init__ method.
 
@@ -164,6 +320,8 @@ class StickerSendMessage(SendMessage):
     https://devdocs.line.me/en/#sticker
     """
 
+    __slots__ = ('package_id', 'sticker_id')
+
     def __init__(self, package_id=None, sticker_id=None, **kwargs):
         """__init__ method.
 
@@ -26,6 +26,8 @@ from .base import Base
 class Source(with_metaclass(ABCMeta, Base)):
     """Abstract Base Class of Source."""
 
+    __slots__ = ('type',)
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -56,6 +58,8 @@ class SourceUser(Source):
     JSON object which contains the source user of the event.
     """
 
+    __slots__ = ('user_id',)
+
     def __init__(self, user_id=None, **kwargs):
         """__init__ method.
 
@@ -87,6 +91,8 @@ class SourceGroup(Source):
     JSON object which contains the source group of the event.
     """
 
+    __slots__ = ('group_id',)
+
     def __init__(self, group_id=None, **kwargs):
         """__init__ method.
 
@@ -118,6 +124,8 @@ class SourceRoom(Source):
     JSON object which contains the source room of the event.
     """
 
+    __slots__ = ('room_id',)
+
     def __init__(self, room_id=None, **kwargs):
         """__init__ method.
 
@@ -51,6 +51,8 @@ class TemplateSendMessage(SendMessage):
     that can be used to interact with users through your bot.
     """
 
+    __slots__ = ('alt_text', 'template')
+
     def __init__(self, alt_text=None, template=None, **kwargs):
         """__init__ method.
 
@@ -75,6 +77,8 @@ class TemplateSendMessage(SendMessage):
 class Template(with_metaclass(ABCMeta, Base)):
     """Abstract Base Class of Template."""
 
+    __slots__ = ('type',)
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -93,6 +97,8 @@ class ButtonsTemplate(Template):
     Template message with an image, title, text, and multiple action buttons.
     """
 
+    __slots__ = ('text', 'title', 'thumbnail_image_url', 'actions')
+
     def __init__(self, text=None, title=None, thumbnail_image_url=None, actions=None, **kwargs):
         """__init__ method.
 
@@ -129,6 +135,8 @@ class ConfirmTemplate(Template):
     Template message with two action buttons.
     """
 
+    __slots__ = ('text', 'actions')
+
     def __init__(self, text=None, actions=None, **kwargs):
         """__init__ method.
 
@@ -154,6 +162,8 @@ class CarouselTemplate(Base):
     Template message with multiple columns which can be cycled like a carousel.
     """
 
+    __slots__ = ('type', 'columns')
+
     def __init__(self, columns=None, **kwargs):
         """__init__ method.
 
@@ -181,6 +191,8 @@ class CarouselColumn(Base):
     https://devdocs.line.me/en/#column-object
     """
 
+    __slots__ = ('text', 'title', 'thumbnail_image_url', 'actions')
+
     def __init__(self, text=None, title=None, thumbnail_image_url=None, actions=None, **kwargs):
         """__init__ method.
 
@@ -211,6 +223,8 @@ class CarouselColumn(Base):
 class TemplateAction(with_metaclass(ABCMeta, Base)):
     """Abstract Base Class of TemplateAction."""
 
+    __slots__ = ('type',)
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -233,6 +247,8 @@ class PostbackTemplateAction(TemplateAction):
     the string in the text field is sent as a message from the user.
     """
 
+    __slots__ = ('label', 'data', 'text')
+
     def __init__(self, label=None, data=None, text=None, **kwargs):
         """__init__ method.
 
@@ -262,6 +278,8 @@ class MessageTemplateAction(TemplateAction):
     the string in the text field is sent as a message from the user.
     """
 
+    __slots__ = ('label', 'text')
+
     def __init__(self, label=None, text=None, **kwargs):
         """__init__ method.
 
@@ -286,6 +304,8 @@ class URITemplateAction(TemplateAction):
     When this action is tapped, the URI specified in the uri field is opened.
     """
 
+    __slots__ = ('label', 'uri')
+
     def __init__(self, label=None, uri=None, **kwargs):
         """__init__ method.
 
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.outbox module."""
+
+from __future__ import unicode_literals
+
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+
+from . import json_codec
+from .api import _dump_messages
+from .exceptions import CircuitOpenError, LineBotApiError
+from .utils import LOGGER
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS outbox (
+    id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    endpoint_class TEXT NOT NULL,
+    data BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    lease_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, next_attempt_at);
+'''
+
+
+class Outbox(object):
+    """Durable spool of outgoing messages, drained by background sender workers.
+
+    push_message and multicast store the request in a local SQLite database
+    (WAL mode) and return immediately. Worker threads claim pending requests
+    in batches and send them with the given LineBotApi.
+
+    Delivery is at-least-once: a request is deleted only after the API accepted it,
+    and a request claimed by a process that died is sent again after lease_timeout.
+    Every request is sent with its spool ID as X-Line-Retry-Key,
+    so the API server ignores a duplicate delivery.
+    While the circuit of the LineBotApi's circuit breaker is open, requests
+    wait for it without using up their attempts.
+    """
+
+    DEFAULT_WORKERS = 4
+
+    DEFAULT_BATCH_SIZE = 10
+
+    DEFAULT_MAX_ATTEMPTS = 5
+
+    DEFAULT_BACKOFF = 1
+
+    DEFAULT_LEASE_TIMEOUT = 60
+
+    DEFAULT_POLL_INTERVAL = 1
+
+    DRAIN_RATE_WINDOW = 60
+
+    def __init__(self, line_bot_api, path, workers=DEFAULT_WORKERS,
+                 batch_size=DEFAULT_BATCH_SIZE, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 backoff=DEFAULT_BACKOFF, lease_timeout=DEFAULT_LEASE_TIMEOUT,
+                 poll_interval=DEFAULT_POLL_INTERVAL):
+        """__init__ method.
+
+        :param line_bot_api: LineBotApi used to send the spooled requests
+        :type line_bot_api: :py:class:`linebot.api.LineBotApi`
+        :param str path: Path of the SQLite database. Created if it does not exist
+        :param int workers: (optional) Number of sender threads
+        :param int batch_size: (optional) Number of requests a worker claims at once
+        :param int max_attempts: (optional) Attempts before a request is marked dead
+        :param float backoff: (optional) Wait before the n-th retry is
+            backoff * 2 ** (n - 1) seconds
+        :param float lease_timeout: (optional) Seconds a claimed request stays
+            invisible to other workers. Must be longer than sending a batch
+        :param float poll_interval: (optional) Seconds an idle worker waits
+            before looking for new requests
+        """
+        self.line_bot_api = line_bot_api
+        self.path = path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+
+        self._local = threading.local()
+        self._threads = []
+        self._stopping = threading.Event()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._sent = deque()
+        self._sent_total = 0
+        self._failed_total = 0
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        """__enter__ method.
+
+        Start the workers.
+
+        :rtype: :py:class:`Outbox`
+        :return: self
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method.
+
+        Stop the workers.
+        """
+        self.stop()
+
+    def push_message(self, to, messages):
+        """Spool a push message API call.
+
+        https://devdocs.line.me/en/#push-message
+
+        :param str to: ID of the receiver
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :rtype: str
+        :return: Spool ID, also used as retry key
+        """
+        return self._enqueue('/v2/bot/message/push', 'push', to, messages)
+
+    def multicast(self, to, messages):
+        """Spool a multicast API call.
+
+        https://devdocs.line.me/en/#multicast
+
+        :param to: IDs of the receivers.
+            Max: :py:attr:`linebot.api.LineBotApi.MULTICAST_MAX_RECIPIENTS`
+        :type to: list[str]
+        :param messages: Messages, or messages frozen by
+            :py:meth:`linebot.models.send_messages.SendMessage.freeze`.
+            Max: 5
+        :type messages: T <= :py:class:`linebot.models.send_messages.SendMessage` |
+            list[T <= :py:class:`linebot.models.send_messages.SendMessage`]
+        :rtype: str
+        :return: Spool ID, also used as retry key
+        """
+        return self._enqueue('/v2/bot/message/multicast', 'multicast', to, messages)
+
+    def start(self):
+        """Start the sender workers."""
+        self._stopping.clear()
+        for i in range(self.workers - len(self._threads)):
+            thread = threading.Thread(
+                target=self._run, name='linebot-outbox-{0}'.format(i))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=None):
+        """Stop the sender workers after their current batch.
+
+        Requests not sent yet stay in the spool.
+
+        :param float timeout: (optional) Seconds to wait for each worker
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def drain(self):
+        """Send every request that is ready now, in the calling thread.
+
+        :rtype: int
+        :return: Number of requests processed
+        """
+        processed = 0
+        while True:
+            count = self._process_batch()
+            if count == 0:
+                return processed
+            processed += count
+
+    @property
+    def depth(self):
+        """Get the number of requests waiting to be sent.
+
+        :rtype: int
+        """
+        return self._count('pending')
+
+    @property
+    def dead(self):
+        """Get the number of requests that failed permanently.
+
+        :rtype: int
+        """
+        return self._count('dead')
+
+    @property
+    def drain_rate(self):
+        """Get requests sent per second, over the last :py:attr:`DRAIN_RATE_WINDOW` seconds.
+
+        :rtype: float
+        """
+        with self._lock:
+            self._expire_sent(time.time())
+            return len(self._sent) / float(self.DRAIN_RATE_WINDOW)
+
+    def stats(self):
+        """Get metrics of this outbox.
+
+        :rtype: dict
+        :return: depth, dead, drain_rate, sent_total and failed_total
+        """
+        return {
+            'depth': self.depth,
+            'dead': self.dead,
+            'drain_rate': self.drain_rate,
+            'sent_total': self._sent_total,
+            'failed_total': self._failed_total,
+        }
+
+    def _enqueue(self, path, endpoint_class, to, messages):
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+
+        spool_id = str(uuid.uuid4())
+        data = (b'{"to":' + json_codec.dumps(to) + b',"messages":' +
+                _dump_messages(messages, self.line_bot_api.validation) + b'}')
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT INTO outbox (id, path, endpoint_class, data, next_attempt_at, created_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (spool_id, path, endpoint_class, data, now, now))
+        self._wakeup.set()
+        return spool_id
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                count = self._process_batch()
+            except Exception:
+                LOGGER.exception('Outbox worker failed')
+                count = 0
+            if count == 0:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def _process_batch(self):
+        rows = self._claim()
+        for spool_id, path, endpoint_class, data, attempts in rows:
+            try:
+                self.line_bot_api._post(
+                    path, data=data, endpoint_class=endpoint_class, retry_key=spool_id)
+            except CircuitOpenError as e:
+                # nothing was sent, so it is not an attempt
+                self._defer(spool_id, max(e.retry_after, self.poll_interval), e)
+            except Exception as e:
+                self._fail(spool_id, attempts + 1, e)
+            else:
+                self._succeed(spool_id)
+        return len(rows)
+
+    def _claim(self):
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                'SELECT id, path, endpoint_class, data, attempts FROM outbox'
+                ' WHERE status = \'pending\' AND next_attempt_at <= ? AND lease_until <= ?'
+                ' ORDER BY next_attempt_at LIMIT ?',
+                (now, now, self.batch_size)).fetchall()
+            conn.executemany(
+                'UPDATE outbox SET lease_until = ? WHERE id = ?',
+                [(now + self.lease_timeout, row[0]) for row in rows])
+        return rows
+
+    def _succeed(self, spool_id):
+        with self._connection() as conn:
+            conn.execute('DELETE FROM outbox WHERE id = ?', (spool_id,))
+
+        now = time.time()
+        with self._lock:
+            self._sent_total += 1
+            self._sent.append(now)
+            self._expire_sent(now)
+
+    def _fail(self, spool_id, attempts, error):
+        permanent = (isinstance(error, LineBotApiError) and
+                     400 <= error.status_code < 500 and error.status_code != 429)
+        if permanent or attempts >= self.max_attempts:
+            status = 'dead'
+            LOGGER.warning('Outbox request %s failed permanently: %r', spool_id, error)
+            with self._lock:
+                self._failed_total += 1
+        else:
+            status = 'pending'
+
+        with self._connection() as conn:
+            conn.execute(
+                'UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?,'
+                ' lease_until = 0, last_error = ? WHERE id = ?',
+                (status, attempts, time.time() + self.backoff * (2 ** (attempts - 1)),
+                 repr(error), spool_id))
+
+    def _defer(self, spool_id, delay, error):
+        with self._connection() as conn:
+            conn.execute(
+                'UPDATE outbox SET next_attempt_at = ?, lease_until = 0, last_error = ?'
+                ' WHERE id = ?',
+                (time.time() + delay, repr(error), spool_id))
+
+    def _count(self, status):
+        return self._connection().execute(
+            'SELECT COUNT(*) FROM outbox WHERE status = ?', (status,)).fetchone()[0]
+
+    def _expire_sent(self, now):
+        while self._sent and self._sent[0] < now - self.DRAIN_RATE_WINDOW:
+            self._sent.popleft()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.rate_limiter module."""
+
+from __future__ import unicode_literals
+
+import os
+import struct
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket.
+
+    Tokens are added at ``rate`` per second, up to ``capacity``.
+    A caller that finds the bucket empty reserves a future token
+    and waits for it, so waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """__init__ method.
+
+        :param float rate: Tokens added per second
+        :param float capacity: (optional) Maximum burst size. Default is rate
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._timestamp = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """Take tokens, and get seconds to wait until they are available.
+
+        :param float tokens: (optional) Number of tokens
+        :rtype: float
+        :return: seconds to wait
+        """
+        with self._lock:
+            self._tokens, self._timestamp, wait = _take(
+                self._tokens, self._timestamp, time.time(),
+                self.rate, self.capacity, tokens)
+        return wait
+
+    def acquire(self, tokens=1):
+        """Take tokens, waiting until they are available.
+
+        :param float tokens: (optional) Number of tokens
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket shared between processes through a local file.
+
+    The bucket state is kept in ``path`` and updated under an exclusive
+    file lock, so every process (e.g. each gunicorn worker) opening the
+    same path draws from one budget. Requires fcntl (POSIX).
+
+    The file is opened on first use in each process, so a bucket created
+    before a fork (e.g. with gunicorn's preload_app) does not share its
+    open file, and with it its lock, between the forked processes.
+    """
+
+    _STATE = struct.Struct('<dd')
+
+    def __init__(self, path, rate, capacity=None):
+        """__init__ method.
+
+        :param str path: Path of the state file. Created if it does not exist
+        :param float rate: Tokens added per second
+        :param float capacity: (optional) Maximum burst size. Default is rate
+        """
+        if fcntl is None:
+            raise RuntimeError('FileTokenBucket requires fcntl')
+
+        super(FileTokenBucket, self).__init__(rate, capacity=capacity)
+        self.path = path
+        self._fd = None
+        self._pid = os.getpid()
+        _file_token_buckets.add(self)
+
+    def reserve(self, tokens=1):
+        """Take tokens, and get seconds to wait until they are available.
+
+        :param float tokens: (optional) Number of tokens
+        :rtype: float
+        :return: seconds to wait
+        """
+        if self._pid != os.getpid():
+            self._after_fork()
+
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                state = os.read(self._fd, self._STATE.size)
+                now = time.time()
+                if len(state) == self._STATE.size:
+                    current, timestamp = self._STATE.unpack(state)
+                else:
+                    current, timestamp = self.capacity, now
+
+                current, timestamp, wait = _take(
+                    current, timestamp, now, self.rate, self.capacity, tokens)
+
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, self._STATE.pack(current, timestamp))
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return wait
+
+    def close(self):
+        """Close the state file."""
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _after_fork(self):
+        # the lock may have been held by another thread of the parent,
+        # and the file is shared with it
+        self._lock = threading.Lock()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._pid = os.getpid()
+
+
+_file_token_buckets = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for bucket in list(_file_token_buckets):
+        bucket._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class RateLimiter(object):
+    """Rate limiter of LineBotApi.
+
+    Keeps one bucket per endpoint class. LineBotApi uses these endpoint classes:
+    'reply', 'push', 'multicast', 'profile', 'content' and 'leave'.
+    """
+
+    def __init__(self, buckets=None, default=None):
+        """__init__ method.
+
+        :param dict buckets: (optional) Endpoint class to bucket
+        :type buckets: dict(str, T <= :py:class:`TokenBucket`)
+        :param default: (optional) Bucket of endpoint classes not in buckets.
+            Default is None (no limit)
+        :type default: T <= :py:class:`TokenBucket`
+        """
+        self.buckets = buckets or {}
+        self.default = default
+
+    def reserve(self, endpoint_class):
+        """Take a token for the endpoint class, and get seconds to wait.
+
+        :param str endpoint_class: Endpoint class
+        :rtype: float
+        :return: seconds to wait
+        """
+        bucket = self.buckets.get(endpoint_class, self.default)
+        if bucket is None:
+            return 0
+        return bucket.reserve()
+
+    def acquire(self, endpoint_class):
+        """Take a token for the endpoint class, waiting until it is available.
+
+        :param str endpoint_class: Endpoint class
+        """
+        wait = self.reserve(endpoint_class)
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _take(current, timestamp, now, rate, capacity, tokens):
+    current = min(capacity, current + max(now - timestamp, 0) * rate) - tokens
+    wait = -current / rate if current < 0 else 0
+    return current, now, wait
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.retry module."""
+
+from __future__ import unicode_literals
+
+import random
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+
+class RetryPolicy(object):
+    """Retry policy of LineBotApi.
+
+    Failed calls are retried with exponential backoff and jitter.
+    If the response has a Retry-After header, it is used as the backoff instead.
+
+    Only idempotent calls, and calls sent with a retry key, are retried.
+    """
+
+    DEFAULT_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30,
+                 jitter=True, status_forcelist=DEFAULT_STATUS_FORCELIST,
+                 respect_retry_after=True, on_complete=None):
+        """__init__ method.
+
+        :param int max_attempts: (optional) Maximum number of attempts per call,
+            including the first one
+        :param float backoff_factor: (optional) Backoff before the n-th retry is
+            backoff_factor * 2 ** (n - 1) seconds
+        :param float max_backoff: (optional) Upper bound of a backoff in seconds
+        :param bool jitter: (optional) If True, each backoff is a random value
+            between 0 and the computed backoff (full jitter)
+        :param status_forcelist: (optional) Status codes to retry on.
+            Default is :py:attr:`DEFAULT_STATUS_FORCELIST`
+        :type status_forcelist: tuple(int)
+        :param bool respect_retry_after: (optional) If True, wait for
+            the Retry-After header value when the response has it
+        :param on_complete: (optional) Function called after every call with
+            (path, attempts, waited seconds)
+        :type on_complete: func
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_forcelist = frozenset(status_forcelist)
+        self.respect_retry_after = respect_retry_after
+        self.on_complete = on_complete
+
+    def is_retryable(self, attempts, status_code):
+        """Check whether the call should be retried.
+
+        :param int attempts: Number of attempts made so far
+        :param int status_code: Status code of the last response
+        :rtype: bool
+        :return: result
+        """
+        return attempts < self.max_attempts and status_code in self.status_forcelist
+
+    def get_backoff(self, attempts, response=None):
+        """Get seconds to wait before the next attempt.
+
+        :param int attempts: Number of attempts made so far
+        :param response: (optional) Last response
+        :type response: T <= :py:class:`linebot.http_client.HttpResponse`
+        :rtype: float
+        :return: seconds
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = self.__parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        backoff = min(self.backoff_factor * (2 ** (attempts - 1)), self.max_backoff)
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def sleep(self, seconds):
+        """Wait before the next attempt.
+
+        :param float seconds:
+        """
+        time.sleep(seconds)
+
+    def complete(self, path, attempts, waited):
+        """Report a finished call to :py:attr:`on_complete`.
+
+        :param str path: Request path
+        :param int attempts: Number of attempts made
+        :param float waited: Total seconds spent in backoff
+        """
+        if self.on_complete is not None:
+            self.on_complete(path, attempts, waited)
+
+    @staticmethod
+    def __parse_retry_after(value):
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        date = parsedate_tz(value)
+        if date is None:
+            return None
+        return max(mktime_tz(date) - time.time(), 0)
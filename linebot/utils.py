@@ -19,6 +19,7 @@ from __future__ import unicode_literals
 import logging
 import re
 import sys
+from concurrent.futures import FIRST_COMPLETED, wait
 
 LOGGER = logging.getLogger('linebot')
 
@@ -67,3 +68,31 @@ def safe_compare_digest(val1, val2):
             result |= (ord(i) ^ ord(j))
 
     return result == 0
+
+
+def imap_unordered(executor, func, iterable, max_pending):
+    """Map func over iterable on executor, yielding futures as they complete.
+
+    At most max_pending calls are submitted at a time,
+    so a long iterable is consumed lazily.
+
+    :param executor: Executor to run func on
+    :type executor: :py:class:`concurrent.futures.Executor`
+    :param func: Function taking one item
+    :param iterable: Items
+    :param int max_pending: Maximum number of submitted, unfinished calls
+    :rtype: iterator[:py:class:`concurrent.futures.Future`]
+    :return: finished futures, in completion order
+    """
+    pending = set()
+    for item in iterable:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future
+        pending.add(executor.submit(func, item))
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.validation module.
+
+Local check of messages against the limits of the Messaging API,
+so that an over-limit message fails before it is sent.
+
+The limits are compiled into a table of rules, keyed by the kind of
+JSON object and its type. Messages are checked in their JSON form,
+in one pass, while they are serialized.
+"""
+
+from __future__ import unicode_literals
+
+from .exceptions import ValidationError
+
+#: Raise ValidationError on any exceeded limit
+STRICT = 'strict'
+
+#: Cut text fields to their limit; raise ValidationError on other limits
+TRUNCATE = 'truncate'
+
+MODES = (STRICT, TRUNCATE)
+
+#: Max number of messages in one request
+MAX_MESSAGES = 5
+
+# Limits of each kind of JSON object, by its type. Each entry is a dict of
+#   'strings': {key: (max length, truncatable)}
+#   'lists': {key: (max items, kind of the items)}
+#   'objects': {key: kind}
+_LIMITS = {
+    ('message', 'text'): {
+        'strings': {'text': (2000, True)},
+    },
+    ('message', 'image'): {
+        'strings': {'originalContentUrl': (1000, False), 'previewImageUrl': (1000, False)},
+    },
+    ('message', 'video'): {
+        'strings': {'originalContentUrl': (1000, False), 'previewImageUrl': (1000, False)},
+    },
+    ('message', 'audio'): {
+        'strings': {'originalContentUrl': (1000, False)},
+    },
+    ('message', 'location'): {
+        'strings': {'title': (100, True), 'address': (100, True)},
+    },
+    ('message', 'imagemap'): {
+        'strings': {'baseUrl': (1000, False), 'altText': (400, True)},
+        'lists': {'actions': (50, 'imagemap_action')},
+    },
+    ('message', 'template'): {
+        'strings': {'altText': (400, True)},
+        'objects': {'template': 'template'},
+    },
+    ('template', 'buttons'): {
+        'strings': {'thumbnailImageUrl': (1000, False), 'title': (40, True), 'text': (160, True)},
+        'lists': {'actions': (4, 'action')},
+    },
+    ('template', 'confirm'): {
+        'strings': {'text': (240, True)},
+        'lists': {'actions': (2, 'action')},
+    },
+    ('template', 'carousel'): {
+        'lists': {'columns': (5, 'column')},
+    },
+    ('column', None): {
+        'strings': {'thumbnailImageUrl': (1000, False), 'title': (40, True), 'text': (120, True)},
+        'lists': {'actions': (3, 'action')},
+    },
+    ('action', 'postback'): {
+        'strings': {'label': (20, True), 'data': (300, False), 'text': (300, True)},
+    },
+    ('action', 'message'): {
+        'strings': {'label': (20, True), 'text': (300, True)},
+    },
+    ('action', 'uri'): {
+        'strings': {'label': (20, True), 'uri': (1000, False)},
+    },
+    ('imagemap_action', 'uri'): {
+        'strings': {'linkUri': (1000, False)},
+    },
+    ('imagemap_action', 'message'): {
+        'strings': {'text': (400, True)},
+    },
+}
+
+
+def _compile(limits):
+    # kind -> type -> (strings, lists, objects), with the kinds of the items
+    # resolved to their own rules
+    rules = {}
+    for kind, type_ in limits:
+        rules.setdefault(kind, {})
+    for (kind, type_), limit in limits.items():
+        rules[kind][type_] = (
+            tuple((name, max_length, truncatable)
+                  for name, (max_length, truncatable) in sorted(limit.get('strings', {}).items())),
+            tuple((name, max_items, rules[item_kind])
+                  for name, (max_items, item_kind) in sorted(limit.get('lists', {}).items())),
+            tuple((name, rules[item_kind])
+                  for name, item_kind in sorted(limit.get('objects', {}).items())),
+        )
+    return rules
+
+
+_RULES = _compile(_LIMITS)
+
+
+def check_mode(mode):
+    """Check a validation mode.
+
+    :param str mode: None, 'strict' or 'truncate'
+    :rtype: str
+    :return: mode
+    :raises: ValueError if the mode is unknown
+    """
+    if mode is not None and mode not in MODES:
+        raise ValueError('Unknown validation mode. mode=' + mode)
+    return mode
+
+
+def validate_message_count(count):
+    """Check the number of messages in one request.
+
+    :param int count: Number of messages
+    :raises: :py:class:`linebot.exceptions.ValidationError`
+        if there are more than :py:data:`MAX_MESSAGES`
+    """
+    if count > MAX_MESSAGES:
+        raise ValidationError('messages', MAX_MESSAGES, count)
+
+
+def validate_message(message_json, index=0, mode=STRICT):
+    """Check a message in its JSON form.
+
+    Text fields over their limit are cut in place in 'truncate' mode.
+
+    :param dict message_json: JSON dict of the message,
+        i.e. the result of ``as_json_dict()``
+    :param int index: (optional) Index of the message in the request, for error paths
+    :param str mode: (optional) 'strict' or 'truncate'
+    :rtype: dict
+    :return: message_json
+    :raises: :py:class:`linebot.exceptions.ValidationError`
+        on the first exceeded limit
+    """
+    try:
+        _validate(message_json, _RULES['message'], mode == TRUNCATE)
+    except _LimitExceeded as e:
+        raise ValidationError(
+            'messages[{0}]'.format(index) + ''.join(reversed(e.path)), e.limit, e.actual)
+    return message_json
+
+
+def validate_frozen_message(message_json, placeholder):
+    """Check a message being frozen, in 'strict' mode.
+
+    Strings holding placeholders are checked without them. They are
+    returned, to be checked again as their placeholders are bound.
+
+    :param dict message_json: JSON dict of the message. Placeholders are
+        removed from it in place
+    :param placeholder: Compiled pattern of the placeholders, whose group
+        is the name, or None if there are none
+    :rtype: list[(str, int, int, tuple(str))]
+    :return: Path, max length, length without placeholders
+        and placeholder names of each of those strings
+    :raises: :py:class:`linebot.exceptions.ValidationError`
+        on the first exceeded limit
+    """
+    fields = []
+    if placeholder is not None:
+        _find_strings(message_json, _RULES['message'], 'message', placeholder.search, fields)
+
+    limits = []
+    for obj, name, path, max_length in fields:
+        names = tuple(placeholder.findall(obj[name]))
+        obj[name] = placeholder.sub('', obj[name])
+        limits.append((path, max_length, len(obj[name]), names))
+
+    try:
+        _validate(message_json, _RULES['message'], False)
+    except _LimitExceeded as e:
+        raise ValidationError('message' + ''.join(reversed(e.path)), e.limit, e.actual)
+    return limits
+
+
+class _LimitExceeded(Exception):
+    # the path is collected on the way up, so that none is built for valid messages
+
+    def __init__(self, name, limit, actual):
+        super(_LimitExceeded, self).__init__(name)
+        self.path = ['.' + name]
+        self.limit = limit
+        self.actual = actual
+
+
+def _validate(obj, rules, truncate):
+    rule = rules.get(obj.get('type'))
+    if rule is None:
+        return
+    strings, lists, objects = rule
+
+    for name, max_length, truncatable in strings:
+        value = obj.get(name)
+        if value is not None and len(value) > max_length:
+            if not (truncate and truncatable):
+                raise _LimitExceeded(name, max_length, len(value))
+            obj[name] = value[:max_length]
+
+    for name, max_items, item_rules in lists:
+        items = obj.get(name)
+        if items is None:
+            continue
+        if len(items) > max_items:
+            raise _LimitExceeded(name, max_items, len(items))
+        i = 0
+        try:
+            for item in items:
+                _validate(item, item_rules, truncate)
+                i += 1
+        except _LimitExceeded as e:
+            e.path.append('.{0}[{1}]'.format(name, i))
+            raise
+
+    for name, item_rules in objects:
+        value = obj.get(name)
+        if value is not None:
+            try:
+                _validate(value, item_rules, truncate)
+            except _LimitExceeded as e:
+                e.path.append('.' + name)
+                raise
+
+
+def _find_strings(obj, rules, path, match, found):
+    rule = rules.get(obj.get('type'))
+    if rule is None:
+        return
+    strings, lists, objects = rule
+
+    for name, max_length, _ in strings:
+        value = obj.get(name)
+        if value is not None and match(value):
+            found.append((obj, name, path + '.' + name, max_length))
+
+    for name, _, item_rules in lists:
+        for i, item in enumerate(obj.get(name) or ()):
+            _find_strings(item, item_rules, '{0}.{1}[{2}]'.format(path, name, i), match, found)
+
+    for name, item_rules in objects:
+        value = obj.get(name)
+        if value is not None:
+            _find_strings(value, item_rules, path + '.' + name, match, found)
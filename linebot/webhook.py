@@ -20,18 +20,22 @@ import base64
 import hashlib
 import hmac
 import inspect
+import itertools
 import json
-
-from .exceptions import InvalidSignatureError
-from .models.events import (
-    MessageEvent,
-    FollowEvent,
-    UnfollowEvent,
-    JoinEvent,
-    LeaveEvent,
-    PostbackEvent,
-    BeaconEvent
-)
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, wait
+
+from future.moves.queue import Full, PriorityQueue
+from future.utils import text_type
+
+from . import json_codec
+from .dedup import get_fingerprint
+from .exceptions import InvalidSignatureError, WebhookHandlerError
+from .middleware import MiddlewareChain
+from .models.events import EVENT_TYPES
 from .utils import LOGGER, PY3, safe_compare_digest
 
 
@@ -85,14 +89,20 @@ class SignatureValidator(object):
 
         https://devdocs.line.me/en/#webhook-authentication
 
-        :param str body: Request body (as text)
+        A bytes-like body is hashed as it is, without being copied.
+
+        :param body: Request body (as text, or as raw bytes)
+        :type body: str | bytes | memoryview
         :param str signature: X-Line-Signature value (as text)
         :rtype: bool
         :return: result
         """
+        if isinstance(body, text_type):
+            body = body.encode('utf-8')
+
         gen_signature = hmac.new(
             self.channel_secret,
-            body.encode('utf-8'),
+            body,
             hashlib.sha256
         ).digest()
 
@@ -104,60 +114,276 @@ class SignatureValidator(object):
 class WebhookParser(object):
     """Webhook Parser."""
 
-    def __init__(self, channel_secret):
+    def __init__(self, channel_secret, lazy=False, middleware=None):
         """__init__ method.
 
         :param str channel_secret: Channel secret (as text)
+        :param bool lazy: (optional) If True, nested objects of the events
+            (source, message, postback, beacon) are built the first time
+            they are read, instead of when the body is parsed.
+            See :py:meth:`linebot.models.base.Base.new_lazy_from_json_dict`
+        :param middleware: (optional) Middleware run around the validate,
+            decode and build stages
+        :type middleware: :py:class:`linebot.middleware.MiddlewareChain`
         """
         self.signature_validator = SignatureValidator(channel_secret)
+        self.lazy = lazy
+        self.middleware = middleware if middleware is not None else MiddlewareChain()
 
     def parse(self, body, signature):
         """Parse webhook request body as text.
 
+        Each event is created with the class registered for its type in
+        :py:data:`linebot.models.events.EVENT_TYPES`
+        (see :py:func:`linebot.models.events.register_event_type`).
+        Events of unknown types are skipped.
+
         :param str body: Webhook request body (as text)
         :param str signature: X-Line-Signature value (as text)
         :rtype: list[T <= :py:class:`linebot.models.events.Event`]
         :return:
         """
-        if not self.signature_validator.validate(body, signature):
+        self.__validate(body, signature)
+
+        return self.__parse_events(body)
+
+    def parse_bytes(self, body, signature):
+        """Parse webhook request body as bytes.
+
+        The signature is computed over the raw buffer, and the same buffer is
+        decoded as JSON, so the body is never decoded to text and encoded back.
+
+        :param body: Webhook request body (as raw bytes)
+        :type body: bytes | memoryview
+        :param str signature: X-Line-Signature value (as text)
+        :rtype: list[T <= :py:class:`linebot.models.events.Event`]
+        :return:
+        """
+        self.__validate(body, signature)
+
+        return self.__parse_events(body)
+
+    def iter_parse(self, body, signature):
+        """Parse webhook request body, yielding events one by one.
+
+        The signature is checked at once. Then the events array is decoded
+        incrementally: each event is decoded and built only when it is reached,
+        so the first event is available before the rest of the batch
+        is materialized.
+
+        :param body: Webhook request body (as text, or as raw bytes)
+        :type body: str | bytes | memoryview
+        :param str signature: X-Line-Signature value (as text)
+        :rtype: iterator(T <= :py:class:`linebot.models.events.Event`)
+        :return:
+        """
+        self.__validate(body, signature)
+
+        if isinstance(body, memoryview):
+            body = body.tobytes()
+        if not isinstance(body, text_type):
+            body = body.decode('utf-8')
+
+        return self.__iter_events(body)
+
+    def __validate(self, body, signature):
+        if not self.middleware.run(
+                'validate', self.signature_validator.validate, body, signature):
             raise InvalidSignatureError(
                 'Invalid signature. signature=' + signature)
 
-        body_json = json.loads(body)
+    def __iter_events(self, body):
+        items = _iter_array_items(body, 'events')
+        run = self.middleware.run
+        while True:
+            event = run('decode_event', lambda _: next(items, _END), body)
+            if event is _END:
+                return
+            event = run('build', self.__new_event, event)
+            if event is not None:
+                yield event
+
+    def __parse_events(self, body):
+        run = self.middleware.run
         events = []
-        for event in body_json['events']:
-            event_type = event['type']
-            if event_type == 'message':
-                events.append(MessageEvent.new_from_json_dict(event))
-            elif event_type == 'follow':
-                events.append(FollowEvent.new_from_json_dict(event))
-            elif event_type == 'unfollow':
-                events.append(UnfollowEvent.new_from_json_dict(event))
-            elif event_type == 'join':
-                events.append(JoinEvent.new_from_json_dict(event))
-            elif event_type == 'leave':
-                events.append(LeaveEvent.new_from_json_dict(event))
-            elif event_type == 'postback':
-                events.append(PostbackEvent.new_from_json_dict(event))
-            elif event_type == 'beacon':
-                events.append(BeaconEvent.new_from_json_dict(event))
-            else:
-                LOGGER.warn('Unknown event type. type=' + event_type)
+        for event in run('decode', json_codec.loads, body)['events']:
+            event = run('build', self.__new_event, event)
+            if event is not None:
+                events.append(event)
 
         return events
 
+    def __new_event(self, event):
+        event_type = event['type']
+        cls = EVENT_TYPES.get(event_type)
+        if cls is None:
+            LOGGER.warning('Unknown event type. type=%s', event_type)
+            return None
+        if self.lazy:
+            return cls.new_lazy_from_json_dict(event)
+        return cls.new_from_json_dict(event)
+
 
 class WebhookHandler(object):
-    """Webhook Handler."""
+    """Webhook Handler.
 
-    def __init__(self, channel_secret):
+    Handlers are looked up by (event class, message class). The lookup
+    walks the MRO of both classes, so a handler added for a base class
+    also handles its subclasses, and the result is cached per class pair.
+
+    With max_workers, the events of a webhook are handled concurrently
+    on a thread pool. Events from the same sender (source.sender_id)
+    are still handled one after another, in the order they were sent.
+
+    After :py:meth:`start`, :py:meth:`enqueue` hands the events over to
+    background workers, so the webhook request can be answered right away.
+
+    Middleware added with :py:meth:`use` runs around every stage of parsing
+    and around each handler call.
+    """
+
+    REPLY_TOKEN_TTL = 30
+
+    def __init__(self, channel_secret, max_workers=None, handler_timeout=None, dedup=None):
         """__init__ method.
 
         :param str channel_secret: Channel secret (as text)
+        :param int max_workers: (optional) Number of threads handling events concurrently.
+            Default is None (handle events one by one in the calling thread)
+        :param float handler_timeout: (optional) With max_workers, seconds to wait
+            for a handler. A handler running longer is reported as failed,
+            with :py:class:`concurrent.futures.TimeoutError`,
+            and the later events of the same sender are not handled.
+            Default is None (wait forever)
+        :param dedup: (optional) Store of seen events. Events seen before,
+            e.g. redelivered webhooks, are dropped before reaching the handlers.
+            Events whose handler failed are forgotten, so that their redelivery
+            is handled again. Default is None (no deduplication)
+        :type dedup: T <= :py:class:`linebot.dedup.DedupBackend`
         """
-        self.parser = WebhookParser(channel_secret)
+        self.middleware = MiddlewareChain()
+        self.parser = WebhookParser(channel_secret, middleware=self.middleware)
+        self.handler_timeout = handler_timeout
+        self.dedup = dedup
         self._handlers = {}
         self._default = None
+        self._dispatch_table = {}
+        self._executor = ThreadPoolExecutor(max_workers) if max_workers else None
+        self._queue = None
+        self._workers = []
+        self._sequence = itertools.count()
+        self.reply_token_ttl = self.REPLY_TOKEN_TTL
+
+    def __enter__(self):
+        """__enter__ method.
+
+        :rtype: :py:class:`WebhookHandler`
+        :return: self
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method.
+
+        Close this instance.
+        """
+        self.close()
+
+    def close(self):
+        """Stop the background workers and shut down the thread pool of max_workers.
+
+        Waits for running handlers.
+        """
+        self.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def start(self, workers=1, queue_size=1000, reply_token_ttl=REPLY_TOKEN_TTL):
+        """Start background workers handling the events given to :py:meth:`enqueue`.
+
+        Queued events are handled in order of reply token deadline
+        (timestamp + reply_token_ttl), so the events closest to losing their
+        reply token go first. Events whose reply token expired, and events
+        without one, come after them in order of timestamp.
+
+        :param int workers: (optional) Number of worker threads
+        :param int queue_size: (optional) Maximum number of queued events
+        :param float reply_token_ttl: (optional) Seconds a reply token is
+            valid after the event timestamp
+        """
+        if self._queue is not None:
+            return
+
+        self.reply_token_ttl = reply_token_ttl
+        self._queue = PriorityQueue(queue_size)
+        for i in range(workers):
+            thread = threading.Thread(
+                target=self.__work, args=(self._queue,), name='linebot-webhook-{0}'.format(i))
+            thread.daemon = True
+            thread.start()
+            self._workers.append(thread)
+
+    def stop(self, timeout=None):
+        """Stop the background workers after the events queued so far.
+
+        :param float timeout: (optional) Seconds to wait for each worker
+        """
+        if self._queue is None:
+            return
+
+        for _ in self._workers:
+            # sorts after every event
+            self._queue.put((2, float('inf'), next(self._sequence), None))
+        for thread in self._workers:
+            thread.join(timeout)
+        self._queue = None
+        self._workers = []
+
+    def enqueue(self, body, signature):
+        """Validate and parse webhook, and queue the events for the background workers.
+
+        Returns without waiting for the handlers. If a handler fails,
+        the error is logged. Call :py:meth:`start` first.
+
+        When the event timestamp is older than reply_token_ttl by the time
+        the event is handled, ``event.reply_token_expired`` is True.
+
+        :param body: Webhook request body (as text, or as raw bytes)
+        :type body: str | bytes | memoryview
+        :param str signature: X-Line-Signature value (as text)
+        :raises: queue.Full if the queue is full. The events before it stay queued,
+            and the others are not recorded as seen by dedup
+        """
+        if self._queue is None:
+            raise RuntimeError('Background workers are not started')
+
+        events = self._get_events(body, signature)
+
+        now = time.time()
+        for i, event in enumerate(events):
+            deadline = self.__get_reply_deadline(event)
+            if deadline is not None and deadline > now:
+                priority = (0, deadline)
+            else:
+                priority = (1, (event.timestamp or 0) / 1000.0)
+            try:
+                self._queue.put_nowait(priority + (next(self._sequence), event))
+            except Full:
+                self._discard_seen(events[i:])
+                raise
+
+    def use(self, middleware):
+        """Add middleware.
+
+        Middleware runs in the order it was added, the first one outermost.
+        See :py:mod:`linebot.middleware` for the stages.
+
+        :param middleware: Middleware
+        :type middleware: T <= :py:class:`linebot.middleware.Middleware`
+        :rtype: T <= :py:class:`linebot.middleware.Middleware`
+        :return: middleware
+        """
+        return self.middleware.use(middleware)
 
     def add(self, event, message=None):
         """[Decorator] Add handler method.
@@ -188,7 +414,8 @@ class WebhookHandler(object):
         :return:
         """
         def decorator(func):
-            self._default = func
+            self._default = (func, self.__get_args_count(func))
+            self._dispatch_table.clear()
             return func
 
         return decorator
@@ -196,39 +423,174 @@ class WebhookHandler(object):
     def handle(self, body, signature):
         """Handle webhook.
 
-        :param str body: Webhook request body (as text)
+        With max_workers, a failed handler does not stop the other events.
+        Once every event was handled, the failures are raised together
+        as :py:class:`linebot.exceptions.WebhookHandlerError`.
+
+        :param body: Webhook request body (as text, or as raw bytes)
+        :type body: str | bytes | memoryview
         :param str signature: X-Line-Signature value (as text)
         """
-        events = self.parser.parse(body, signature)
-
-        for event in events:
-            func = None
-            key = None
+        events = self._get_events(body, signature)
+
+        if self._executor is None:
+            for i, event in enumerate(events):
+                try:
+                    self._handle_event(event)
+                except BaseException:
+                    self._discard_seen(events[i:])
+                    raise
+        else:
+            self.__handle_concurrently(events)
+
+    def __handle_concurrently(self, events):
+        futures = {
+            self._executor.submit(batch.run, self._handle_event): batch
+            for batch in _SenderBatch.group(events)
+        }
+
+        errors = []
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending, timeout=self.__get_wait_timeout(futures, pending),
+                return_when=FIRST_COMPLETED)
+            for future in done:
+                errors.extend(futures[future].errors)
+
+            if self.handler_timeout is not None:
+                for future in list(pending):
+                    timed_out = futures[future].abandon_if_timed_out(self.handler_timeout)
+                    if timed_out is not None:
+                        errors.extend(timed_out)
+                        pending.discard(future)
+
+        if errors:
+            order = {id(event): i for i, event in enumerate(events)}
+            errors.sort(key=lambda error: order[id(error[0])])
+            self._discard_seen([event for event, _ in errors])
+            raise WebhookHandlerError(errors)
+
+    def __get_wait_timeout(self, futures, pending):
+        if self.handler_timeout is None:
+            return None
+
+        now = time.time()
+        deadlines = [futures[future].started_at + self.handler_timeout - now
+                     for future in pending if futures[future].started_at is not None]
+        return max(min(deadlines or [self.handler_timeout]), 0)
+
+    def handle_async(self, body, signature):
+        """Handle webhook in asyncio.
+
+        ※ Python 3.5+
+
+        Handlers may be coroutine functions (``async def``), which are awaited
+        in the event loop. Other handlers run on the thread pool of max_workers,
+        or on the default executor of the loop.
+
+        Events from different senders are handled concurrently, and events
+        from the same sender one after another. Like handle with max_workers,
+        failures are raised together as :py:class:`linebot.exceptions.WebhookHandlerError`.
+        A coroutine handler running longer than handler_timeout is cancelled.
+
+        Middleware is synchronous: the handler stage wraps the handlers
+        run on the executor, not the coroutine handlers.
+
+        :param body: Webhook request body (as text, or as raw bytes)
+        :type body: str | bytes | memoryview
+        :param str signature: X-Line-Signature value (as text)
+        :rtype: coroutine
+        """
+        from .async_webhook import handle_async
+
+        return handle_async(self, body, signature)
+
+    def __work(self, queue):
+        while True:
+            _, _, _, event = queue.get()
+            if event is None:
+                return
+
+            deadline = self.__get_reply_deadline(event)
+            if deadline is not None and deadline <= time.time():
+                event._reply_token_expired = True
+
+            try:
+                self._handle_event(event)
+            except Exception:
+                self._discard_seen([event])
+                LOGGER.exception('Handler of %s failed', event.__class__.__name__)
+
+    def __get_reply_deadline(self, event):
+        if getattr(event, 'reply_token', None) is None or event.timestamp is None:
+            return None
+        return event.timestamp / 1000.0 + self.reply_token_ttl
+
+    def _get_events(self, body, signature):
+        if isinstance(body, text_type):
+            events = self.parser.parse(body, signature)
+        else:
+            events = self.parser.parse_bytes(body, signature)
 
-            if isinstance(event, MessageEvent):
-                key = self.__get_handler_key(
-                    event.__class__, event.message.__class__)
-                func = self._handlers.get(key, None)
+        return [event for event in events if self.__is_new(event)]
 
-            if func is None:
-                key = self.__get_handler_key(event.__class__)
-                func = self._handlers.get(key, None)
+    def _discard_seen(self, events):
+        # a redelivery of these events reaches the handlers again
+        if self.dedup is None:
+            return
+        for event in events:
+            self.dedup.discard(get_fingerprint(event))
+
+    def __is_new(self, event):
+        if self.dedup is None or self.dedup.add(get_fingerprint(event)):
+            return True
+
+        LOGGER.info('Duplicate %s dropped', event.__class__.__name__)
+        return False
+
+    def _get_handler(self, event):
+        message = getattr(event, 'message', None)
+        key = (event.__class__, None if message is None else message.__class__)
+        try:
+            handler = self._dispatch_table[key]
+        except KeyError:
+            handler = self._dispatch_table[key] = self.__resolve_handler(*key)
+
+        if handler is None:
+            LOGGER.info('No handler of %s and no default handler', event.__class__.__name__)
+        return handler
+
+    def _handle_event(self, event):
+        handler = self._get_handler(event)
+        if handler is None:
+            return
+
+        self._call_handler(handler, event)
+
+    def _call_handler(self, handler, event):
+        func, args_count = handler
+        if self.middleware.middlewares:
+            self.middleware.run(
+                'handler', _call_without_event if args_count == 0 else _call, func, event)
+        elif args_count == 0:
+            func()
+        else:
+            func(event)
 
-            if func is None:
-                func = self._default
+    def __resolve_handler(self, event_class, message_class):
+        message_classes = (message_class.__mro__ if message_class else ()) + (None,)
+        for event_base in event_class.__mro__:
+            for message_base in message_classes:
+                handler = self._handlers.get((event_base, message_base))
+                if handler is not None:
+                    return handler
 
-            if func is None:
-                LOGGER.info('No handler of ' + key + ' and no default handler')
-            else:
-                args_count = self.__get_args_count(func)
-                if args_count == 0:
-                    func()
-                else:
-                    func(event)
+        return self._default
 
     def __add_handler(self, func, event, message=None):
-        key = self.__get_handler_key(event, message=message)
-        self._handlers[key] = func
+        self._handlers[(event, message)] = (func, self.__get_args_count(func))
+        self._dispatch_table.clear()
 
     @staticmethod
     def __get_args_count(func):
@@ -239,9 +601,117 @@ class WebhookHandler(object):
             arg_spec = inspect.getargspec(func)
             return len(arg_spec.args)
 
-    @staticmethod
-    def __get_handler_key(event, message=None):
-        if message is None:
-            return event.__name__
+
+def _call(func, event):
+    return func(event)
+
+
+def _call_without_event(func, event):
+    return func()
+
+
+# end of the events of iter_parse, as JSON null is an event value
+_END = object()
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_decoder = json.JSONDecoder()
+
+
+def _iter_array_items(text, name):
+    """Yield the items of the array under key name of the JSON object in text.
+
+    Only the items are decoded into Python objects; other values are skipped.
+    Like json.loads and a lookup of the key, it raises ValueError on malformed
+    JSON, including data after the object, and KeyError if the key is missing.
+    """
+    def skip(pos, expected=None):
+        pos = _WHITESPACE.match(text, pos).end()
+        if expected is not None:
+            if text[pos:pos + 1] not in expected:
+                raise ValueError('Expecting {0} at char {1}'.format(' or '.join(expected), pos))
+            pos = _WHITESPACE.match(text, pos + 1).end()
+        return pos
+
+    found = False
+    pos = skip(0, '{')
+    closed = text[pos:pos + 1] == '}'
+    if closed:
+        pos = skip(pos, '}')
+    while not closed:
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = skip(pos, ':')
+        if key == name:
+            if text[pos:pos + 1] != '[':
+                raise TypeError('{0} is not an array'.format(name))
+            found = True
+            pos = skip(pos + 1)
+            if text[pos:pos + 1] == ']':
+                pos += 1
+            else:
+                while True:
+                    item, pos = _decoder.raw_decode(text, pos)
+                    yield item
+                    pos = skip(pos)
+                    if text[pos:pos + 1] == ']':
+                        pos += 1
+                        break
+                    pos = skip(pos, ',')
         else:
-            return event.__name__ + '_' + message.__name__
+            _, pos = _decoder.raw_decode(text, pos)
+
+        pos = skip(pos)
+        closed = text[pos:pos + 1] == '}'
+        pos = skip(pos, ',}')
+
+    if pos != len(text):
+        raise ValueError('Extra data at char {0}'.format(pos))
+    if not found:
+        raise KeyError(name)
+
+
+class _SenderBatch(object):
+    """Events of one sender, handled in order by one worker."""
+
+    def __init__(self):
+        self.events = []
+        self.errors = []
+        self.current = None
+        self.started_at = None
+        self.abandoned = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def group(cls, events):
+        batches = OrderedDict()
+        for event in events:
+            source = getattr(event, 'source', None)
+            key = source.sender_id if source is not None else id(event)
+            batches.setdefault(key, cls()).events.append(event)
+        return batches.values()
+
+    def run(self, handle_event):
+        for i, event in enumerate(self.events):
+            with self.lock:
+                if self.abandoned:
+                    return
+                self.current, self.started_at = i, time.time()
+
+            try:
+                handle_event(event)
+            except Exception as e:
+                with self.lock:
+                    self.errors.append((event, e))
+
+        with self.lock:
+            self.current = self.started_at = None
+
+    def abandon_if_timed_out(self, timeout):
+        with self.lock:
+            if self.started_at is None or time.time() - self.started_at < timeout:
+                return None
+
+            self.abandoned = True
+            error = TimeoutError(
+                'Handler did not finish in {0} seconds'.format(timeout))
+            return self.errors + [(event, error) for event in self.events[self.current:]]
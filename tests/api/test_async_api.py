@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+import json
+import unittest
+
+from linebot import (
+    AsyncLineBotApi, AsyncHttpClient, AsyncHttpResponse
+)
+from linebot.circuit_breaker import (
+    CircuitBreaker
+)
+from linebot.exceptions import (
+    CircuitOpenError, LineBotApiError, ValidationError
+)
+from linebot.models import (
+    TextSendMessage
+)
+
+
+class StubAsyncHttpResponse(AsyncHttpResponse):
+    def __init__(self, status_code=200, body=b'{}', headers=None):
+        self._status_code = status_code
+        self._body = body
+        self._headers = headers or {}
+
+    @property
+    def status_code(self):
+        return self._status_code
+
+    @property
+    def headers(self):
+        return self._headers
+
+    async def text(self):
+        return self._body.decode('utf-8')
+
+    async def content(self):
+        return self._body
+
+    async def json(self):
+        return json.loads(self._body.decode('utf-8'))
+
+    async def _iter(self, chunk_size):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+    def iter_content(self, chunk_size=1024):
+        return self._iter(chunk_size)
+
+
+class StubAsyncHttpClient(AsyncHttpClient):
+    def __init__(self, response=None):
+        super(StubAsyncHttpClient, self).__init__()
+        self.response = response or StubAsyncHttpResponse()
+        self.calls = []
+        self.closed = False
+
+    async def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        self.calls.append(('GET', url, headers, None))
+        return self.response
+
+    async def post(self, url, headers=None, data=None, timeout=None):
+        self.calls.append(('POST', url, headers, data))
+        return self.response
+
+    async def close(self):
+        self.closed = True
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncLineBotApi(unittest.TestCase):
+    def test_push_message(self):
+        http_client = StubAsyncHttpClient()
+        tested = AsyncLineBotApi('channel_secret', http_client)
+
+        run(tested.push_message('to', TextSendMessage(text='Hello, world')))
+
+        method, url, headers, data = http_client.calls[0]
+        self.assertEqual(method, 'POST')
+        self.assertEqual(url, AsyncLineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push')
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(
+            json.loads(data),
+            {"to": "to", "messages": [{"type": "text", "text": "Hello, world"}]}
+        )
+
+    def test_concurrent_calls(self):
+        http_client = StubAsyncHttpClient()
+        tested = AsyncLineBotApi('channel_secret', http_client)
+
+        async def push_all():
+            await asyncio.gather(*[
+                tested.push_message('to' + str(i), TextSendMessage(text='hoge'))
+                for i in range(10)
+            ])
+
+        run(push_all())
+
+        self.assertEqual(len(http_client.calls), 10)
+
+    def test_multicast(self):
+        http_client = StubAsyncHttpClient()
+        tested = AsyncLineBotApi('channel_secret', http_client)
+        to = ['to{0}'.format(i) for i in range(200)]
+
+        result = run(tested.multicast(to, TextSendMessage(text='hoge')))
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(
+            [len(json.loads(call[3])['to']) for call in http_client.calls], [150, 50])
+
+    def test_get_profile(self):
+        http_client = StubAsyncHttpClient(StubAsyncHttpResponse(
+            body=b'{"displayName": "alice", "userId": "Ualice"}'))
+        tested = AsyncLineBotApi('channel_secret', http_client)
+
+        profile = run(tested.get_profile('Ualice'))
+
+        self.assertEqual(http_client.calls[0][1],
+                         AsyncLineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/profile/Ualice')
+        self.assertEqual(profile.display_name, 'alice')
+        self.assertEqual(profile.user_id, 'Ualice')
+
+    def test_get_message_content(self):
+        http_client = StubAsyncHttpClient(StubAsyncHttpResponse(
+            body=b'\x00\x01\x02', headers={'content-type': 'image/jpeg'}))
+        tested = AsyncLineBotApi('channel_secret', http_client)
+
+        async def read():
+            content = await tested.get_message_content('1')
+            chunks = [chunk async for chunk in content.iter_content(chunk_size=2)]
+            return content.content_type, chunks
+
+        content_type, chunks = run(read())
+
+        self.assertEqual(content_type, 'image/jpeg')
+        self.assertEqual(chunks, [b'\x00\x01', b'\x02'])
+
+    def test_error_handle(self):
+        http_client = StubAsyncHttpClient(StubAsyncHttpResponse(
+            status_code=401, body=b'{"message": "Invalid reply token"}'))
+        tested = AsyncLineBotApi('channel_secret', http_client)
+
+        with self.assertRaises(LineBotApiError) as cm:
+            run(tested.reply_message('replyToken', TextSendMessage(text='hoge')))
+
+        self.assertEqual(cm.exception.status_code, 401)
+        self.assertEqual(cm.exception.error.message, 'Invalid reply token')
+
+    def test_circuit_breaker(self):
+        http_client = StubAsyncHttpClient(StubAsyncHttpResponse(
+            status_code=503, body=b'{"message": "error"}'))
+        tested = AsyncLineBotApi('channel_secret', http_client, circuit_breaker=CircuitBreaker(
+            window_size=1, minimum_calls=1))
+
+        with self.assertRaises(LineBotApiError):
+            run(tested.push_message('to', TextSendMessage(text='hoge')))
+        with self.assertRaises(CircuitOpenError):
+            run(tested.push_message('to', TextSendMessage(text='hoge')))
+
+        self.assertEqual(len(http_client.calls), 1)
+
+    def test_cancelled_circuit_trial(self):
+        http_client = StubAsyncHttpClient(StubAsyncHttpResponse(
+            status_code=503, body=b'{"message": "error"}'))
+        circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1, recovery_timeout=0)
+        tested = AsyncLineBotApi('channel_secret', http_client, circuit_breaker=circuit_breaker)
+
+        with self.assertRaises(LineBotApiError):
+            run(tested.push_message('to', TextSendMessage(text='hoge')))
+        self.assertEqual(circuit_breaker.get_state('push'), CircuitBreaker.OPEN)
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        # the trial call of the half-open circuit is cancelled
+        http_client.post = hang
+        with self.assertRaises(asyncio.TimeoutError):
+            run(asyncio.wait_for(tested.push_message('to', TextSendMessage(text='hoge')), 0.01))
+        self.assertEqual(circuit_breaker.get_state('push'), CircuitBreaker.OPEN)
+
+        # and the next one is let through
+        del http_client.post
+        http_client.response = StubAsyncHttpResponse()
+        run(tested.push_message('to', TextSendMessage(text='hoge')))
+        self.assertEqual(circuit_breaker.get_state('push'), CircuitBreaker.CLOSED)
+
+    def test_validation(self):
+        http_client = StubAsyncHttpClient()
+        tested = AsyncLineBotApi('channel_secret', http_client, validation='strict')
+
+        with self.assertRaises(ValidationError) as cm:
+            run(tested.push_message('to', [TextSendMessage(text='hoge')] * 6))
+
+        self.assertEqual(cm.exception.path, 'messages')
+        self.assertEqual(http_client.calls, [])
+
+    def test_context_manager(self):
+        http_client = StubAsyncHttpClient()
+
+        async def use():
+            async with AsyncLineBotApi('channel_secret', http_client) as tested:
+                await tested.leave_group('gid')
+
+        run(use())
+
+        self.assertEqual(http_client.calls[0][1],
+                         AsyncLineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/group/gid/leave')
+        self.assertTrue(http_client.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
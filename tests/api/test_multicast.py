@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.exceptions import (
+    LineBotApiError
+)
+from linebot.models import (
+    TextSendMessage
+)
+
+
+class TestMulticast(unittest.TestCase):
+    def setUp(self):
+        self.tested = LineBotApi('channel_secret')
+
+        # test data
+        self.text_message = TextSendMessage(text='Hello, world')
+        self.message = [{"type": "text", "text": "Hello, world"}]
+
+    @responses.activate
+    def test_multicast(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/multicast',
+            json={}, status=200
+        )
+
+        result = self.tested.multicast(['to1', 'to2'], self.text_message)
+
+        request = responses.calls[0].request
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(
+            request.url,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/multicast')
+        self.assertEqual(
+            json.loads(request.body),
+            {
+                "to": ["to1", "to2"],
+                "messages": self.message
+            }
+        )
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.failed, [])
+
+    @responses.activate
+    def test_multicast_chunks(self):
+        def callback(request):
+            if 'to200' in json.loads(request.body)['to']:
+                return 500, {}, json.dumps({"message": "Internal error"})
+            return 200, {}, '{}'
+
+        responses.add_callback(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/multicast',
+            callback=callback
+        )
+        to = ['to{0}'.format(i) for i in range(320)]
+
+        result = self.tested.multicast(to, self.text_message)
+
+        sent = [json.loads(call.request.body) for call in responses.calls]
+        self.assertEqual(
+            sorted(len(body['to']) for body in sent), [20, 150, 150])
+        self.assertEqual(
+            sorted(to_id for body in sent for to_id in body['to']), sorted(to))
+        for body in sent:
+            self.assertEqual(body['messages'], self.message)
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(len(result.results), 3)
+        self.assertEqual(len(result.failed), 1)
+        self.assertEqual(result.failed_to, to[150:300])
+        self.assertIsInstance(result.failed[0].error, LineBotApiError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+import requests
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.exceptions import (
+    LineBotApiError
+)
+from linebot.models import (
+    TextSendMessage
+)
+from linebot.models.responses import (
+    PushResult
+)
+
+
+class TestPushMessagesBulk(unittest.TestCase):
+    def setUp(self):
+        self.tested = LineBotApi('channel_secret')
+
+    @responses.activate
+    def test_push_messages_bulk(self):
+        def callback(request):
+            to = json.loads(request.body)['to']
+            if to == 'error':
+                return 400, {}, json.dumps({"message": "Invalid to"})
+            if to == 'timeout':
+                raise requests.exceptions.ReadTimeout()
+            return 200, {}, '{}'
+
+        responses.add_callback(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            callback=callback
+        )
+        recipients = ['to{0}'.format(i) for i in range(20)] + ['error', 'timeout']
+
+        results = list(self.tested.push_messages_bulk(
+            iter(recipients), TextSendMessage(text='Hello, world'), concurrency=4))
+
+        self.assertEqual(len(responses.calls), 22)
+        self.assertEqual(sorted(result.to for result in results), sorted(recipients))
+        for call in responses.calls:
+            self.assertEqual(
+                json.loads(call.request.body)['messages'],
+                [{"type": "text", "text": "Hello, world"}])
+
+        results = dict((result.to, result) for result in results)
+        self.assertTrue(results['to0'].succeeded)
+        self.assertEqual(results['to0'].status, PushResult.SUCCESS)
+        self.assertEqual(results['error'].status, PushResult.ERROR)
+        self.assertIsInstance(results['error'].error, LineBotApiError)
+        self.assertEqual(results['error'].error.status_code, 400)
+        self.assertEqual(results['timeout'].status, PushResult.TIMEOUT)
+        self.assertFalse(results['timeout'].succeeded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import unittest
+
+import responses
+from linebot import (
+    LineBotApi, RequestsHttpClient
+)
+from linebot.http_client import (
+    RequestsHttpResponse
+)
+from linebot.exceptions import (
+    LineBotApiError
+)
+from linebot.models import (
+    TextSendMessage
+)
+from linebot.retry import (
+    RetryPolicy
+)
+
+
+class RecordingRetryPolicy(RetryPolicy):
+    def __init__(self, **kwargs):
+        self.sleeps = []
+        self.completed = []
+        super(RecordingRetryPolicy, self).__init__(
+            on_complete=lambda *args: self.completed.append(args), **kwargs)
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+class ClosingRecordedHttpResponse(RequestsHttpResponse):
+    def __init__(self, response, closed):
+        super(ClosingRecordedHttpResponse, self).__init__(response)
+        self.closed = closed
+
+    def close(self):
+        self.closed.append(self.status_code)
+        super(ClosingRecordedHttpResponse, self).close()
+
+
+class ClosingRecordedHttpClient(RequestsHttpClient):
+    def __init__(self, **kwargs):
+        super(ClosingRecordedHttpClient, self).__init__(**kwargs)
+        self.closed = []
+
+    def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        response = super(ClosingRecordedHttpClient, self).get(
+            url, headers=headers, params=params, stream=stream, timeout=timeout)
+        return ClosingRecordedHttpResponse(response.response, self.closed)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff(self):
+        retry_policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        self.assertEqual(retry_policy.get_backoff(1), 1)
+        self.assertEqual(retry_policy.get_backoff(2), 2)
+        self.assertEqual(retry_policy.get_backoff(3), 4)
+        self.assertEqual(retry_policy.get_backoff(4), 5)
+
+    def test_backoff_with_jitter(self):
+        retry_policy = RetryPolicy(backoff_factor=1)
+
+        for _ in range(100):
+            self.assertTrue(0 <= retry_policy.get_backoff(3) <= 4)
+
+    def test_is_retryable(self):
+        retry_policy = RetryPolicy(max_attempts=2)
+
+        self.assertTrue(retry_policy.is_retryable(1, 429))
+        self.assertTrue(retry_policy.is_retryable(1, 503))
+        self.assertFalse(retry_policy.is_retryable(1, 400))
+        self.assertFalse(retry_policy.is_retryable(2, 503))
+
+
+class TestLineBotApiRetry(unittest.TestCase):
+    def setUp(self):
+        self.retry_policy = RecordingRetryPolicy(max_attempts=3, jitter=False)
+        self.tested = LineBotApi('channel_secret', retry_policy=self.retry_policy)
+
+    @responses.activate
+    def test_retry_get_profile(self):
+        url = LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/profile/user_id'
+        responses.add(responses.GET, url, json={"message": "busy"}, status=503)
+        responses.add(responses.GET, url, json={"message": "slow down"}, status=429,
+                      headers={'Retry-After': '2'})
+        responses.add(responses.GET, url, json={"displayName": "alice"}, status=200)
+
+        profile = self.tested.get_profile('user_id')
+
+        self.assertEqual(profile.display_name, 'alice')
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.retry_policy.sleeps, [0.5, 2])
+        self.assertEqual(self.retry_policy.completed, [('/v2/bot/profile/user_id', 3, 2.5)])
+
+    @responses.activate
+    def test_close_retried_responses(self):
+        url = LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/profile/user_id'
+        responses.add(responses.GET, url, json={"message": "busy"}, status=503)
+        responses.add(responses.GET, url, json={"message": "busy"}, status=502)
+        responses.add(responses.GET, url, json={"displayName": "alice"}, status=200)
+        http_client = ClosingRecordedHttpClient()
+        tested = LineBotApi('channel_secret', http_client=http_client,
+                            retry_policy=self.retry_policy)
+
+        tested.get_profile('user_id')
+
+        self.assertEqual(http_client.closed, [503, 502])
+
+    @responses.activate
+    def test_give_up(self):
+        url = LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/group/group_id/leave'
+        responses.add(responses.POST, url, json={"message": "busy"}, status=500)
+
+        with self.assertRaises(LineBotApiError) as cm:
+            self.tested.leave_group('group_id')
+
+        self.assertEqual(cm.exception.status_code, 500)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.retry_policy.completed, [('/v2/bot/group/group_id/leave', 3, 1.5)])
+
+    @responses.activate
+    def test_no_retry_without_retry_key(self):
+        url = LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push'
+        responses.add(responses.POST, url, json={"message": "busy"}, status=503)
+
+        with self.assertRaises(LineBotApiError):
+            self.tested.push_message('to', TextSendMessage(text='hoge'))
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertNotIn('X-Line-Retry-Key', responses.calls[0].request.headers)
+        self.assertEqual(self.retry_policy.completed, [('/v2/bot/message/push', 1, 0)])
+
+    @responses.activate
+    def test_retry_with_retry_key(self):
+        url = LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push'
+        responses.add(responses.POST, url, json={"message": "busy"}, status=503)
+        responses.add(responses.POST, url, json={}, status=200)
+
+        self.tested.push_message('to', TextSendMessage(text='hoge'), retry_key='retry_key')
+
+        self.assertEqual(len(responses.calls), 2)
+        for call in responses.calls:
+            self.assertEqual(call.request.headers['X-Line-Retry-Key'], 'retry_key')
+
+    @responses.activate
+    def test_no_retry_on_client_error(self):
+        url = LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/profile/user_id'
+        responses.add(responses.GET, url, json={"message": "Not found"}, status=404)
+
+        with self.assertRaises(LineBotApiError):
+            self.tested.get_profile('user_id')
+
+        self.assertEqual(len(responses.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
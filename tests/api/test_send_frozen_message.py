@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.exceptions import (
+    ValidationError
+)
+from linebot.models import (
+    TemplateSendMessage, ConfirmTemplate, PostbackTemplateAction,
+    MessageTemplateAction, TextSendMessage
+)
+
+
+class TestSendFrozenMessage(unittest.TestCase):
+    def setUp(self):
+        self.tested = LineBotApi('channel_secret')
+
+        # test data
+        self.confirm_message = TemplateSendMessage(
+            alt_text='Confirm alt text',
+            template=ConfirmTemplate(
+                text='Hello {name}, are you sure?',
+                actions=[
+                    PostbackTemplateAction(
+                        label='Yes', text='Yes!', data='action=tryme&user_id={user_id}'),
+                    MessageTemplateAction(label='No', text='{not_a_placeholder}'),
+                ]
+            )
+        )
+        self.frozen = self.confirm_message.freeze('user_id', 'name')
+
+    def test_bind(self):
+        self.assertEqual(self.frozen.placeholders, {'user_id', 'name'})
+
+        bound = self.frozen.bind(user_id='U1"\\', name='世界')
+
+        self.assertEqual(bound.placeholders, set())
+        self.assertEqual(
+            bound.as_json_dict(),
+            TemplateSendMessage(
+                alt_text='Confirm alt text',
+                template=ConfirmTemplate(
+                    text='Hello 世界, are you sure?',
+                    actions=[
+                        PostbackTemplateAction(
+                            label='Yes', text='Yes!', data='action=tryme&user_id=U1"\\'),
+                        MessageTemplateAction(label='No', text='{not_a_placeholder}'),
+                    ]
+                )
+            ).as_json_dict())
+
+    def test_partial_bind(self):
+        partial = self.frozen.bind(name=1)
+
+        self.assertEqual(partial.placeholders, {'user_id'})
+        with self.assertRaises(ValueError):
+            partial.as_json_bytes()
+        self.assertEqual(partial.bind(user_id='U2').as_json_dict()['template']['text'],
+                         'Hello 1, are you sure?')
+        # the frozen message itself is unchanged
+        self.assertEqual(self.frozen.placeholders, {'user_id', 'name'})
+
+    def test_invalid_placeholders(self):
+        with self.assertRaises(ValueError):
+            self.confirm_message.freeze('missing')
+        with self.assertRaises(ValueError):
+            self.confirm_message.freeze('not valid')
+        with self.assertRaises(ValueError):
+            self.frozen.bind(unknown='value')
+
+    def test_freeze_without_placeholders(self):
+        frozen = TextSendMessage(text='Hello, {name}').freeze()
+
+        self.assertEqual(frozen.as_json_dict(), {'type': 'text', 'text': 'Hello, {name}'})
+
+    def test_validate_on_freeze(self):
+        with self.assertRaises(ValidationError) as cm:
+            TextSendMessage(text='x' * 2001).freeze()
+        self.assertEqual(cm.exception.path, 'message.text')
+
+        # placeholders do not count
+        message = TemplateSendMessage(
+            alt_text='alt',
+            template=ConfirmTemplate(text='x' * 239 + '{name}', actions=[
+                PostbackTemplateAction(label='{name}', data='x' * 290 + '{user_id}{name}')]))
+        frozen = message.freeze('user_id', 'name')
+        with self.assertRaises(ValidationError) as cm:
+            message.freeze()
+        self.assertEqual(cm.exception.path, 'message.template.text')
+
+        with self.assertRaises(ValidationError) as cm:
+            frozen.bind(name='ab')
+        self.assertEqual(cm.exception.path, 'message.template.text')
+        self.assertEqual((cm.exception.limit, cm.exception.actual), (240, 241))
+
+        # lengths add up over partial binds
+        partial = frozen.bind(user_id='x' * 10)
+        self.assertEqual(partial.bind(name='').placeholders, set())
+        with self.assertRaises(ValidationError) as cm:
+            partial.bind(name='a')
+        self.assertEqual(cm.exception.path, 'message.template.actions[0].data')
+        self.assertEqual((cm.exception.limit, cm.exception.actual), (300, 301))
+        self.assertEqual(frozen.bind(user_id='x' * 9, name='a').placeholders, set())
+
+    @responses.activate
+    def test_reply_frozen_message(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/reply',
+            json={}, status=200
+        )
+
+        self.tested.reply_message('replyToken', [
+            TextSendMessage(text='Hello, world'),
+            self.frozen.bind(user_id='U1', name='Brown'),
+        ])
+
+        request = responses.calls[0].request
+        self.assertEqual(
+            json.loads(request.body),
+            {
+                "replyToken": "replyToken",
+                "messages": [
+                    {"type": "text", "text": "Hello, world"},
+                    self.frozen.bind(user_id='U1', name='Brown').as_json_dict(),
+                ]
+            }
+        )
+
+    @responses.activate
+    def test_push_unbound_frozen_message(self):
+        with self.assertRaises(ValueError):
+            self.tested.push_message('to', self.frozen)
+
+        self.assertEqual(len(responses.calls), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
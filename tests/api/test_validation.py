@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.exceptions import (
+    ValidationError
+)
+from linebot.models import (
+    TemplateSendMessage, ButtonsTemplate, CarouselTemplate, CarouselColumn,
+    PostbackTemplateAction, MessageTemplateAction, URITemplateAction,
+    ImagemapSendMessage, BaseSize, URIImagemapAction, ImagemapArea, TextSendMessage
+)
+
+
+def _carousel(title='this is menu1', actions=None):
+    return TemplateSendMessage(
+        alt_text='Carousel alt text',
+        template=CarouselTemplate(
+            columns=[
+                CarouselColumn(
+                    thumbnail_image_url='https://example.com/item1.jpg',
+                    title='this is menu0', text='description0',
+                    actions=[MessageTemplateAction(label='message0', text='message text0')]
+                ),
+                CarouselColumn(
+                    thumbnail_image_url='https://example.com/item2.jpg',
+                    title=title, text='description1',
+                    actions=actions or [
+                        PostbackTemplateAction(label='postback1', data='action=buy&itemid=1')
+                    ]
+                )
+            ]
+        )
+    )
+
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        self.strict = LineBotApi('channel_secret', validation='strict')
+        self.truncate = LineBotApi('channel_secret', validation='truncate')
+
+    @responses.activate
+    def test_valid_messages(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={}, status=200
+        )
+
+        messages = [TextSendMessage(text='x' * 2000), _carousel(title='x' * 40)]
+        self.strict.push_message('to', messages)
+
+        request = responses.calls[0].request
+        self.assertEqual(
+            json.loads(request.body),
+            {"to": "to", "messages": [message.as_json_dict() for message in messages]}
+        )
+
+    @responses.activate
+    def test_too_many_messages(self):
+        for tested in (self.strict, self.truncate):
+            with self.assertRaises(ValidationError) as cm:
+                tested.reply_message('replyToken', [TextSendMessage(text='hoge')] * 6)
+
+            self.assertEqual(cm.exception.path, 'messages')
+            self.assertEqual(cm.exception.limit, 5)
+            self.assertEqual(cm.exception.actual, 6)
+
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_strict(self):
+        cases = [
+            (TextSendMessage(text='x' * 2001), 'messages[1].text'),
+            (_carousel(title='x' * 41), 'messages[1].template.columns[1].title'),
+            (_carousel(actions=[MessageTemplateAction(label='x' * 21, text='hoge')]),
+             'messages[1].template.columns[1].actions[0].label'),
+            (_carousel(actions=[URITemplateAction(label='uri', uri='http://example.com')] * 4),
+             'messages[1].template.columns[1].actions'),
+            (TemplateSendMessage(alt_text='hoge', template=ButtonsTemplate(
+                text='hoge', actions=[PostbackTemplateAction(label='hoge', data='x' * 301)])),
+             'messages[1].template.actions[0].data'),
+            (ImagemapSendMessage(
+                base_url='https://example.com/base', alt_text='hoge',
+                base_size=BaseSize(height=1040, width=1040),
+                actions=[URIImagemapAction(
+                    link_uri='https://example.com/' + 'x' * 1000,
+                    area=ImagemapArea(x=0, y=0, width=520, height=1040))]),
+             'messages[1].actions[0].linkUri'),
+        ]
+
+        for message, path in cases:
+            with self.assertRaises(ValidationError) as cm:
+                self.strict.push_message('to', [TextSendMessage(text='hoge'), message])
+
+            self.assertEqual(cm.exception.path, path)
+
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_truncate(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={}, status=200
+        )
+
+        message = _carousel(
+            title='x' * 50,
+            actions=[MessageTemplateAction(label='y' * 30, text='hoge')])
+        self.truncate.push_message('to', [TextSendMessage(text='z' * 3000), message])
+
+        body = json.loads(responses.calls[0].request.body)
+        self.assertEqual(body['messages'][0]['text'], 'z' * 2000)
+        column = body['messages'][1]['template']['columns'][1]
+        self.assertEqual(column['title'], 'x' * 40)
+        self.assertEqual(column['actions'][0]['label'], 'y' * 20)
+        # the message itself is unchanged
+        self.assertEqual(message.template.columns[1].title, 'x' * 50)
+
+        # identifiers are never cut
+        with self.assertRaises(ValidationError):
+            self.truncate.push_message('to', _carousel(
+                actions=[PostbackTemplateAction(label='hoge', data='x' * 301)]))
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            LineBotApi('channel_secret', validation='lenient')
+
+
+if __name__ == '__main__':
+    unittest.main()
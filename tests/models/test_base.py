@@ -17,7 +17,7 @@ from __future__ import unicode_literals, absolute_import
 import json
 import unittest
 
-from linebot.models import Base
+from linebot.models import Base, base
 
 
 class Hoge(Base):
@@ -67,6 +67,29 @@ class TestBase(unittest.TestCase):
             Hoge(title=[1, 2]).as_json_dict(),
             {'content': None, 'hogeBar': None, 'title': [1, 2]})
 
+    def test_as_json_dict_nested(self):
+        hoge = Hoge(title=Hoge(hoge_bar=1), content=(Hoge(), 'text', {'a': Hoge()}))
+        hoge.extra_value = True
+        hoge._private = 'private'
+
+        self.assertEqual(hoge.as_json_dict(), {
+            'title': {'content': None, 'hogeBar': 1, 'title': None},
+            'content': [{'content': None, 'hogeBar': None, 'title': None}, 'text', {'a': Hoge()}],
+            'hogeBar': None,
+            'extraValue': True,
+        })
+
+    def test_as_json_dict_key_table_size(self):
+        hoge = Hoge()
+        for i in range(base._JSON_KEYS_MAX_SIZE + 10):
+            setattr(hoge, 'key_{0}'.format(i), i)
+
+        data = hoge.as_json_dict()
+
+        self.assertEqual(data['key{0}'.format(base._JSON_KEYS_MAX_SIZE + 9)],
+                         base._JSON_KEYS_MAX_SIZE + 9)
+        self.assertEqual(len(base._json_keys[Hoge]), base._JSON_KEYS_MAX_SIZE)
+
     def test_new_from_json_dict(self):
         self.assertEqual(
             Hoge.new_from_json_dict({"title": "title"}),
@@ -81,6 +104,54 @@ class TestBase(unittest.TestCase):
             Hoge.new_from_json_dict({"hogeBar": "hoge_bar"}),
             Hoge(hoge_bar='hoge_bar'))
 
+    def test_new_from_json_dict_key_table(self):
+        class Piyo(Base):
+            def __init__(self, piyo_bar=None, **kwargs):
+                super(Piyo, self).__init__(**kwargs)
+
+                self.piyo_bar = piyo_bar
+                self.kwargs = kwargs
+
+        piyo = Piyo.new_from_json_dict({'piyoBar': 1, 'fugaBaz': 2})
+        self.assertEqual(piyo.piyo_bar, 1)
+        self.assertEqual(piyo.kwargs, {'fuga_baz': 2})
+        self.assertEqual(base._snake_case_keys[Piyo],
+                         {'piyo_bar': 'piyo_bar', 'piyoBar': 'piyo_bar', 'fugaBaz': 'fuga_baz'})
+
+        # unknown keys stop being remembered at the size bound
+        data = {'unknownKey{0}'.format(i): i for i in range(base._SNAKE_CASE_KEYS_MAX_SIZE)}
+        piyo = Piyo.new_from_json_dict(data)
+        self.assertEqual(len(piyo.kwargs), base._SNAKE_CASE_KEYS_MAX_SIZE)
+        self.assertEqual(piyo.kwargs['unknown_key0'], 0)
+        self.assertEqual(len(base._snake_case_keys[Piyo]), base._SNAKE_CASE_KEYS_MAX_SIZE)
+
+    def test_new_lazy_from_json_dict(self):
+        hoge = Hoge.new_lazy_from_json_dict(
+            {"title": "title", "content": {"hoge": "hoge"}, "unknown": 1})
+
+        self.assertIsInstance(hoge, Hoge)
+        self.assertEqual(hoge.title, 'title')
+        self.assertIsNone(hoge.hoge_bar)
+        self.assertNotIn('content', hoge.__dict__)
+        self.assertEqual(hoge.content, {'hoge': 'hoge'})
+        self.assertEqual(hoge, Hoge(title='title', content={'hoge': 'hoge'}))
+        self.assertFalse(hasattr(hoge, 'unknown'))
+        self.assertEqual(
+            Hoge.new_lazy_from_json_dict({"title": "title"}).as_json_string(),
+            '{"content": null, "hogeBar": null, "title": "title"}')
+
+    def test_new_lazy_from_json_dict_with_required_args(self):
+        class Fuga(Base):
+            def __init__(self, title, **kwargs):
+                super(Fuga, self).__init__(**kwargs)
+
+                self.title = title
+
+        fuga = Fuga.new_lazy_from_json_dict({"title": "title"})
+
+        self.assertIs(type(fuga), Fuga)
+        self.assertEqual(fuga.title, 'title')
+
 
 if __name__ == '__main__':
     unittest.main()
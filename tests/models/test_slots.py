@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import gc
+import json
+import os
+import sys
+import unittest
+
+from linebot import WebhookParser
+from linebot.models import (
+    MessageEvent, TextSendMessage, TemplateSendMessage, CarouselTemplate, CarouselColumn,
+    PostbackTemplateAction, ImagemapSendMessage, BaseSize, URIImagemapAction, ImagemapArea
+)
+from linebot.models.base import _get_attributes
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+WEBHOOK_PATH = os.path.join(os.path.dirname(__file__), '..', 'text', 'webhook.json')
+
+
+def iter_models(obj):
+    yield obj
+    for value in _get_attributes(obj).values():
+        for item in value if isinstance(value, list) else [value]:
+            if hasattr(item, 'as_json_dict'):
+                for model in iter_models(item):
+                    yield model
+
+
+class TestSlots(unittest.TestCase):
+    def test_no_instance_dict(self):
+        with open(WEBHOOK_PATH) as fp:
+            body = fp.read()
+        parser = WebhookParser('channel_secret')
+        # mock
+        parser.signature_validator.validate = lambda a, b: True
+
+        models = [
+            TemplateSendMessage(alt_text='alt', template=CarouselTemplate(columns=[
+                CarouselColumn(text='text', actions=[PostbackTemplateAction(label='l', data='d')])
+            ])),
+            ImagemapSendMessage(
+                base_url='https://example.com', alt_text='alt',
+                base_size=BaseSize(height=1040, width=1040),
+                actions=[URIImagemapAction(
+                    link_uri='https://example.com',
+                    area=ImagemapArea(x=0, y=0, width=520, height=1040))]),
+        ]
+        for lazy in (False, True):
+            parser.lazy = lazy
+            models.extend(parser.parse(body, 'signature'))
+
+        for model in models:
+            for obj in iter_models(model):
+                # reading __dict__ would create it
+                lazy_raw = getattr(obj, '_lazy_raw', None)
+                dicts = [referent for referent in gc.get_referents(obj)
+                         if type(referent) is dict and referent is not lazy_raw]
+                self.assertEqual(dicts, [], obj.__class__)
+
+    def test_ad_hoc_attribute(self):
+        message = TextSendMessage(text='text')
+        message.quick_note = 'note'
+
+        self.assertEqual(message.quick_note, 'note')
+        self.assertEqual(message.as_json_dict(),
+                         {'type': 'text', 'text': 'text', 'quickNote': 'note'})
+
+    @unittest.skipIf(tracemalloc is None, 'tracemalloc is not available')
+    def test_memory_per_event(self):
+        with open(WEBHOOK_PATH) as fp:
+            sample = [event for event in json.load(fp)['events']
+                      if event['type'] == 'message' and event['message']['type'] == 'text'][0]
+        batch = [json.loads(json.dumps(sample)) for _ in range(2000)]
+
+        events, slots_size = self.measure(
+            lambda: [MessageEvent.new_from_json_dict(data) for data in batch])
+        # the same attributes, held in the __dict__ of plain objects
+        plain_classes = {}
+        _, dict_size = self.measure(
+            lambda: [self.to_plain(event, plain_classes) for event in events])
+
+        event = events[0]
+        objects_size = sum(sys.getsizeof(obj) for obj in (event, event.source, event.message))
+        per_event = slots_size / float(len(batch))
+        # the event, its source and message, and a pointer in the list;
+        # some Pythons allocate room for the __dict__ values with each object
+        self.assertLessEqual(per_event, objects_size + 8 + 32 * 3)
+        self.assertLess(per_event, dict_size / float(len(batch)) * 0.8)
+
+    @staticmethod
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = build()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return result, size
+
+    @classmethod
+    def to_plain(cls, obj, plain_classes):
+        plain_class = plain_classes.get(obj.__class__)
+        if plain_class is None:
+            plain_class = plain_classes[obj.__class__] = type(str('Plain'), (object,), {})
+
+        plain = plain_class()
+        for name, value in _get_attributes(obj).items():
+            if hasattr(value, 'as_json_dict'):
+                value = cls.to_plain(value, plain_classes)
+            setattr(plain, name, value)
+        return plain
+
+
+if __name__ == '__main__':
+    unittest.main()
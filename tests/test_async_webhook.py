@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+import os
+import threading
+import unittest
+
+from linebot import (
+    WebhookHandler
+)
+from linebot.dedup import (
+    MemoryDedupBackend
+)
+from linebot.exceptions import (
+    WebhookHandlerError
+)
+from linebot.middleware import (
+    Middleware, TimingMiddleware
+)
+from linebot.models import (
+    MessageEvent, FollowEvent, TextMessage, SourceUser,
+)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestHandleAsync(unittest.TestCase):
+    def setUp(self):
+        self.handler = WebhookHandler('channel_secret', handler_timeout=1)
+        self.calls = []
+
+        # mock
+        self.handler.parser.signature_validator.validate = lambda a, b: True
+
+    def make_events(self, *texts_by_user):
+        events = [
+            MessageEvent(source=SourceUser(user_id=user_id), message=TextMessage(text=text))
+            for user_id, text in texts_by_user
+        ]
+        self.handler.parser.parse = lambda body, signature: events
+        return events
+
+    def test_webhook_body(self):
+        @self.handler.add(MessageEvent, message=TextMessage)
+        async def message_text(event):
+            self.calls.append('text')
+
+        @self.handler.add(FollowEvent)
+        def follow():
+            self.calls.append(threading.current_thread())
+
+        file_dir = os.path.dirname(__file__)
+        with open(os.path.join(file_dir, 'text', 'webhook.json'), 'rb') as fp:
+            body = fp.read()
+
+        run(self.handler.handle_async(body, 'signature'))
+
+        self.assertEqual(self.calls[0], 'text')
+        # the sync handler runs on an executor thread
+        self.assertIsNot(self.calls[1], threading.current_thread())
+
+    def test_order_per_sender(self):
+        self.make_events(('U1', '0.05'), ('U1', '0'), ('U2', '0'))
+
+        @self.handler.add(MessageEvent)
+        async def message(event):
+            await asyncio.sleep(float(event.message.text))
+            self.calls.append(event.source.user_id + ':' + event.message.text)
+
+        run(self.handler.handle_async('body', 'signature'))
+
+        self.assertEqual(self.calls, ['U2:0', 'U1:0.05', 'U1:0'])
+
+    def test_errors(self):
+        self.handler.handler_timeout = 0.05
+        events = self.make_events(('U1', 'fail'), ('U1', 'ok'), ('U2', 'slow'))
+
+        @self.handler.add(MessageEvent)
+        async def message(event):
+            if event.message.text == 'fail':
+                raise ValueError('fail')
+            if event.message.text == 'slow':
+                await asyncio.sleep(1)
+            self.calls.append(event.source.user_id)
+
+        with self.assertRaises(WebhookHandlerError) as cm:
+            run(self.handler.handle_async('body', 'signature'))
+
+        self.assertEqual(self.calls, ['U1'])
+        self.assertEqual([event for event, _ in cm.exception.errors], [events[0], events[2]])
+        self.assertIsInstance(cm.exception.errors[0][1], ValueError)
+        self.assertIsInstance(cm.exception.errors[1][1], asyncio.TimeoutError)
+
+    def test_dedup(self):
+        self.handler.dedup = MemoryDedupBackend()
+        self.make_events(('U1', 'a'), ('U2', 'b'))
+        failing = {'b'}
+
+        @self.handler.add(MessageEvent)
+        async def message(event):
+            if event.message.text in failing:
+                raise ValueError('fail')
+            self.calls.append(event.message.text)
+
+        with self.assertRaises(WebhookHandlerError):
+            run(self.handler.handle_async('body', 'signature'))
+        failing.clear()
+        run(self.handler.handle_async('body', 'signature'))
+
+        # only the failed event is handled again
+        self.assertEqual(self.calls, ['a', 'b'])
+
+    def test_middleware(self):
+        self.make_events(('U1', 'a'), ('U2', 'b'))
+        calls = self.calls
+
+        class RecordingMiddleware(Middleware):
+            def process_stage(self, stage, call_next, *args):
+                calls.append('sync')
+                return call_next(*args)
+
+        timing = self.handler.use(TimingMiddleware())
+        self.handler.use(RecordingMiddleware())
+
+        @self.handler.add(MessageEvent)
+        async def message(event):
+            await asyncio.sleep(0.05)
+            self.calls.append(event.message.text)
+
+        run(self.handler.handle_async('body', 'signature'))
+
+        self.assertEqual(sorted(self.calls), ['a', 'b', 'sync', 'sync'])
+        [histogram] = [histogram for (stage, handler), histogram in timing.snapshot().items()
+                       if stage == 'handler']
+        self.assertEqual(histogram['count'], 2)
+        # the coroutine is timed until it finishes
+        self.assertGreaterEqual(histogram['sum'], 0.04 * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import time
+import unittest
+
+import requests
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.circuit_breaker import (
+    CircuitBreaker
+)
+from linebot.exceptions import (
+    CircuitOpenError, LineBotApiError
+)
+from linebot.models import (
+    TextSendMessage
+)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.tested = CircuitBreaker(
+            window_size=4, minimum_calls=4, recovery_timeout=0.05)
+
+    def test_open_on_error_rate(self):
+        for status_code in (200, 500, 200, 503):
+            self.tested.before_call('push')
+            self.tested.record('push', status_code)
+
+        self.assertEqual(self.tested.get_state('push'), CircuitBreaker.OPEN)
+        self.assertEqual(self.tested.get_state('reply'), CircuitBreaker.CLOSED)
+        with self.assertRaises(CircuitOpenError) as cm:
+            self.tested.before_call('push')
+        self.assertEqual(cm.exception.endpoint_class, 'push')
+        self.assertGreater(cm.exception.retry_after, 0)
+        self.tested.before_call('reply')
+
+    def test_open_on_timeout_rate(self):
+        for timeout in (False, False, False, True):
+            self.tested.record('push', 200 if not timeout else None, timeout=timeout)
+
+        self.assertEqual(self.tested.get_state('push'), CircuitBreaker.OPEN)
+
+    def test_client_error_is_success(self):
+        for _ in range(4):
+            self.tested.record('push', 400)
+
+        self.assertEqual(self.tested.get_state('push'), CircuitBreaker.CLOSED)
+
+    def test_half_open(self):
+        for _ in range(4):
+            self.tested.record('push', 500)
+        time.sleep(0.1)
+
+        self.tested.before_call('push')
+        self.assertEqual(self.tested.get_state('push'), CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.tested.before_call('push')
+
+        self.tested.record('push', 500)
+        self.assertEqual(self.tested.get_state('push'), CircuitBreaker.OPEN)
+        time.sleep(0.1)
+
+        self.tested.before_call('push')
+        self.tested.record('push', 200)
+        self.assertEqual(self.tested.get_state('push'), CircuitBreaker.CLOSED)
+
+
+class TestLineBotApiCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.circuit_breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        self.tested = LineBotApi('channel_secret', circuit_breaker=self.circuit_breaker)
+
+    @responses.activate
+    def test_fail_fast(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={'message': 'error'}, status=500
+        )
+
+        for _ in range(2):
+            with self.assertRaises(LineBotApiError):
+                self.tested.push_message('to', TextSendMessage(text='Hello, world'))
+        with self.assertRaises(CircuitOpenError):
+            self.tested.push_message('to', TextSendMessage(text='Hello, world'))
+
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_timeout(self):
+        responses.add(
+            responses.GET,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/profile/user_id',
+            body=requests.exceptions.ReadTimeout()
+        )
+
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.Timeout):
+                self.tested.get_profile('user_id')
+
+        self.assertEqual(self.circuit_breaker.get_state('profile'), CircuitBreaker.OPEN)
+        self.assertEqual(self.circuit_breaker.get_state('push'), CircuitBreaker.CLOSED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from builtins import open
+from future.moves.queue import Full
+from linebot import (
+    WebhookHandler
+)
+from linebot.dedup import (
+    MemoryDedupBackend, SqliteDedupBackend, get_fingerprint
+)
+from linebot.exceptions import (
+    WebhookHandlerError
+)
+from linebot.models import (
+    MessageEvent, UnfollowEvent, TextMessage, SourceUser, SourceGroup,
+)
+
+
+class TestGetFingerprint(unittest.TestCase):
+    def test_reply_token(self):
+        self.assertEqual(
+            get_fingerprint(MessageEvent(reply_token='token', timestamp=1)),
+            get_fingerprint(MessageEvent(reply_token='token', timestamp=2)))
+
+    def test_without_reply_token(self):
+        event = UnfollowEvent(timestamp=1462629479859, source=SourceUser(user_id='U1'))
+
+        self.assertEqual(
+            get_fingerprint(event),
+            get_fingerprint(UnfollowEvent(
+                timestamp=1462629479859, source=SourceUser(user_id='U1'))))
+        self.assertNotEqual(
+            get_fingerprint(event),
+            get_fingerprint(UnfollowEvent(
+                timestamp=1462629479859, source=SourceUser(user_id='U2'))))
+        self.assertNotEqual(
+            get_fingerprint(event),
+            get_fingerprint(UnfollowEvent(
+                timestamp=1462629479859, source=SourceGroup(group_id='U1'))))
+
+
+class TestMemoryDedupBackend(unittest.TestCase):
+    def test_add(self):
+        backend = MemoryDedupBackend()
+
+        self.assertTrue(backend.add('a'))
+        self.assertFalse(backend.add('a'))
+        self.assertTrue(backend.add('b'))
+
+    def test_ttl(self):
+        backend = MemoryDedupBackend(ttl=0.05)
+
+        self.assertTrue(backend.add('a'))
+        time.sleep(0.1)
+        self.assertTrue(backend.add('a'))
+
+    def test_max_size(self):
+        backend = MemoryDedupBackend(max_size=2)
+
+        for fingerprint in ('a', 'b', 'c'):
+            self.assertTrue(backend.add(fingerprint))
+
+        self.assertFalse(backend.add('c'))
+        self.assertTrue(backend.add('a'))
+
+    def test_max_size_keeps_oldest_until_insert(self):
+        backend = MemoryDedupBackend(max_size=2)
+
+        self.assertTrue(backend.add('a'))
+        self.assertTrue(backend.add('b'))
+        self.assertFalse(backend.add('a'))
+
+    def test_discard(self):
+        backend = MemoryDedupBackend()
+
+        self.assertTrue(backend.add('a'))
+        backend.discard('a')
+        backend.discard('unknown')
+        self.assertTrue(backend.add('a'))
+
+
+class TestSqliteDedupBackend(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'dedup.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_shared(self):
+        backend1 = SqliteDedupBackend(self.path)
+        backend2 = SqliteDedupBackend(self.path)
+
+        self.assertTrue(backend1.add('a'))
+        self.assertFalse(backend2.add('a'))
+        self.assertTrue(backend2.add('b'))
+
+    def test_ttl(self):
+        backend = SqliteDedupBackend(self.path, ttl=0.05)
+
+        self.assertTrue(backend.add('a'))
+        time.sleep(0.1)
+        self.assertTrue(backend.add('a'))
+
+    def test_discard(self):
+        backend = SqliteDedupBackend(self.path)
+
+        self.assertTrue(backend.add('a'))
+        backend.discard('a')
+        self.assertTrue(backend.add('a'))
+
+
+class TestWebhookHandlerDedup(unittest.TestCase):
+    def setUp(self):
+        self.handler = WebhookHandler('channel_secret', dedup=MemoryDedupBackend())
+        self.calls = []
+
+        @self.handler.default()
+        def default(event):
+            self.calls.append(event)
+
+        # mock
+        self.handler.parser.signature_validator.validate = lambda a, b: True
+
+    def test_handle(self):
+        file_dir = os.path.dirname(__file__)
+        with open(os.path.join(file_dir, 'text', 'webhook.json')) as fp:
+            body = fp.read()
+
+        self.handler.handle(body, 'signature')
+        self.handler.handle(body, 'signature')
+
+        # the sample events share one reply token
+        self.assertEqual(len(self.calls), 3)
+        self.assertIsInstance(self.calls[0], MessageEvent)
+        self.assertIsInstance(self.calls[0].message, TextMessage)
+        self.assertIsInstance(self.calls[1], UnfollowEvent)
+
+    def test_enqueue(self):
+        self.handler.start()
+        try:
+            for _ in range(2):
+                self.handler.parser.parse = lambda body, signature: [
+                    UnfollowEvent(timestamp=1462629479859, source=SourceUser(user_id='U1'))]
+                self.handler.enqueue('body', 'signature')
+        finally:
+            self.handler.stop()
+
+        self.assertEqual(len(self.calls), 1)
+
+    def test_failed_handler_is_redelivered(self):
+        events = [
+            UnfollowEvent(timestamp=1, source=SourceUser(user_id='U1')),
+            UnfollowEvent(timestamp=2, source=SourceUser(user_id='U2')),
+            UnfollowEvent(timestamp=3, source=SourceUser(user_id='U3')),
+        ]
+        self.handler.parser.parse = lambda body, signature: list(events)
+        failing = {2}
+
+        @self.handler.default()
+        def default(event):
+            if event.timestamp in failing:
+                raise ValueError('failed')
+            self.calls.append(event.timestamp)
+
+        with self.assertRaises(ValueError):
+            self.handler.handle('body', 'signature')
+        failing.clear()
+        self.handler.handle('body', 'signature')
+
+        # the failed event and the ones after it are handled on redelivery
+        self.assertEqual(self.calls, [1, 2, 3])
+
+    def test_failed_handler_is_redelivered_concurrently(self):
+        handler = WebhookHandler('channel_secret', max_workers=2, dedup=MemoryDedupBackend())
+        event = UnfollowEvent(timestamp=1, source=SourceUser(user_id='U1'))
+        handler.parser.parse = lambda body, signature: [event]
+        attempts = []
+
+        @handler.default()
+        def default(event):
+            attempts.append(event)
+            if len(attempts) == 1:
+                raise ValueError('failed')
+
+        with handler:
+            with self.assertRaises(WebhookHandlerError):
+                handler.handle('body', 'signature')
+            handler.handle('body', 'signature')
+            handler.handle('body', 'signature')
+
+        self.assertEqual(len(attempts), 2)
+
+    def test_enqueue_full(self):
+        self.handler.parser.parse = lambda body, signature: [
+            UnfollowEvent(timestamp=i, source=SourceUser(user_id='U1')) for i in range(3)]
+        self.handler.start(workers=0, queue_size=1)
+        try:
+            with self.assertRaises(Full):
+                self.handler.enqueue('body', 'signature')
+        finally:
+            self.handler._queue = None
+
+        # the events that were not queued are not recorded as seen
+        self.assertEqual(
+            [self.handler.dedup.add(get_fingerprint(event))
+             for event in self.handler.parser.parse('body', 'signature')],
+            [False, True, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import unittest
+
+import responses
+from linebot import (
+    LineBotApi, RequestsHttpClient
+)
+
+
+class TestRequestsHttpClient(unittest.TestCase):
+    def test_pool_settings(self):
+        http_client = RequestsHttpClient(pool_connections=2, pool_maxsize=20)
+
+        adapter = http_client.session.get_adapter('https://api.line.me')
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(http_client.session.headers['Connection'], 'keep-alive')
+
+    def test_keep_alive_disabled(self):
+        http_client = RequestsHttpClient(keep_alive=False)
+
+        self.assertEqual(http_client.session.headers['Connection'], 'close')
+
+    @responses.activate
+    def test_cookies_are_not_stored(self):
+        responses.add(
+            responses.GET, 'https://api.line.me/hoge',
+            json={}, status=200, headers={'Set-Cookie': 'hoge=bar; Domain=api.line.me'}
+        )
+        http_client = RequestsHttpClient()
+
+        http_client.get('https://api.line.me/hoge')
+
+        self.assertEqual(len(http_client.session.cookies), 0)
+
+
+class TestLineBotApiLifecycle(unittest.TestCase):
+    def test_shared_http_client(self):
+        http_client = RequestsHttpClient(pool_maxsize=4)
+        line_bot_api = LineBotApi('channel_secret', http_client=http_client)
+
+        self.assertIs(line_bot_api.http_client, http_client)
+
+    def test_context_manager(self):
+        closed = []
+
+        with LineBotApi('channel_secret') as line_bot_api:
+            line_bot_api.http_client.session.close = lambda: closed.append(True)
+
+        self.assertEqual(closed, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+from linebot import (
+    LineBotApi
+)
+from linebot.exceptions import (
+    LineBotApiError
+)
+from linebot.models import (
+    TextSendMessage
+)
+
+try:
+    import httpx
+    from linebot.httpx_http_client import HttpxHttpClient
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestHttpxHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            if request.url.path == '/v2/bot/message/push':
+                return httpx.Response(200, json={})
+            if request.url.path == '/v2/bot/profile/user_id':
+                return httpx.Response(200, json={'displayName': 'alice'})
+            if request.url.path == '/v2/bot/message/1/content':
+                return httpx.Response(
+                    200, content=b'\x00\x01\x02', headers={'content-type': 'image/jpeg'})
+            return httpx.Response(404, json={'message': 'Not found'})
+
+        self.http_client = HttpxHttpClient(
+            client=httpx.Client(transport=httpx.MockTransport(handler)))
+        self.tested = LineBotApi('channel_secret', http_client=self.http_client)
+
+    def tearDown(self):
+        self.tested.close()
+
+    def test_push_message(self):
+        self.tested.push_message('to', TextSendMessage(text='Hello, world'))
+
+        request = self.requests[0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(request.headers['Content-Type'], 'application/json')
+        self.assertEqual(
+            json.loads(request.content.decode('utf-8')),
+            {"to": "to", "messages": [{"type": "text", "text": "Hello, world"}]}
+        )
+
+    def test_get_profile(self):
+        profile = self.tested.get_profile('user_id')
+
+        self.assertEqual(profile.display_name, 'alice')
+
+    def test_get_message_content(self):
+        content = self.tested.get_message_content('1')
+
+        self.assertEqual(content.content_type, 'image/jpeg')
+        self.assertEqual(b''.join(content.iter_content(chunk_size=2)), b'\x00\x01\x02')
+
+    def test_error_handle(self):
+        with self.assertRaises(LineBotApiError) as cm:
+            self.tested.get_profile('unknown')
+
+        self.assertEqual(cm.exception.status_code, 404)
+        self.assertEqual(cm.exception.error.message, 'Not found')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import unittest
+
+from linebot import json_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.default_backend = json_codec.BACKEND
+        self.backends = [name for name, backend in json_codec._BACKENDS.items()
+                         if backend is not None]
+
+    def tearDown(self):
+        json_codec.set_backend(self.default_backend)
+
+    def test_round_trip(self):
+        obj = {'to': 'U1', 'messages': [{'type': 'text', 'text': 'こんにちは "world" /'}],
+               'n': 1, 'f': 1.5, 'b': True, 'z': None}
+
+        for name in self.backends:
+            json_codec.set_backend(name)
+            encoded = json_codec.dumps(obj)
+            self.assertIsInstance(encoded, bytes, name)
+            self.assertEqual(json.loads(encoded.decode('utf-8')), obj, name)
+            self.assertEqual(json_codec.loads(encoded), obj, name)
+            self.assertEqual(json_codec.loads(memoryview(encoded)), obj, name)
+            self.assertEqual(json_codec.loads(encoded.decode('utf-8')), obj, name)
+
+    def test_default_backend(self):
+        # the fastest installed backend
+        self.assertEqual(self.default_backend, next(
+            name for name in ('orjson', 'ujson', 'json') if name in self.backends))
+
+    def test_unavailable_backend(self):
+        with self.assertRaises(ValueError):
+            json_codec.set_backend('unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
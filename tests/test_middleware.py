@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import base64
+import hashlib
+import hmac
+import unittest
+
+from linebot import WebhookHandler
+from linebot.exceptions import InvalidSignatureError
+from linebot.middleware import Middleware, MiddlewareChain, TimingMiddleware
+from linebot.models import FollowEvent, UnfollowEvent
+
+BODY = '{"events": [' \
+       '{"type": "follow", "timestamp": 1, "replyToken": "r1",' \
+       ' "source": {"type": "user", "userId": "U1"}},' \
+       '{"type": "unfollow", "timestamp": 2, "source": {"type": "user", "userId": "U2"}},' \
+       '{"type": "unknown", "timestamp": 3}]}'
+
+
+def sign(body):
+    return base64.b64encode(
+        hmac.new(b'channel_secret', body.encode('utf-8'), hashlib.sha256).digest()
+    ).decode('utf-8')
+
+
+class RecordingMiddleware(Middleware):
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def process_stage(self, stage, call_next, *args):
+        self.calls.append((self.name, stage, 'before'))
+        result = call_next(*args)
+        self.calls.append((self.name, stage, 'after'))
+        return result
+
+
+class SkipUnfollowMiddleware(Middleware):
+    def process_stage(self, stage, call_next, *args):
+        if stage == 'handler' and isinstance(args[1], UnfollowEvent):
+            return None
+        return call_next(*args)
+
+
+class TestMiddlewareChain(unittest.TestCase):
+    def test_order(self):
+        calls = []
+        chain = MiddlewareChain([RecordingMiddleware('a', calls)])
+        chain.use(RecordingMiddleware('b', calls))
+
+        self.assertEqual(chain.run('decode', lambda x: calls.append('stage') or x * 2, 21), 42)
+        self.assertEqual(calls, [
+            ('a', 'decode', 'before'), ('b', 'decode', 'before'), 'stage',
+            ('b', 'decode', 'after'), ('a', 'decode', 'after'),
+        ])
+
+    def test_empty(self):
+        self.assertEqual(MiddlewareChain().run('decode', lambda x: x, 1), 1)
+
+
+class TestWebhookHandlerMiddleware(unittest.TestCase):
+    def setUp(self):
+        self.handler = WebhookHandler('channel_secret')
+        self.handled = []
+
+        @self.handler.add(FollowEvent)
+        def follow(event):
+            self.handled.append(event.type)
+
+        @self.handler.add(UnfollowEvent)
+        def unfollow():
+            self.handled.append('unfollow')
+
+    def test_stages(self):
+        calls = []
+        middleware = self.handler.use(RecordingMiddleware('a', calls))
+        self.assertIsInstance(middleware, RecordingMiddleware)
+
+        self.handler.handle(BODY, sign(BODY))
+
+        stages = [stage for _, stage, when in calls if when == 'before']
+        self.assertEqual(stages, [
+            'validate', 'decode', 'build', 'build', 'build', 'handler', 'handler'])
+        self.assertEqual(self.handled, ['follow', 'unfollow'])
+
+    def test_skip_handler(self):
+        self.handler.use(SkipUnfollowMiddleware())
+
+        self.handler.handle(BODY, sign(BODY))
+
+        self.assertEqual(self.handled, ['follow'])
+
+    def test_timing(self):
+        timing = self.handler.use(TimingMiddleware(buckets=[0.5, 0.01]))
+
+        self.handler.handle(BODY, sign(BODY))
+        parser = self.handler.parser
+        parser.parse(BODY, sign(BODY))
+        list(parser.iter_parse(BODY, sign(BODY)))
+        with self.assertRaises(InvalidSignatureError):
+            parser.parse(BODY, 'invalid')
+
+        snapshot = timing.snapshot()
+        self.assertEqual(snapshot[('validate', None)]['count'], 4)
+        self.assertEqual(snapshot[('decode', None)]['count'], 1 + 1)
+        # each event, and the end of the array
+        self.assertEqual(snapshot[('decode_event', None)]['count'], 3 + 1)
+        self.assertEqual(snapshot[('build', None)]['count'], 3 + 3 + 3)
+        # qualified name on Python 3
+        [follow] = [histogram for (stage, handler), histogram in snapshot.items()
+                    if stage == 'handler' and handler.endswith('follow')
+                    and not handler.endswith('unfollow')]
+        self.assertEqual(follow['count'], 1)
+        self.assertEqual([upper for upper, _ in follow['buckets']], [0.01, 0.5, float('inf')])
+        self.assertEqual(follow['buckets'][-1][1], 1)
+        self.assertGreaterEqual(follow['sum'], 0)
+
+        text = timing.render_prometheus()
+        lines = text.splitlines()
+        self.assertEqual(lines[0], '# HELP linebot_webhook_stage_seconds '
+                                   'Latency of webhook processing stages.')
+        self.assertEqual(lines[1], '# TYPE linebot_webhook_stage_seconds histogram')
+        self.assertIn('linebot_webhook_stage_seconds_bucket{stage="validate",le="+Inf"} 4',
+                      lines)
+        self.assertIn('linebot_webhook_stage_seconds_count{stage="validate"} 4', lines)
+        self.assertTrue(any(line.startswith(
+            'linebot_webhook_stage_seconds_bucket{stage="handler",handler="') and
+            line.endswith('follow",le="0.01"} 1') for line in lines))
+        self.assertTrue(text.endswith('\n'))
+
+    def test_timing_escape(self):
+        timing = TimingMiddleware()
+        timing.observe('handler', 0.2, handler='a"b\\c\nd')
+
+        self.assertIn('handler="a\\"b\\\\c\\nd"', timing.render_prometheus(name='m'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.circuit_breaker import (
+    CircuitBreaker
+)
+from linebot.models import (
+    TextSendMessage
+)
+from linebot.outbox import Outbox
+
+
+class TestOutbox(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'outbox.db')
+        self.line_bot_api = LineBotApi('channel_secret')
+        self.tested = Outbox(self.line_bot_api, self.path, workers=2,
+                             batch_size=2, backoff=0, poll_interval=0.01)
+
+        # test data
+        self.text_message = TextSendMessage(text='Hello, world')
+
+    def tearDown(self):
+        self.tested.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    @responses.activate
+    def test_push_message(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={}, status=200
+        )
+
+        spool_id = self.tested.push_message('to', self.text_message)
+        self.assertEqual(self.tested.depth, 1)
+        self.assertEqual(len(responses.calls), 0)
+
+        self.assertEqual(self.tested.drain(), 1)
+
+        self.assertEqual(len(responses.calls), 1)
+        request = responses.calls[0].request
+        self.assertEqual(request.headers['X-Line-Retry-Key'], spool_id)
+        self.assertEqual(json.loads(request.body), {
+            'to': 'to',
+            'messages': [{'type': 'text', 'text': 'Hello, world'}]
+        })
+        self.assertEqual(self.tested.depth, 0)
+        self.assertEqual(self.tested.stats()['sent_total'], 1)
+        self.assertGreater(self.tested.drain_rate, 0)
+
+    @responses.activate
+    def test_multicast(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/multicast',
+            json={}, status=200
+        )
+
+        self.tested.multicast(['to1', 'to2'], [self.text_message])
+        self.tested.drain()
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(json.loads(responses.calls[0].request.body)['to'], ['to1', 'to2'])
+
+    @responses.activate
+    def test_retry_until_dead(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={'message': 'error'}, status=500
+        )
+
+        spool_id = self.tested.push_message('to', self.text_message)
+        # backoff is 0, so every retry is ready within the same drain
+        self.assertEqual(self.tested.drain(), Outbox.DEFAULT_MAX_ATTEMPTS)
+
+        self.assertEqual(self.tested.depth, 0)
+        self.assertEqual(self.tested.dead, 1)
+        self.assertEqual(len(responses.calls), Outbox.DEFAULT_MAX_ATTEMPTS)
+        for call in responses.calls:
+            self.assertEqual(call.request.headers['X-Line-Retry-Key'], spool_id)
+
+    @responses.activate
+    def test_open_circuit_is_not_an_attempt(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={'message': 'error'}, status=500
+        )
+        circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1, recovery_timeout=60)
+        self.line_bot_api.circuit_breaker = circuit_breaker
+
+        spool_id = self.tested.push_message('to', self.text_message)
+        # sent once, then deferred by the open circuit
+        self.assertEqual(self.tested.drain(), 2)
+
+        self.assertEqual(circuit_breaker.get_state('push'), CircuitBreaker.OPEN)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.tested.depth, 1)
+        attempts, next_attempt_at = self.tested._connection().execute(
+            'SELECT attempts, next_attempt_at FROM outbox WHERE id = ?', (spool_id,)).fetchone()
+        self.assertEqual(attempts, 1)
+        self.assertGreater(next_attempt_at, time.time() + 30)
+
+    @responses.activate
+    def test_client_error_is_not_retried(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={'message': 'Invalid reply token'}, status=400
+        )
+
+        self.tested.push_message('to', self.text_message)
+        self.tested.drain()
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.tested.dead, 1)
+        self.assertEqual(self.tested.stats()['failed_total'], 1)
+
+    @responses.activate
+    def test_expired_lease_is_sent_again(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={}, status=200
+        )
+
+        self.tested.push_message('to', self.text_message)
+        crashed = Outbox(self.line_bot_api, self.path, lease_timeout=0.05)
+        self.assertEqual(len(crashed._claim()), 1)
+        self.assertEqual(self.tested.drain(), 0)
+
+        time.sleep(0.1)
+        self.assertEqual(self.tested.drain(), 1)
+        self.assertEqual(self.tested.depth, 0)
+
+    @responses.activate
+    def test_workers(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={}, status=200
+        )
+
+        for i in range(10):
+            self.tested.push_message('to{0}'.format(i), self.text_message)
+
+        with self.tested:
+            deadline = time.time() + 5
+            while self.tested.depth and time.time() < deadline:
+                time.sleep(0.01)
+
+        self.assertEqual(self.tested.depth, 0)
+        self.assertEqual(
+            sorted(json.loads(call.request.body)['to'] for call in responses.calls),
+            sorted('to{0}'.format(i) for i in range(10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
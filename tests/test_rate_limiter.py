@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from __future__ import unicode_literals, absolute_import
+
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import unittest
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+import responses
+from linebot import (
+    LineBotApi
+)
+from linebot.models import (
+    TextSendMessage
+)
+from linebot.rate_limiter import (
+    TokenBucket, FileTokenBucket, RateLimiter
+)
+
+
+class RecordingRateLimiter(RateLimiter):
+    def __init__(self, **kwargs):
+        super(RecordingRateLimiter, self).__init__(**kwargs)
+        self.acquired = []
+
+    def acquire(self, endpoint_class):
+        self.acquired.append(endpoint_class)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_thread_safe(self):
+        bucket = TokenBucket(rate=1, capacity=100)
+        waits = []
+
+        def take():
+            for _ in range(50):
+                waits.append(bucket.reserve())
+
+        threads = [threading.Thread(target=take) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len([wait for wait in waits if wait == 0]), 100)
+        self.assertAlmostEqual(max(waits), 100, places=0)
+
+
+class TestFileTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'bucket')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_shared_budget(self):
+        bucket1 = FileTokenBucket(self.path, rate=10, capacity=2)
+        bucket2 = FileTokenBucket(self.path, rate=10, capacity=2)
+
+        self.assertEqual(bucket1.reserve(), 0)
+        self.assertEqual(bucket2.reserve(), 0)
+        self.assertAlmostEqual(bucket1.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket2.reserve(), 0.2, places=2)
+
+        bucket1.close()
+        bucket2.close()
+
+    @unittest.skipUnless(hasattr(os, 'fork') and fcntl is not None, 'requires fork')
+    def test_fork(self):
+        bucket = FileTokenBucket(self.path, rate=10, capacity=2)
+        bucket.reserve()
+
+        # the parent holds the file lock while the child takes a token
+        fcntl.flock(bucket._fd, fcntl.LOCK_EX)
+        try:
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover
+                signal.signal(signal.SIGALRM, lambda *args: os._exit(0))
+                signal.alarm(1)
+                try:
+                    bucket.reserve()
+                finally:
+                    os._exit(1)  # not excluded by the parent's lock
+            _, status = os.waitpid(pid, 0)
+        finally:
+            fcntl.flock(bucket._fd, fcntl.LOCK_UN)
+        self.assertEqual(status, 0)
+
+        bucket.close()
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_buckets_per_endpoint_class(self):
+        rate_limiter = RateLimiter(buckets={
+            'push': TokenBucket(rate=10, capacity=1),
+        })
+
+        self.assertEqual(rate_limiter.reserve('push'), 0)
+        self.assertGreater(rate_limiter.reserve('push'), 0)
+        self.assertEqual(rate_limiter.reserve('reply'), 0)
+        self.assertEqual(rate_limiter.reserve('reply'), 0)
+
+    @responses.activate
+    def test_line_bot_api(self):
+        responses.add(
+            responses.POST,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/message/push',
+            json={}, status=200
+        )
+        responses.add(
+            responses.GET,
+            LineBotApi.DEFAULT_API_ENDPOINT + '/v2/bot/profile/user_id',
+            json={}, status=200
+        )
+        rate_limiter = RecordingRateLimiter()
+        line_bot_api = LineBotApi('channel_secret', rate_limiter=rate_limiter)
+
+        line_bot_api.push_message('to', TextSendMessage(text='hoge'))
+        line_bot_api.get_profile('user_id')
+
+        self.assertEqual(rate_limiter.acquired, ['push', 'profile'])
+
+
+if __name__ == '__main__':
+    unittest.main()
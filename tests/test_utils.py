@@ -15,8 +15,9 @@
 from __future__ import unicode_literals, absolute_import
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from linebot.utils import to_camel_case, to_snake_case, safe_compare_digest
+from linebot.utils import to_camel_case, to_snake_case, safe_compare_digest, imap_unordered
 
 
 class TestUtils(unittest.TestCase):
@@ -35,6 +36,23 @@ class TestUtils(unittest.TestCase):
     def test_safe_compare_digest_false_different_size(self):
         self.assertFalse(safe_compare_digest('/gg9a+LvFevTH1sd7', '/gg9a+LvFevTH1sd78'))
 
+    def test_imap_unordered(self):
+        consumed = []
+
+        def items():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = imap_unordered(executor, lambda x: x * 2, items(), 3)
+
+        results = [next(futures).result()]
+        self.assertLessEqual(len(consumed), 4)
+        results.extend(future.result() for future in futures)
+        self.assertEqual(sorted(results), [2 * i for i in range(10)])
+        executor.shutdown()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,13 +14,24 @@
 
 from __future__ import unicode_literals, absolute_import
 
+import base64
+import copy
+import hashlib
+import hmac
 import os
+import pickle
+import threading
+import time
 import unittest
+from concurrent.futures import TimeoutError
 
 from builtins import open
 from linebot import (
     SignatureValidator, WebhookParser, WebhookHandler
 )
+from linebot.exceptions import (
+    InvalidSignatureError, WebhookHandlerError
+)
 from linebot.models import (
     MessageEvent, FollowEvent, UnfollowEvent, JoinEvent,
     LeaveEvent, PostbackEvent, BeaconEvent,
@@ -28,6 +39,9 @@ from linebot.models import (
     LocationMessage, StickerMessage,
     SourceUser, SourceRoom, SourceGroup,
 )
+from linebot.models.events import (
+    EVENT_TYPES, Event, register_event_type,
+)
 
 
 class TestSignatureValidator(unittest.TestCase):
@@ -45,6 +59,20 @@ class TestSignatureValidator(unittest.TestCase):
             False
         )
 
+    def test_validate_bytes(self):
+        signature_validator = SignatureValidator('channel_secret')
+
+        self.assertEqual(
+            signature_validator.validate(
+                b'bodybodybodybody', '/gg9a+LvFevTH1sd7XCQycD7tsWclCsInj7MhBHxN7k='),
+            True
+        )
+        self.assertEqual(
+            signature_validator.validate(
+                memoryview(b'bodybodybodybody'), '/gg9a+LvFevTH1sd7XCQycD7tsWclCsInj7MhBHxN7k='),
+            True
+        )
+
 
 class TestWebhookParser(unittest.TestCase):
     def test_parse(self):
@@ -205,6 +233,153 @@ class TestWebhookParser(unittest.TestCase):
         self.assertEqual(events[11].beacon.hwid, 'd41d8cd98f')
         self.assertEqual(events[11].beacon.type, 'enter')
 
+    def test_parse_lazy(self):
+        file_dir = os.path.dirname(__file__)
+        webhook_sample_json_path = os.path.join(file_dir, 'text', 'webhook.json')
+        with open(webhook_sample_json_path) as fp:
+            body = fp.read()
+
+        parser = WebhookParser('channel_secret', lazy=True)
+        # mock
+        parser.signature_validator.validate = lambda a, b: True
+
+        events = parser.parse(body, 'signature')
+
+        self.assertIsInstance(events[0], MessageEvent)
+        self.assertEqual(events[0].type, 'message')
+        self.assertEqual(events[0].reply_token, 'nHuyWiB7yP5Zw52FIkcQobQuGDXCTA')
+        self.assertIn('message', events[0]._lazy_raw)
+        self.assertIsInstance(events[0].message, TextMessage)
+        self.assertEqual(events[0].message.text, 'Hello, world')
+        self.assertNotIn('message', events[0]._lazy_raw)
+        # only the attribute being read is built
+        self.assertIn('source', events[0]._lazy_raw)
+        self.assertIsInstance(events[0].source, SourceUser)
+        self.assertEqual(events[0].source.sender_id, 'U206d25c2ea6bd87c17655609a1c37cb8')
+        self.assertIsInstance(events[10], PostbackEvent)
+        self.assertEqual(events[10].postback.data, 'action=buyItem&itemId=123123&color=red')
+        self.assertFalse(hasattr(events[6], 'message'))
+
+        # every event equals the eagerly parsed one
+        self.assertEqual(events, self.parse_eager(body))
+
+        # lazy events pickle and copy as eager ones
+        events = parser.parse(body, 'signature')
+        for copied in (pickle.loads(pickle.dumps(events)), copy.deepcopy(events)):
+            self.assertEqual(copied, self.parse_eager(body))
+            self.assertIs(type(copied[0]), MessageEvent)
+
+    @staticmethod
+    def parse_eager(body):
+        parser = WebhookParser('channel_secret')
+        # mock
+        parser.signature_validator.validate = lambda a, b: True
+        return parser.parse(body, 'signature')
+
+    def test_parse_bytes(self):
+        file_dir = os.path.dirname(__file__)
+        webhook_sample_json_path = os.path.join(file_dir, 'text', 'webhook.json')
+        with open(webhook_sample_json_path, 'rb') as fp:
+            body = fp.read()
+
+        parser = WebhookParser('channel_secret')
+        signature = base64.b64encode(
+            hmac.new(b'channel_secret', body, hashlib.sha256).digest()).decode('utf-8')
+
+        expected = parser.parse(body.decode('utf-8'), signature)
+        self.assertEqual(parser.parse_bytes(body, signature), expected)
+        self.assertEqual(parser.parse_bytes(memoryview(body), signature), expected)
+        self.assertEqual(len(expected), 12)
+
+        with self.assertRaises(InvalidSignatureError):
+            parser.parse_bytes(body, 'invalid_signature')
+
+    def test_iter_parse(self):
+        file_dir = os.path.dirname(__file__)
+        webhook_sample_json_path = os.path.join(file_dir, 'text', 'webhook.json')
+        with open(webhook_sample_json_path, 'rb') as fp:
+            body = fp.read()
+
+        parser = WebhookParser('channel_secret')
+        signature = base64.b64encode(
+            hmac.new(b'channel_secret', body, hashlib.sha256).digest()).decode('utf-8')
+
+        expected = parser.parse_bytes(body, signature)
+        self.assertEqual(list(parser.iter_parse(body, signature)), expected)
+        self.assertEqual(list(parser.iter_parse(memoryview(body), signature)), expected)
+        self.assertEqual(list(parser.iter_parse(body.decode('utf-8'), signature)), expected)
+
+        # the signature is checked before the first event is requested
+        with self.assertRaises(InvalidSignatureError):
+            parser.iter_parse(body, 'invalid_signature')
+
+    def test_iter_parse_incremental(self):
+        parser = WebhookParser('channel_secret')
+        # mock
+        parser.signature_validator.validate = lambda a, b: True
+
+        body = '{"destination": {"id": [1, "]"]}, "events" : [ ' \
+               '{"type": "unfollow", "timestamp": 1,' \
+               ' "source": {"type": "user", "userId": "U1"}} ,' \
+               '{"type": "unknown", "timestamp": 2},' \
+               '{"type": "unfollow", "timestamp": 3, "source": {"type": "user", "userId": "U3"}}' \
+               ' ], "other": "value" }'
+
+        events = parser.iter_parse(body, 'signature')
+        self.assertEqual(next(events).source.user_id, 'U1')
+        self.assertEqual(next(events).source.user_id, 'U3')
+        self.assertEqual(list(events), [])
+
+        self.assertEqual(list(parser.iter_parse('{"events": []}', 'signature')), [])
+
+        # as strict as parse
+        with self.assertRaises(KeyError):
+            list(parser.iter_parse('{}', 'signature'))
+        with self.assertRaises(ValueError):
+            list(parser.iter_parse('{"events": []} {}', 'signature'))
+        with self.assertRaises(TypeError):
+            list(parser.iter_parse('{"events": [null]}', 'signature'))
+
+        # events before malformed JSON are still yielded
+        events = parser.iter_parse(
+            '{"events": [{"type": "unfollow", "timestamp": 1} {"type"', 'signature')
+        self.assertEqual(next(events).timestamp, 1)
+        with self.assertRaises(ValueError):
+            next(events)
+
+        parser.lazy = True
+        events = list(parser.iter_parse(body, 'signature'))
+        self.assertIn('source', events[0]._lazy_raw)
+        self.assertEqual(events[1].source.user_id, 'U3')
+
+    def test_register_event_type(self):
+        class AccountLinkEvent(Event):
+            def __init__(self, timestamp=None, source=None, link=None, **kwargs):
+                super(AccountLinkEvent, self).__init__(
+                    timestamp=timestamp, source=source, **kwargs
+                )
+
+                self.type = 'accountLink'
+                self.link = link
+
+        body = '{"events": [{"type": "accountLink", "timestamp": 1462629479859, ' \
+               '"link": {"result": "ok"}}, {"type": "unknown", "timestamp": 1462629479859}]}'
+        parser = WebhookParser('channel_secret')
+        # mock
+        parser.signature_validator.validate = lambda a, b: True
+
+        self.assertEqual(parser.parse(body, 'signature'), [])
+
+        register_event_type('accountLink', AccountLinkEvent)
+        try:
+            events = parser.parse(body, 'signature')
+        finally:
+            del EVENT_TYPES['accountLink']
+
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0], AccountLinkEvent)
+        self.assertEqual(events[0].link, {'result': 'ok'})
+
 
 class TestWebhookHandler(unittest.TestCase):
     def setUp(self):
@@ -272,6 +447,212 @@ class TestWebhookHandler(unittest.TestCase):
         self.assertEqual(self.calls[10], '6 postback')
         self.assertEqual(self.calls[11], '7 beacon')
 
+    def test_handler_bytes(self):
+        file_dir = os.path.dirname(__file__)
+        webhook_sample_json_path = os.path.join(file_dir, 'text', 'webhook.json')
+        with open(webhook_sample_json_path, 'rb') as fp:
+            body = fp.read()
+
+        # mock
+        self.handler.parser.signature_validator.validate = lambda a, b: True
+
+        self.handler.handle(body, 'signature')
+
+        self.assertEqual(len(self.calls), 12)
+        self.assertEqual(self.calls[0], '1 message_text')
+
+    def test_handler_malformed_body(self):
+        # mock
+        self.handler.parser.signature_validator.validate = lambda a, b: True
+
+        # no handler runs before the whole body is parsed
+        with self.assertRaises(ValueError):
+            self.handler.handle(
+                '{"events": [{"type": "follow", "timestamp": 1, "replyToken": "r"}, {"type"',
+                'signature')
+        with self.assertRaises(KeyError):
+            self.handler.handle('{}', 'signature')
+
+        self.assertEqual(self.calls, [])
+
+    def test_handler_subclass(self):
+        class CustomTextMessage(TextMessage):
+            pass
+
+        class CustomFollowEvent(FollowEvent):
+            pass
+
+        self.handler._handle_event(MessageEvent(message=CustomTextMessage(text='hoge')))
+        self.handler._handle_event(CustomFollowEvent())
+
+        self.assertEqual(self.calls, ['1 message_text', '4 follow'])
+
+    def test_add_handler_after_dispatch(self):
+        self.handler._handle_event(LeaveEvent())
+
+        @self.handler.add(LeaveEvent)
+        def leave():
+            self.calls.append('leave')
+
+        self.handler._handle_event(LeaveEvent())
+
+        self.assertEqual(self.calls, ['default leave', 'leave'])
+
+
+class TestWebhookHandlerConcurrent(unittest.TestCase):
+    def setUp(self):
+        self.handler = WebhookHandler('channel_secret', max_workers=4, handler_timeout=1)
+        self.calls = []
+        self.events = []
+
+        # mock
+        self.handler.parser.parse = lambda body, signature: self.events
+
+    def tearDown(self):
+        self.handler.close()
+
+    def add_events(self, *texts_by_user):
+        for user_id, text in texts_by_user:
+            self.events.append(MessageEvent(
+                source=SourceUser(user_id=user_id), message=TextMessage(text=text)))
+
+    def test_order_per_sender(self):
+        self.add_events(('U1', '0.05'), ('U1', '0'), ('U2', '0'), ('U2', '0.05'), ('U2', '0'))
+
+        @self.handler.add(MessageEvent, message=TextMessage)
+        def message_text(event):
+            time.sleep(float(event.message.text))
+            self.calls.append(event.source.user_id)
+
+        self.handler.handle('body', 'signature')
+
+        self.assertEqual([c for c in self.calls if c == 'U1'], ['U1', 'U1'])
+        self.assertEqual(len(self.calls), 5)
+
+    def test_concurrent_senders(self):
+        self.add_events(('U1', 'hoge'), ('U2', 'hoge'))
+        started = {'U1': threading.Event(), 'U2': threading.Event()}
+
+        @self.handler.add(MessageEvent)
+        def message(event):
+            # each handler waits for the other one, so they must run at the same time
+            user_id = event.source.user_id
+            started[user_id].set()
+            if not started['U2' if user_id == 'U1' else 'U1'].wait(1):
+                raise AssertionError('handlers did not run concurrently')
+
+        self.handler.handle('body', 'signature')
+
+    def test_errors(self):
+        self.add_events(('U1', 'fail'), ('U1', 'ok'), ('U2', 'fail'), ('U3', 'ok'))
+
+        @self.handler.add(MessageEvent)
+        def message(event):
+            if event.message.text == 'fail':
+                raise ValueError(event.source.user_id)
+            self.calls.append(event.source.user_id)
+
+        with self.assertRaises(WebhookHandlerError) as cm:
+            self.handler.handle('body', 'signature')
+
+        self.assertEqual(sorted(self.calls), ['U1', 'U3'])
+        self.assertEqual(
+            [(event, str(e)) for event, e in cm.exception.errors],
+            [(self.events[0], 'U1'), (self.events[2], 'U2')])
+
+    def test_handler_timeout(self):
+        self.handler.handler_timeout = 0.05
+        self.add_events(('U1', 'slow'), ('U1', 'ok'), ('U2', 'ok'))
+        release = threading.Event()
+
+        @self.handler.add(MessageEvent)
+        def message(event):
+            if event.message.text == 'slow':
+                release.wait(1)
+            self.calls.append(event.source.user_id)
+
+        try:
+            with self.assertRaises(WebhookHandlerError) as cm:
+                self.handler.handle('body', 'signature')
+        finally:
+            release.set()
+
+        self.assertEqual([event for event, _ in cm.exception.errors], self.events[:2])
+        for _, e in cm.exception.errors:
+            self.assertIsInstance(e, TimeoutError)
+        self.assertIn('U2', self.calls)
+        # the slow handler finishes, but the next event of U1 is not handled
+        self.handler.close()
+        self.assertEqual(self.calls.count('U1'), 1)
+
+
+class TestWebhookHandlerBackground(unittest.TestCase):
+    def setUp(self):
+        self.handler = WebhookHandler('channel_secret')
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+        @self.handler.default()
+        def default(event):
+            reply_token = getattr(event, 'reply_token', None)
+            if reply_token == 'blocker':
+                self.started.set()
+                self.release.wait(1)
+            else:
+                self.calls.append((reply_token, event.reply_token_expired))
+
+        self.handler.start(workers=1)
+
+    def tearDown(self):
+        self.handler.close()
+
+    def enqueue(self, *events):
+        self.handler.parser.parse = lambda body, signature: list(events)
+        self.handler.enqueue('body', 'signature')
+
+    def test_priority(self):
+        now = int(time.time() * 1000)
+        self.enqueue(FollowEvent(timestamp=now, reply_token='blocker'))
+        self.assertTrue(self.started.wait(1))
+
+        self.enqueue(
+            FollowEvent(timestamp=now - 20000, reply_token='deadline in 10s'),
+            FollowEvent(timestamp=now - 25000, reply_token='deadline in 5s'),
+            UnfollowEvent(timestamp=now - 29000),
+            FollowEvent(timestamp=now - 40000, reply_token='expired'),
+        )
+        self.release.set()
+        self.handler.stop()
+
+        self.assertEqual(self.calls, [
+            ('deadline in 5s', False),
+            ('deadline in 10s', False),
+            ('expired', True),
+            (None, False),
+        ])
+
+    def test_expire_in_queue(self):
+        self.handler.reply_token_ttl = 0.1
+        now = int(time.time() * 1000)
+        self.enqueue(FollowEvent(timestamp=now, reply_token='blocker'),
+                     FollowEvent(timestamp=now, reply_token='reply_token'))
+        self.assertTrue(self.started.wait(1))
+        time.sleep(0.2)
+        self.release.set()
+        self.handler.stop()
+
+        self.assertEqual(self.calls, [('reply_token', True)])
+
+    def test_expired_flag_is_not_serialized(self):
+        event = FollowEvent(timestamp=1462629479859, reply_token='reply_token')
+        event._reply_token_expired = True
+
+        self.assertTrue(event.reply_token_expired)
+        self.assertEqual(
+            event.as_json_dict(),
+            FollowEvent(timestamp=1462629479859, reply_token='reply_token').as_json_dict())
+
 
 if __name__ == '__main__':
     unittest.main()